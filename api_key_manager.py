@@ -1,3 +1,4 @@
+import atexit
 import json
 import logging
 import os
@@ -5,17 +6,35 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, Optional, List, Set
 
+from file_utils import FileLock, atomic_write_json
+
 class APIKeyManager:
-    """Manages multiple API keys with usage tracking and rotation"""
+    """Manages multiple API keys with usage tracking and rotation
+    
+    Each request is appended as one line to a usage journal, which is cheap and
+    survives a crash. The journal is folded into the api_usage.json snapshot
+    (written atomically) every `compact_every` requests and on exit. All file access
+    goes through a lock file, so several processes sharing the keys merge their
+    counts instead of overwriting each other's.
+    """
     
     def __init__(self, api_keys: List[str], data_dir: Path, 
-                daily_limit: int = 1500, warning_threshold: float = 0.95):
+                daily_limit: int = 1500, warning_threshold: float = 0.95,
+                compact_every: int = 50):
         self.api_keys = api_keys
         self.current_key_index = 0
         self.daily_limit = daily_limit
         self.warning_threshold = warning_threshold  # Percentage threshold for warning (e.g., 95%)
         self.data_dir = data_dir
         self.usage_file = data_dir / 'tracking' / 'api_usage.json'
+        self.journal_file = data_dir / 'tracking' / 'api_usage.log'
+        self.lock = FileLock(data_dir / 'tracking' / 'api_usage.lock')
+        self.compact_every = max(1, compact_every)
+        
+        # Position in the journal up to which other processes' increments are merged
+        self._journal_offset = 0
+        self._journal_entries = 0
+        self._snapshot_signature = None
         
         # Initialize logger
         self.logger = logging.getLogger(__name__)
@@ -26,52 +45,142 @@ class APIKeyManager:
         # Load or initialize usage data
         self.usage_data = self._load_usage_data()
         
+        # Fold outstanding journal entries into the snapshot on shutdown
+        atexit.register(self.flush)
+        
         # Find the first available key that hasn't reached its limit
         self._find_available_key()
     
+    def _new_usage_data(self) -> Dict:
+        """Create empty usage data for today"""
+        return {
+            'date': datetime.now().strftime("%Y-%m-%d"),
+            'keys': {key: 0 for key in self.api_keys}
+        }
+    
     def _load_usage_data(self) -> Dict:
-        """Load API usage data from file or initialize if not exists"""
+        """Load API usage data from the snapshot plus journal, or initialize if not exists"""
+        try:
+            with self.lock:
+                usage_data = self._read_usage_from_disk()
+                
+                # Persist a new-day reset or newly added keys right away
+                self._compact(usage_data)
+                return usage_data
+        except Exception as e:
+            self.logger.error(f"Error loading API usage data: {e}")
+        
+        return self._new_usage_data()
+    
+    def _read_usage_from_disk(self) -> Dict:
+        """Read the snapshot and replay the whole journal on top of it (caller holds the lock)"""
+        usage_data = None
         if self.usage_file.exists():
             try:
                 with open(self.usage_file, 'r') as f:
                     usage_data = json.load(f)
-                
-                # Check if today's date matches, otherwise reset counts
-                today = datetime.now().strftime("%Y-%m-%d")
-                if usage_data.get('date') != today:
-                    self.logger.info(f"New day detected ({today}). Resetting API usage counts.")
-                    usage_data = {
-                        'date': today,
-                        'keys': {key: 0 for key in self.api_keys}
-                    }
-                    
-                # Check for any new keys not in the usage data
-                for key in self.api_keys:
-                    if key not in usage_data['keys']:
-                        usage_data['keys'][key] = 0
-                        
-                # Save the updated usage data
-                self._save_usage_data(usage_data)
-                return usage_data
             except Exception as e:
-                self.logger.error(f"Error loading API usage data: {e}")
+                self.logger.error(f"Error reading API usage snapshot: {e}")
         
-        # Initialize new usage data
+        # Check if today's date matches, otherwise reset counts
         today = datetime.now().strftime("%Y-%m-%d")
-        usage_data = {
-            'date': today,
-            'keys': {key: 0 for key in self.api_keys}
-        }
-        self._save_usage_data(usage_data)
+        if not usage_data or usage_data.get('date') != today:
+            if usage_data:
+                self.logger.info(f"New day detected ({today}). Resetting API usage counts.")
+            usage_data = self._new_usage_data()
+        
+        # Check for any new keys not in the usage data
+        for key in self.api_keys:
+            if key not in usage_data['keys']:
+                usage_data['keys'][key] = 0
+        
+        self._snapshot_signature = self._file_signature(self.usage_file)
+        self._journal_offset = 0
+        self._journal_entries = 0
+        self._apply_journal(usage_data)
         return usage_data
     
-    def _save_usage_data(self, usage_data: Dict) -> None:
+    def _file_signature(self, path: Path):
+        """Identify a version of a file cheaply, so snapshot rewrites by other processes are noticed"""
+        try:
+            stat = path.stat()
+            return (stat.st_mtime_ns, stat.st_size)
+        except FileNotFoundError:
+            return None
+    
+    def _apply_journal(self, usage_data: Dict) -> None:
+        """Add journal entries written since our last read to the in-memory counts (caller holds the lock)"""
+        try:
+            with open(self.journal_file, 'rb') as f:
+                f.seek(self._journal_offset)
+                data = f.read()
+        except FileNotFoundError:
+            return
+        
+        # Ignore a trailing partial line left by a crash mid-write
+        end = data.rfind(b'\n') + 1
+        for line in data[:end].splitlines():
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                continue
+            
+            self._journal_entries += 1
+            if entry.get('date') == usage_data['date']:
+                key = entry.get('key')
+                usage_data['keys'][key] = usage_data['keys'].get(key, 0) + 1
+        
+        self._journal_offset += end
+    
+    def _sync_usage_data(self) -> None:
+        """Merge increments made by other processes since the last sync (caller holds the lock)"""
+        if (self._file_signature(self.usage_file) != self._snapshot_signature
+                or self.usage_data['date'] != datetime.now().strftime("%Y-%m-%d")):
+            # Another process compacted the journal (or the day rolled over): start from the snapshot
+            self.usage_data = self._read_usage_from_disk()
+        else:
+            self._apply_journal(self.usage_data)
+    
+    def _append_usage(self, key: str) -> None:
+        """Durably record one request in the journal (caller holds the lock)"""
+        line = (json.dumps({'date': self.usage_data['date'], 'key': key}) + '\n').encode('utf-8')
+        with open(self.journal_file, 'ab') as f:
+            f.write(line)
+            f.flush()
+            os.fsync(f.fileno())
+        
+        self._journal_offset += len(line)
+        self._journal_entries += 1
+    
+    def _compact(self, usage_data: Dict) -> None:
+        """Write the merged counts as the new snapshot and empty the journal (caller holds the lock)"""
+        if not self._save_usage_data(usage_data):
+            # Keep the journal so no counts are lost; compaction is retried later
+            return
+        with open(self.journal_file, 'wb'):
+            pass
+        self._journal_offset = 0
+        self._journal_entries = 0
+        self._snapshot_signature = self._file_signature(self.usage_file)
+    
+    def _save_usage_data(self, usage_data: Dict) -> bool:
         """Save API usage data to file"""
         try:
-            with open(self.usage_file, 'w') as f:
-                json.dump(usage_data, f, indent=2)
+            atomic_write_json(self.usage_file, usage_data, indent=2)
+            return True
         except Exception as e:
             self.logger.error(f"Error saving API usage data: {e}")
+            return False
+    
+    def flush(self) -> None:
+        """Fold the journal into the snapshot file"""
+        try:
+            with self.lock:
+                self._sync_usage_data()
+                if self._journal_entries:
+                    self._compact(self.usage_data)
+        except Exception as e:
+            self.logger.error(f"Error flushing API usage data: {e}")
     
     def _find_available_key(self) -> bool:
         """Find the next API key that hasn't reached its limit"""
@@ -96,14 +205,47 @@ class APIKeyManager:
         """Get the current API key"""
         return self.api_keys[self.current_key_index]
     
-    def increment_usage(self) -> bool:
-        """Increment usage counter for the current key and rotate if needed
+    def rotate_key(self) -> bool:
+        """Switch to the next key that hasn't reached its limit
         
         Returns:
             bool: True if a key is available, False if all keys are at limit
         """
-        current_key = self.get_current_key()
-        self.usage_data['keys'][current_key] += 1
+        if len(self.api_keys) < 2:
+            return False
+            
+        original_index = self.current_key_index
+        self.current_key_index = (self.current_key_index + 1) % len(self.api_keys)
+        available = self._find_available_key()
+        
+        if available and self.current_key_index != original_index:
+            self.logger.info("Switched to another API key")
+            return True
+        return False
+    
+    def increment_usage(self) -> Optional[str]:
+        """Increment usage counter for the current key and rotate if needed
+        
+        Returns:
+            str: The key the request was counted against; it differs from the key
+                current before the call when another process used that one up.
+                None if all keys are at limit.
+        """
+        with self.lock:
+            # Pick up requests made by other processes before deciding
+            self._sync_usage_data()
+
+            # Another process may have used up the current key in the meantime
+            if self.usage_data['keys'].get(self.get_current_key(), 0) >= self.daily_limit:
+                if not self._find_available_key():
+                    return None
+
+            current_key = self.get_current_key()
+            self.usage_data['keys'][current_key] = self.usage_data['keys'].get(current_key, 0) + 1
+            self._append_usage(current_key)
+            
+            if self._journal_entries >= self.compact_every:
+                self._compact(self.usage_data)
         
         # Check if we're approaching the limit
         current_usage = self.usage_data['keys'][current_key]
@@ -117,14 +259,9 @@ class APIKeyManager:
             available = self._find_available_key()
             if available:
                 self.logger.info(f"Switched to another API key")
-            
-            # Save updated usage data
-            self._save_usage_data(self.usage_data)
-            return available
+            return current_key if available else None
         
-        # Save updated usage data
-        self._save_usage_data(self.usage_data)
-        return True
+        return current_key
     
     def get_usage_stats(self) -> Dict:
         """Get current usage statistics for all keys"""
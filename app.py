@@ -1,4 +1,4 @@
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request, stream_with_context
 from flask_cors import CORS
 import os
 import json
@@ -7,9 +7,14 @@ import threading
 import time
 from pathlib import Path
 import sys
+import queue
 
 # Import bot class
 from dice_bot import DiceBot
+from application_projection import ApplicationsProjection
+from config import TRACKER_BACKEND
+from event_bus import event_bus
+from file_utils import atomic_write_json
 
 app = Flask(__name__)
 CORS(app)
@@ -21,6 +26,16 @@ DATA_DIR = BASE_DIR / 'data'
 TRACKING_FILE = DATA_DIR / 'applications_tracking.json'
 STATUS_FILE = DATA_DIR / 'bot_status.json'
 
+# Applications recorded by the bot's tracker, served in the tracking file's shape
+applications_projection = ApplicationsProjection(DATA_DIR / 'tracking', TRACKER_BACKEND)
+
+# Log tailing: block size for reading backwards, and how far behind a `since` cursor may be
+LOG_TAIL_BLOCK_SIZE = 8192
+LOG_SINCE_MAX_BYTES = 1024 * 1024
+
+# Event stream: how often an idle stream checks the files for changes made by other processes
+STREAM_POLL_SECONDS = 2
+
 # Ensure directories exist
 LOGS_DIR.mkdir(exist_ok=True)
 DATA_DIR.mkdir(exist_ok=True)
@@ -43,8 +58,7 @@ if not STATUS_FILE.exists():
         'uptime_start': None,
         'errors': []
     }
-    with open(STATUS_FILE, 'w') as f:
-        json.dump(initial_status, f, indent=2)
+    atomic_write_json(STATUS_FILE, initial_status, indent=2)
 
 
 def read_status():
@@ -64,8 +78,8 @@ def update_status(updates):
         status = read_status()
         status.update(updates)
         status['last_updated'] = datetime.now().isoformat()
-        with open(STATUS_FILE, 'w') as f:
-            json.dump(status, f, indent=2)
+        atomic_write_json(STATUS_FILE, status, indent=2)
+        event_bus.publish('status', status)
         return True
     except Exception as e:
         print(f"Error updating status: {e}")
@@ -73,27 +87,73 @@ def update_status(updates):
 
 
 def read_tracking_data():
-    """Read applications tracking data"""
+    """Read applications tracking data
+    
+    The bot records applications once, in its tracker; they are projected from
+    there. Entries in the tracking file come from other StatusManager users.
+    """
     try:
+        tracking_data = {}
         if TRACKING_FILE.exists():
             with open(TRACKING_FILE, 'r') as f:
-                return json.load(f)
-        return {}
+                tracking_data = json.load(f)
+        tracking_data.update(applications_projection.get_applications())
+        return tracking_data
     except Exception as e:
         return {'error': str(e)}
 
 
-def get_recent_logs(log_file='bot.log', lines=100):
-    """Read recent log entries"""
+def _decode_log_lines(data):
+    """Split raw log bytes into text lines, keeping line endings"""
+    return [line.decode('utf-8', errors='replace') for line in data.splitlines(keepends=True)]
+
+
+def _tail_log(f, size, lines):
+    """Read the last complete lines before `size` by seeking backwards in blocks"""
+    data = b''
+    pos = size
+    while pos > 0 and data.count(b'\n') <= lines:
+        read_size = min(LOG_TAIL_BLOCK_SIZE, pos)
+        pos -= read_size
+        f.seek(pos)
+        data = f.read(read_size) + data
+    
+    # Leave out a last line that is still being written
+    end = data.rfind(b'\n') + 1
+    offset = size - (len(data) - end)
+    entries = _decode_log_lines(data[:end])
+    
+    # The first line may have been cut by the block boundary
+    if pos > 0:
+        entries = entries[1:]
+    return entries[-lines:], offset
+
+
+def get_recent_logs(log_file='bot.log', lines=100, since=None):
+    """Read recent log entries without loading the whole file
+    
+    Returns (logs, offset, reset). `offset` is the byte position after the last complete
+    line; passing it back as `since` returns only lines written after it. `reset` is True
+    when `since` no longer fits the file (cleared, or too far behind) and the tail was
+    returned instead.
+    """
+    lines = max(1, lines)
     try:
         log_path = LOGS_DIR / log_file
-        if log_path.exists():
-            with open(log_path, 'r') as f:
-                all_lines = f.readlines()
-                return all_lines[-lines:]
-        return []
+        if not log_path.exists():
+            return [], 0, bool(since)
+        with open(log_path, 'rb') as f:
+            size = f.seek(0, os.SEEK_END)
+            if since is not None and 0 <= since <= size and size - since <= LOG_SINCE_MAX_BYTES:
+                f.seek(since)
+                data = f.read(size - since)
+                end = data.rfind(b'\n') + 1
+                return _decode_log_lines(data[:end])[-lines:], since + end, False
+            
+            logs, offset = _tail_log(f, size, lines)
+            return logs, offset, since is not None
     except Exception as e:
-        return [f"Error reading logs: {str(e)}"]
+        return [f"Error reading logs: {str(e)}"], since or 0, False
 
 
 def get_log_files():
@@ -193,9 +253,8 @@ def applications_page():
     return render_template('applications.html')
 
 
-@app.route('/api/status')
-def api_status():
-    """API endpoint for bot status"""
+def build_status_payload():
+    """Build the status, statistics and uptime shown on the dashboard"""
     status = read_status()
     stats = calculate_statistics()
     
@@ -214,11 +273,104 @@ def api_status():
     # Add actual bot running state
     status['is_running'] = bot_running
     
-    return jsonify({
+    return {
         'status': status,
         'statistics': stats,
         'uptime': uptime
-    })
+    }
+
+
+def _file_signature(path):
+    """Cheap change marker for a file: (mtime, size), or None if missing"""
+    try:
+        stat = path.stat()
+        return (stat.st_mtime_ns, stat.st_size)
+    except OSError:
+        return None
+
+
+def _status_signature():
+    """Change marker for everything the status payload is built from"""
+    return (
+        _file_signature(STATUS_FILE),
+        _file_signature(TRACKING_FILE),
+        _file_signature(applications_projection.source_file)
+    )
+
+
+def _sse_message(event_type, data):
+    """Format one Server-Sent Events message"""
+    return f"event: {event_type}\ndata: {json.dumps(data)}\n\n"
+
+
+@app.route('/api/status')
+def api_status():
+    """API endpoint for bot status"""
+    return jsonify(build_status_payload())
+
+
+@app.route('/api/stream')
+def api_stream():
+    """Server-Sent Events stream of status changes, new log lines and new applications
+    
+    Events come from the in-process event bus. Status is only recomputed when it
+    changed, and while the stream is idle the status and log files are checked
+    so changes made by a bot in another process are pushed too.
+    """
+    log_file = request.args.get('file', 'bot.log')
+    lines = int(request.args.get('lines', 10))
+    
+    def generate():
+        events = event_bus.subscribe()
+        try:
+            status_signature = _status_signature()
+            logs, log_offset, _ = get_recent_logs(log_file, lines)
+            
+            yield _sse_message('status', build_status_payload())
+            yield _sse_message('logs', {'logs': logs, 'file': log_file, 'offset': log_offset, 'reset': True})
+            
+            while True:
+                try:
+                    pending = [events.get(timeout=STREAM_POLL_SECONDS)]
+                except queue.Empty:
+                    pending = []
+                
+                # Coalesce bursts so status and logs are sent at most once per batch
+                while True:
+                    try:
+                        pending.append(events.get_nowait())
+                    except queue.Empty:
+                        break
+                
+                sent = False
+                for event_type, data in pending:
+                    if event_type == 'application':
+                        yield _sse_message('application', data)
+                        sent = True
+                
+                signature = _status_signature()
+                if signature != status_signature or any(event_type == 'status' for event_type, _ in pending):
+                    status_signature = signature
+                    yield _sse_message('status', build_status_payload())
+                    sent = True
+                
+                # Log lines are read from the file, so the stream and /api/logs share one cursor
+                logs, log_offset, reset = get_recent_logs(log_file, lines, log_offset)
+                if logs or reset:
+                    yield _sse_message('logs', {'logs': logs, 'file': log_file, 'offset': log_offset, 'reset': reset})
+                    sent = True
+                
+                if not sent:
+                    # Comment line keeps proxies from closing an idle connection
+                    yield ": keepalive\n\n"
+        finally:
+            event_bus.unsubscribe(events)
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
 
 
 @app.route('/api/logs')
@@ -226,13 +378,16 @@ def api_logs():
     """API endpoint for logs"""
     log_file = request.args.get('file', 'bot.log')
     lines = int(request.args.get('lines', 100))
+    since = request.args.get('since', type=int)
     
-    logs = get_recent_logs(log_file, lines)
+    logs, offset, reset = get_recent_logs(log_file, lines, since)
     
     return jsonify({
         'logs': logs,
         'file': log_file,
-        'total_lines': len(logs)
+        'total_lines': len(logs),
+        'offset': offset,
+        'reset': reset
     })
 
 
@@ -0,0 +1,76 @@
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+
+class PreparedApplication:
+    """A discovered job with its generated resume and cover letter (or the error that stopped them)"""
+
+    def __init__(self, job_details: Dict, resume_path: Optional[str] = None,
+                 cover_letter_path=None, error: Optional[str] = None):
+        self.job_details = job_details
+        self.resume_path = resume_path
+        self.cover_letter_path = cover_letter_path
+        self.error = error
+
+
+class ApplicationPipeline:
+    """Generates application artifacts on a worker pool while the browser keeps working
+
+    Discovery puts jobs in with put(); `prepare` (job_details -> (resume_path,
+    cover_letter_path)) runs on `workers` threads; the browser thread takes finished
+    applications with get_ready(). At most `queue_size` jobs are in flight, so
+    discovery can't run arbitrarily far ahead of submission.
+    """
+
+    def __init__(self, prepare: Callable, workers: int = 2, queue_size: int = 5):
+        self.prepare = prepare
+        self.queue_size = max(1, queue_size)
+        self.executor = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix='artifacts')
+        self.ready: queue.Queue = queue.Queue()
+        self._in_flight = 0
+        self._lock = threading.Lock()
+        self.logger = logging.getLogger(__name__)
+
+    @property
+    def in_flight(self) -> int:
+        """Jobs queued, being prepared or prepared but not yet taken"""
+        with self._lock:
+            return self._in_flight
+
+    def has_capacity(self) -> bool:
+        """Check if another job can be queued"""
+        return self.in_flight < self.queue_size
+
+    def put(self, job_details: Dict) -> None:
+        """Queue a job for resume and cover letter generation"""
+        with self._lock:
+            self._in_flight += 1
+        self.executor.submit(self._prepare, job_details)
+
+    def _prepare(self, job_details: Dict) -> None:
+        try:
+            resume_path, cover_letter_path = self.prepare(job_details)
+            error = None if resume_path else "Failed to generate resume"
+            prepared = PreparedApplication(job_details, resume_path, cover_letter_path, error)
+        except Exception as e:
+            self.logger.error(f"Error preparing application for {job_details.get('title')}: {str(e)}")
+            prepared = PreparedApplication(job_details, error=str(e))
+        self.ready.put(prepared)
+
+    def get_ready(self, block: bool = False, timeout: Optional[float] = None) -> Optional[PreparedApplication]:
+        """Take the next prepared application, or None if none is ready (in time)"""
+        try:
+            prepared = self.ready.get(block=block, timeout=timeout)
+        except queue.Empty:
+            return None
+
+        with self._lock:
+            self._in_flight -= 1
+        return prepared
+
+    def shutdown(self) -> None:
+        """Stop the workers, letting running generations finish"""
+        self.executor.shutdown(wait=True)
@@ -0,0 +1,97 @@
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Dict
+
+from search_capture import JOB_DETAIL_URL
+from tracker_storage import read_application_rows
+
+
+def dashboard_entry(row: Dict) -> Dict[str, Any]:
+    """Turn one tracker row into the applications_tracking.json entry shape"""
+    job_id = row.get('job_id') or ''
+    # The tracker stores "YYYY-MM-DD HH:MM:SS"; the dashboard sorts on ISO strings
+    applied_date = (row.get('applied_date') or '').replace(' ', 'T', 1)
+    entry = {
+        'company': row.get('company', ''),
+        'position': row.get('title', ''),
+        'status': row.get('status', ''),
+        'job_url': JOB_DETAIL_URL.format(job_id) if job_id else 'N/A',
+        'location': row.get('location', ''),
+        'applied_date': applied_date,
+        'timestamp': applied_date
+    }
+    if row.get('notes'):
+        entry['error' if row.get('status') == 'failed' else 'notes'] = row['notes']
+    return entry
+
+
+class ApplicationsProjection:
+    """The dashboard's view of applications, projected from the tracker's store
+
+    The tracker records each application outcome once; this folds those rows into
+    the {job_id: entry} shape of applications_tracking.json. With the CSV backend
+    each call reads only the rows appended since the previous one, so it is cheap
+    to call on every dashboard request. It never writes, so it can run in the
+    dashboard process while a bot appends.
+    """
+
+    def __init__(self, tracking_dir: Path, backend: str = 'csv'):
+        self.tracking_dir = Path(tracking_dir)
+        self.backend = backend
+        self.applications: Dict[str, Dict[str, Any]] = {}
+        self._cursor = None
+        self._db_signature = None
+        self._lock = threading.Lock()
+
+    @property
+    def source_file(self) -> Path:
+        """The file the projection is read from"""
+        if self.backend == 'sqlite':
+            return self.tracking_dir / 'applications.db'
+        return self.tracking_dir / 'applications.csv'
+
+    def _refresh_csv(self) -> None:
+        rows, self._cursor, reset = read_application_rows(self.source_file, self._cursor)
+        if reset:
+            self.applications = {}
+        for row in rows:
+            if row.get('job_id'):
+                self.applications[row['job_id']] = dashboard_entry(row)
+
+    def _refresh_sqlite(self) -> None:
+        # Rows are updated in place, so re-read them whenever the database changed
+        signature = tuple(
+            (path.stat().st_mtime_ns, path.stat().st_size) if path.exists() else None
+            for path in (self.source_file, self.source_file.with_name(self.source_file.name + '-wal'))
+        )
+        if signature == self._db_signature:
+            return
+        self._db_signature = signature
+        if signature[0] is None:
+            self.applications = {}
+            return
+
+        # Read-only, so the dashboard never creates the schema or changes the journal mode
+        conn = sqlite3.connect(f"file:{self.source_file.as_posix()}?mode=ro", uri=True)
+        conn.row_factory = sqlite3.Row
+        try:
+            rows = conn.execute("SELECT * FROM applications ORDER BY applied_date, rowid").fetchall()
+        finally:
+            conn.close()
+        self.applications = {
+            row['job_id']: dashboard_entry({key: row[key] if row[key] is not None else '' for key in row.keys()})
+            for row in rows if row['job_id']
+        }
+
+    def get_applications(self) -> Dict[str, Dict[str, Any]]:
+        """Every tracked application by job ID, caught up with the store"""
+        with self._lock:
+            try:
+                if self.backend == 'sqlite':
+                    self._refresh_sqlite()
+                else:
+                    self._refresh_csv()
+            except Exception as e:
+                print(f"Error reading tracked applications: {str(e)}")
+            return {job_id: dict(entry) for job_id, entry in self.applications.items()}
@@ -0,0 +1,268 @@
+import asyncio
+import weakref
+from typing import Dict, List, Optional
+
+import google.generativeai as genai
+import google.ai.generativelanguage as glm
+
+from gemini_service import GeminiService
+from response_cache import ResponseCache, CachedResponse
+
+
+class AsyncGeminiService(GeminiService):
+    """asyncio variant of GeminiService with one client per API key.
+
+    The base service configures the library-wide client with genai.configure,
+    which every model then shares, so rotating keys from one thread changes the
+    key used by all others. Here each key gets its own GenerativeModel with its
+    own sync and async clients, built once and reused for every call, so calls
+    for different keys and applications can be fanned out with asyncio.gather.
+    Prompts, response processing, the response cache, the rate limiter and key
+    rotation are shared with GeminiService.
+    """
+
+    def __init__(self):
+        # Models are created lazily per key; setup_gemini (called by the base
+        # constructor) reads from this cache instead of calling genai.configure
+        self._models = {}
+        # Keyed on the loop object so a new loop never gets a dead loop's client or semaphore
+        self._async_clients = weakref.WeakKeyDictionary()
+        self._async_slots = weakref.WeakKeyDictionary()
+        super().__init__()
+
+    def setup_gemini(self, api_key=None):
+        """Point the service at the model for the given (by default the current) API key without touching global config"""
+        current_key = api_key or self.api_key_manager.get_current_key()
+        self.model = self._get_model(current_key)
+        self.model_key = current_key
+        self.logger.info("Using dedicated Gemini client for current API key")
+
+    def _get_model(self, api_key: str):
+        """Get (or build) the GenerativeModel bound to a specific API key"""
+        model = self._models.get(api_key)
+        if model is None:
+            model = genai.GenerativeModel(self.model_name)
+            model._client = glm.GenerativeServiceClient(client_options={'api_key': api_key})
+            self._models[api_key] = model
+        return model
+
+    def _get_async_model(self, api_key: str):
+        """Get the key's model with an async client bound to the running event loop"""
+        model = self._get_model(api_key)
+        loop = asyncio.get_running_loop()
+
+        # gRPC asyncio channels belong to the loop that created them
+        clients = self._async_clients.setdefault(loop, {})
+        client = clients.get(api_key)
+        if client is None:
+            client = glm.GenerativeServiceAsyncClient(client_options={'api_key': api_key})
+            clients[api_key] = client
+        model._async_client = client
+        return model
+
+    def _get_async_slots(self) -> asyncio.Semaphore:
+        """Concurrency cap for in-flight async calls on the running loop"""
+        loop = asyncio.get_running_loop()
+        slots = self._async_slots.get(loop)
+        if slots is None:
+            slots = asyncio.Semaphore(self.max_concurrency)
+            self._async_slots[loop] = slots
+        return slots
+
+    # Key bookkeeping can wait on the key lock, a cross-process file lock and an fsync,
+    # so the async paths run these helpers with asyncio.to_thread
+
+    def _current_key(self) -> str:
+        with self._key_lock:
+            return self.api_key_manager.get_current_key()
+
+    def _charge_usage(self) -> Optional[str]:
+        with self._key_lock:
+            return self.api_key_manager.increment_usage()
+
+    def _rotate_from(self, api_key: str) -> bool:
+        """Rotate away from a key whose daily budget is spent; False if no key is left"""
+        with self._key_lock:
+            # Another thread may already have rotated away from this key
+            if self.api_key_manager.get_current_key() == api_key:
+                if not self.api_key_manager.rotate_key():
+                    return False
+                self.setup_gemini()
+            return True
+
+    def _handle_api_error_locked(self, error):
+        with self._key_lock:
+            return self._handle_api_error(error)
+
+    async def generate_content_async(self, prompt, api_key=None, **kwargs):
+        """Send a prompt with the given (by default the current) key's async client, without retries or caching"""
+        if api_key is None:
+            api_key = await asyncio.to_thread(self._current_key)
+        model = self._get_async_model(api_key)
+
+        async with self._get_async_slots():
+            return await model.generate_content_async(prompt, **kwargs)
+
+    async def _acquire_async(self, api_key: str) -> bool:
+        """Wait for a rate limiter token for the key; False once its daily budget is spent"""
+        while True:
+            acquired, wait_time = await asyncio.to_thread(self.rate_limiter.try_acquire, api_key)
+            if acquired:
+                return True
+            if wait_time < 0:
+                return False
+            await asyncio.sleep(min(max(wait_time, 0.05), 1.0))
+
+    async def _wait_for_rate_limit_async(self) -> Optional[str]:
+        """Async counterpart of _wait_for_rate_limit that yields to the loop while waiting"""
+        for _ in range(len(self.api_key_manager.api_keys)):
+            current_key = await asyncio.to_thread(self._current_key)
+
+            if await self._acquire_async(current_key):
+                return current_key
+
+            self.logger.warning("Current API key has used its daily request budget")
+            if not await asyncio.to_thread(self._rotate_from, current_key):
+                return None
+
+        return None
+
+    async def make_api_call_async(self, prompt, max_retries=2, use_cache=True, **kwargs):
+        """Async counterpart of make_api_call with the same caching, rate limiting and key rotation"""
+        cache_key = None
+        if use_cache and self.response_cache:
+            cache_key = ResponseCache.make_key(prompt, self.model_name, kwargs.get('generation_config'))
+            cached_text = await asyncio.to_thread(self.response_cache.get, cache_key)
+            if cached_text is not None:
+                self.logger.info("Using cached Gemini response")
+                return CachedResponse(cached_text)
+
+        retry_count = 0
+
+        while retry_count <= max_retries:
+            try:
+                limited_key = await self._wait_for_rate_limit_async()
+                if not limited_key:
+                    self.logger.error("All API keys have used their daily request budget")
+                    return None
+
+                charged_key = await asyncio.to_thread(self._charge_usage)
+                if not charged_key:
+                    self.logger.error("All API keys have reached their daily limit")
+                    return None
+
+                # Another process used up the key the limiter token was taken for
+                if charged_key != limited_key and not await self._acquire_async(charged_key):
+                    self.logger.error("All API keys have used their daily request budget")
+                    return None
+
+                # Send the request on the key it was counted against
+                response = await self.generate_content_async(prompt, api_key=charged_key, **kwargs)
+
+                if cache_key:
+                    await asyncio.to_thread(self._cache_response, cache_key, response)
+
+                return response
+
+            except Exception as e:
+                result = await asyncio.to_thread(self._handle_api_error_locked, e)
+
+                if result is True:
+                    retry_count += 1
+                    self.logger.info(f"Retrying with new API key (attempt {retry_count}/{max_retries})")
+                    await asyncio.sleep(1)
+                    continue
+                elif result is False:
+                    self.logger.error("All API keys exhausted, cannot proceed")
+                    return None
+                else:
+                    self.logger.error(f"API call failed: {str(e)}")
+                    return None
+
+        self.logger.error(f"Max retries ({max_retries}) reached for API call")
+        return None
+
+    async def optimize_resume_section_async(self, section_name: str, current_content, job_details: dict):
+        """Async counterpart of optimize_resume_section"""
+        try:
+            if section_name == 'professional_experience':
+                return await self._optimize_work_experience_async(current_content, job_details)
+
+            if section_name == 'professional_summary':
+                prompt = self._create_professional_summary_prompt(current_content, job_details)
+                process = self._process_professional_summary_response
+            elif section_name == 'core_competencies':
+                prompt = self._create_core_competencies_prompt(current_content, job_details)
+                process = self._process_core_competencies_response
+            else:
+                self.logger.warning(f"Unknown section: {section_name}, skipping optimization")
+                return current_content
+
+            response = await self.make_api_call_async(
+                prompt,
+                generation_config=genai.GenerationConfig(
+                    temperature=0.1,
+                    top_p=1,
+                    top_k=1,
+                    max_output_tokens=2048,
+                )
+            )
+
+            if not response or not hasattr(response, 'text') or not response.text.strip():
+                self.logger.warning(f"No response received for {section_name}")
+                return current_content
+
+            return process(response.text, current_content)
+
+        except Exception as e:
+            self.logger.error(f"Error optimizing {section_name}: {str(e)}")
+            return current_content
+
+    async def _optimize_work_experience_async(self, experiences: List[Dict], job_details: dict):
+        """Optimize the first 3 experience entries concurrently"""
+        async def optimize_job(i, job):
+            try:
+                self.logger.info(f"Optimizing job {i+1}: {job['company']}")
+                response = await self.make_api_call_async(
+                    self._create_work_experience_prompt(job, job_details),
+                    generation_config=genai.GenerationConfig(
+                        temperature=0.1,
+                        top_p=1,
+                        top_k=1,
+                        max_output_tokens=4000,
+                    )
+                )
+
+                if not response or not hasattr(response, 'text') or not response.text.strip():
+                    self.logger.warning(f"No response received for job {i+1}")
+                    return job
+
+                return self._process_work_experience_response(response.text, job)
+            except Exception as e:
+                self.logger.error(f"Error optimizing job {i+1}: {str(e)}")
+                return job
+
+        result = list(await asyncio.gather(*(optimize_job(i, job) for i, job in enumerate(experiences[:3]))))
+        result.extend(experiences[3:])
+        return result
+
+    async def optimize_resume_sections_async(self, sections: Dict, job_details: dict) -> Dict:
+        """Optimize every section of one resume concurrently"""
+        names = list(sections.keys())
+        results = await asyncio.gather(*(
+            self.optimize_resume_section_async(name, sections[name], job_details) for name in names
+        ))
+        return dict(zip(names, results))
+
+    async def optimize_many_async(self, jobs: List[Dict]) -> List[Dict]:
+        """Optimize resume sections for several applications at once.
+
+        Args:
+            jobs: List of dicts with 'sections' (section name -> content) and 'job_details'
+
+        Returns:
+            List of optimized section dicts, in the same order as jobs
+        """
+        return list(await asyncio.gather(*(
+            self.optimize_resume_sections_async(job['sections'], job['job_details']) for job in jobs
+        )))
@@ -6,7 +6,7 @@ import logging
 import hashlib
 from pathlib import Path
 from typing import Dict, Optional, Tuple, List, Set
-from urllib.parse import quote
+from urllib.parse import urlparse
 from datetime import datetime
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium import webdriver
@@ -22,28 +22,63 @@ from config import (
     CHROME_ARGUMENTS,
     CHROMEDRIVER_PATH,
     DELAYS, 
-    MAX_RETRIES, 
     JOB_TITLES,
     DICE_SEARCH_URL,
     JOBS_DIR,
     RESUME_DIR,
     DATA_DIR,
-    DEBUG_MODE
+    DEBUG_MODE,
+    CARD_STATUS_TIMEOUT,
+    CARD_STATUS_QUIET_MS,
+    PIPELINE_MODE,
+    PIPELINE_WORKERS,
+    PIPELINE_QUEUE_SIZE,
+    BROWSER_WORKERS,
+    REUSE_SESSION,
+    SESSION_FILE,
+    SESSION_MAX_AGE_HOURS,
+    LEAN_MODE,
+    LEAN_BLOCKED_URLS,
+    LEAN_BLOCKED_RESOURCE_TYPES,
+    NETWORK_CAPTURE_MODE,
+    SEARCH_RESPONSE_URL_PATTERNS,
+    SEARCH_PAGE_SIZE,
+    RESUME_TITLE_PAGES
 )
 from resume_handler import ResumeHandler
 from gemini_service import GeminiService
 from application_tracker import ApplicationTracker
+from application_pipeline import ApplicationPipeline, PreparedApplication
+from devtools import read_performance_log
+from dice_page import extract_card_records, search_page_url, wait_for_cards_ready
+from lean_browser import RequestBlocker
+from page_waits import PageWaiter, FILE_PICKER_SELECTORS
+from search_capture import SearchResponseCapture, fill_unknown_flags, has_unknown_flags
+from session_store import SessionStore
+from worker_pool import BrowserWorkerPool, SharedRunState
 
 class DiceBot:
     """Improved automated job application bot for Dice.com"""
     
-    def __init__(self):
-        self.setup_logging()
-        self.resume_handler = ResumeHandler()
-        self.gemini = GeminiService()
-        self.tracker = ApplicationTracker(DATA_DIR)
+    def __init__(self, tracker: Optional[ApplicationTracker] = None,
+                 shared: Optional[SharedRunState] = None, headless: Optional[bool] = None,
+                 gemini: Optional[GeminiService] = None, resume_handler: Optional[ResumeHandler] = None,
+                 worker_id: Optional[int] = None):
+        """Pool workers pass the coordinator's tracker and services, the run's SharedRunState
+        and their worker number"""
+        self.setup_logging(worker_id)
+        self.resume_handler = resume_handler or ResumeHandler()
+        self.gemini = gemini or GeminiService()
+        self.tracker = tracker or ApplicationTracker(DATA_DIR)
+        self.shared = shared
+        self.headless = headless
         self.driver = None
         self.wait = None
+        self.waits = None
+        self.pipeline = None
+        self.session_store = SessionStore(SESSION_FILE, max_age_hours=SESSION_MAX_AGE_HOURS) if REUSE_SESSION else None
+        self.request_blocker = RequestBlocker(LEAN_BLOCKED_URLS, LEAN_BLOCKED_RESOURCE_TYPES) if LEAN_MODE else None
+        self.search_capture = SearchResponseCapture(SEARCH_RESPONSE_URL_PATTERNS) if NETWORK_CAPTURE_MODE else None
         self.jobs_processed = 0
         self.jobs_applied = 0
         self.jobs_skipped = 0
@@ -54,8 +89,12 @@ class DiceBot:
         # Track processed job titles and pages
         self.processed_titles = {}  # Format: {title: last_page_processed}
         
-    def setup_logging(self):
-        """Configure logging"""
+    def setup_logging(self, worker_id: Optional[int] = None):
+        """Configure logging; pool workers log through a child of the bot's logger"""
+        if worker_id:
+            self.logger = logging.getLogger(f"{__name__}.w{worker_id}")
+            return
+        
         self.logger = logging.getLogger(__name__)
         self.logger.setLevel(logging.INFO)
         
@@ -84,13 +123,14 @@ class DiceBot:
         """Chrome WebDriver initialization with configurable headless mode"""
         try:
             from config import HEADLESS_MODE
+            headless = HEADLESS_MODE if self.headless is None else self.headless
             
-            mode_text = "headless" if HEADLESS_MODE else "visible"
+            mode_text = "headless" if headless else "visible"
             self.logger.info(f"Starting Chrome in {mode_text} mode...")
             
             options = Options()
             
-            if HEADLESS_MODE:
+            if headless:
                 options.add_argument('--headless')
                 options.add_argument('--window-size=1920,1080')
                 options.add_argument('--no-sandbox')
@@ -104,8 +144,22 @@ class DiceBot:
             options.add_experimental_option("excludeSwitches", ["enable-automation"])
             options.add_experimental_option('useAutomationExtension', False)
             
+            # Lean mode: eager page loads and no images, fonts, trackers or analytics
+            if self.request_blocker:
+                RequestBlocker.configure(options)
+            
+            # Network capture mode: search results are read from the page's API responses
+            if self.search_capture:
+                SearchResponseCapture.configure(options)
+            
             self.driver = webdriver.Chrome(options=options)
             self.wait = WebDriverWait(self.driver, 15)
+            self.waits = PageWaiter(self.driver, default_timeout=15)
+            
+            if self.request_blocker:
+                self.request_blocker.install(self.driver)
+            if self.search_capture:
+                self.search_capture.install(self.driver)
             
             # Hide the fact that this is automated (helps with detection)
             self.driver.execute_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
@@ -122,45 +176,73 @@ class DiceBot:
         try:
             from config import DICE_LOGIN
             
+            # Reuse the session saved by the last successful login if it still works
+            if self.restore_saved_session():
+                return True
+            
             self.logger.info("Starting Dice login process...")
             
             # Navigate to login page
             self.driver.get("https://www.dice.com/dashboard/login")
-            time.sleep(3)  # Allow page to load
             
             # Step 1: Enter email and click Continue
             self.logger.info("Entering email address...")
-            email_input = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='email']"))
-            )
+            email_input = self.waits.element_clickable((By.CSS_SELECTOR, "input[type='email']"))
+            if not email_input:
+                raise TimeoutException("Email field did not appear")
             email_input.clear()
             email_input.send_keys(DICE_LOGIN['email'])
             
             # Click Continue button
             continue_button = self.driver.find_element(By.CSS_SELECTOR, "button[data-testid='sign-in-button']")
             continue_button.click()
-            time.sleep(3)  # Wait for password form to appear
             
             # Step 2: Enter password and click Sign In
             self.logger.info("Entering password...")
-            password_input = self.wait.until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='password']"))
-            )
+            password_input = self.waits.element_clickable((By.CSS_SELECTOR, "input[type='password']"))
+            if not password_input:
+                raise TimeoutException("Password field did not appear")
             password_input.clear()
             password_input.send_keys(DICE_LOGIN['password'])
             
             # Click Sign In button
             signin_button = self.driver.find_element(By.CSS_SELECTOR, "button[data-testid='submit-password']")
             signin_button.click()
-            time.sleep(10)  # Wait for login to complete
+            
+            # Wait for the redirect away from the login form, then for the landing page to settle
+            post_login_urls = ["login-landing", "home-feed", "/dashboard"]
+            self.waits.url_matches(
+                lambda url: urlparse(url).path.rstrip('/') != '/dashboard/login'
+                and any(part in url for part in post_login_urls),
+                timeout=20
+            )
+            self.waits.network_idle()
             
             # Step 3: Verify successful login
-            return self.verify_login_success()
+            if not self.verify_login_success():
+                return False
+            
+            if self.session_store:
+                self.session_store.save(self.driver)
+            return True
             
         except Exception as e:
             self.logger.error(f"Login failed: {str(e)}")
             return False
 
+    def restore_saved_session(self) -> bool:
+        """Restore the last saved login and check it with one request instead of logging in again"""
+        if not self.session_store or not self.session_store.restore(self.driver):
+            return False
+        
+        if self.session_store.is_valid(self.driver):
+            self.logger.info("✓ Reused saved Dice session - skipping login")
+            return True
+        
+        self.logger.info("Saved Dice session is no longer valid - logging in again")
+        self.session_store.clear(self.driver)
+        return False
+
     def verify_login_success(self) -> bool:
         """Verify that login was successful using multiple verification methods"""
         try:
@@ -193,7 +275,7 @@ class DiceBot:
                     # Navigate to a jobs search page
                     test_url = "https://www.dice.com/jobs?q=Software+Engineer&countryCode=US&pageSize=20"
                     self.driver.get(test_url)
-                    time.sleep(3)  # Wait for page to load
+                    self.waits.document_ready()
                     
                     new_url = self.driver.current_url
                     self.logger.info(f"After navigation, current URL: {new_url}")
@@ -297,268 +379,39 @@ class DiceBot:
         min_delay, max_delay = DELAYS.get(delay_type, (2, 5))
         time.sleep(random.uniform(min_delay, max_delay))
 
-    def get_job_id_from_card(self, card) -> Optional[str]:
-        """Extract job ID from card with updated selectors for new UI"""
-        try:
-            # Method 1: Get the data-id attribute directly from the card (new UI)
-            job_id = card.get_attribute("data-id")
-            if job_id:
-                self.logger.debug(f"Found job ID from data-id: {job_id}")
-                return job_id
-                
-            # Method 2: Get the data-job-guid attribute (new UI)
-            job_guid = card.get_attribute("data-job-guid")
-            if job_guid:
-                self.logger.debug(f"Found job ID from data-job-guid: {job_guid}")
-                return job_guid
-                
-            # Method 3: Extract from the job link URL (new UI)
-            try:
-                job_link = card.find_element(By.CSS_SELECTOR, "a[data-testid='job-search-job-detail-link']")
-                job_url = job_link.get_attribute("href")
-                
-                if '/job-detail/' in job_url:
-                    job_id = job_url.split('/job-detail/')[1]
-                    self.logger.debug(f"Found job ID from URL: {job_id}")
-                    return job_id
-            except NoSuchElementException:
-                pass
-                
-            # Method 4: Old UI selectors (fallback)
-            try:
-                title_link = card.find_element(By.CSS_SELECTOR, "[data-cy='card-title-link'], a.job-title, h2 a, h3 a")
-                job_url = title_link.get_attribute('href')
-                if job_url and '/jobs/' in job_url:
-                    job_id = job_url.split('/jobs/')[1].split('/')[0]
-                    self.logger.debug(f"Found job ID from fallback URL: {job_id}")
-                    return job_id
-            except NoSuchElementException:
-                pass
-            
-            # Method 5: Create a hash from the card text as last resort
-            card_text = card.text
-            job_id = hashlib.md5(card_text.encode()).hexdigest()
-            self.logger.debug(f"Generated hash-based job ID: {job_id}")
-            return job_id
-            
-        except Exception as e:
-            self.logger.warning(f"Could not extract job ID from card: {str(e)}")
-            return None
-    
-    def check_easy_apply_available(self, card) -> bool:
-        """Check if Easy Apply is available with improved detection for new UI"""
-        max_retries = MAX_RETRIES.get('status_check', 3)
+    def check_easy_apply_available(self, record: Dict) -> bool:
+        """Check if Easy Apply is available for a card record from extract_card_records"""
+        if record.get('easy_apply'):
+            self.logger.info("Found Easy Apply on job card")
+            return True
         
-        for attempt in range(max_retries):
-            try:
-                self.logger.debug(f"Checking for Easy Apply (attempt {attempt+1}/{max_retries})")
-                
-                # Allow the page to fully update
-                self.random_delay('status_check')
-                time.sleep(2) 
-                
-                # Method 1: Check for Easy Apply text with lightning bolt SVG (new UI)
-                try:
-                    # Look for the lightning bolt SVG path that indicates Easy Apply
-                    lightning_svg_path = 'M315.27 33 96 304h128l-31.51 173.23a2.36 2.36 0 0 0 2.33 2.77h0a2.36 2.36 0 0 0 1.89-.95L416 208H288l31.66-173.25a2.45 2.45 0 0 0-2.44-2.75h0a2.42 2.42 0 0 0-1.95 1z'
-                    
-                    lightning_elements = card.find_elements(
-                        By.XPATH,
-                        f".//svg//path[@d='{lightning_svg_path}']"
-                    )
-                    
-                    for lightning in lightning_elements:
-                        # Check if this SVG is part of an Easy Apply button
-                        parent_element = lightning
-                        for _ in range(5):  # Check up to 5 levels up
-                            parent_element = parent_element.find_element(By.XPATH, "..")
-                            if parent_element.tag_name in ['a', 'button']:
-                                parent_text = parent_element.text.lower()
-                                if 'easy apply' in parent_text and parent_element.is_displayed():
-                                    self.logger.info("Found Easy Apply via lightning bolt SVG")
-                                    return True
-                                break
-                except Exception as e:
-                    self.logger.debug(f"Lightning SVG check failed: {e}")
-                
-                # Method 2: Look for "Easy Apply" text in buttons/links (new UI)
-                try:
-                    easy_apply_elements = card.find_elements(
-                        By.XPATH, 
-                        ".//a[contains(text(), 'Easy Apply')] | .//button[contains(text(), 'Easy Apply')] | .//span[contains(text(), 'Easy Apply')]"
-                    )
-                    
-                    for elem in easy_apply_elements:
-                        # Check if the element or its parent is clickable and visible
-                        clickable_parent = elem
-                        for _ in range(3):  # Check element and up to 2 levels up
-                            if clickable_parent.tag_name in ['a', 'button'] and clickable_parent.is_displayed():
-                                self.logger.info("Found Easy Apply text element")
-                                return True
-                            try:
-                                clickable_parent = clickable_parent.find_element(By.XPATH, "..")
-                            except:
-                                break
-                except Exception as e:
-                    self.logger.debug(f"Easy Apply text check failed: {e}")
-                
-                # Method 3: Look for Easy Apply indicator box (mobile/small screens)
-                try:
-                    easy_apply_box = card.find_elements(By.CSS_SELECTOR, 
-                        "div.box[aria-labelledby='easyApply-label'], p[id='easyApply-label']")
-                        
-                    for box in easy_apply_box:
-                        if box.is_displayed() and 'easy apply' in box.text.lower():
-                            self.logger.info("Found Easy Apply indicator box")
-                            return True
-                except Exception as e:
-                    self.logger.debug(f"Easy Apply box check failed: {e}")
-                    
-                # Method 4: Old UI selectors (fallback)
-                old_selectors = [
-                    "[data-cy='easyApplyBtn']",
-                    ".easy-apply-button",
-                    ".easy-apply",
-                    "button[class*='easyApply']",
-                    "button[class*='easy-apply']"
-                ]
-                
-                for selector in old_selectors:
-                    try:
-                        elements = card.find_elements(By.CSS_SELECTOR, selector)
-                        for element in elements:
-                            if element.is_displayed():
-                                self.logger.info(f"Found Easy Apply with fallback selector: {selector}")
-                                return True
-                    except:
-                        continue
-                
-                # If this is not the last attempt, wait before retry
-                if attempt < max_retries - 1:
-                    self.logger.debug(f"Easy Apply not found, waiting before retry {attempt+1}")
-                    time.sleep(2 * (attempt + 1))  # Progressive delay
-                
-            except Exception as e:
-                self.logger.warning(f"Error checking Easy Apply availability (attempt {attempt+1}): {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(2)  # Wait before retry
+        # A search API record that didn't say: the search already filters on Easy Apply
+        # and the job details page makes the final call
+        if record.get('easy_apply') is None:
+            self.logger.info("Easy Apply status unknown, checking the job details page")
+            return True
         
-        self.logger.info("Easy Apply not available after all attempts")
+        self.logger.info("Easy Apply not available on job card")
         return False
 
-    def is_already_applied(self, card) -> bool:
-        """Enhanced method to check if already applied to a job with new UI selectors"""
-        max_retries = MAX_RETRIES.get('status_check', 3)
+    def is_already_applied(self, record: Dict) -> bool:
+        """Check if a card record was already applied to, using our tracker and the card status"""
+        job_id = record.get('job_id')
         
-        try:
-            # Get job ID first and check our tracker
-            job_id = self.get_job_id_from_card(card)
+        # Check our own tracker first
+        if job_id and self.tracker.is_job_applied(job_id):
+            self.logger.info(f"Found job ID {job_id} in tracker as already applied")
+            return True
             
-            # Check our own tracker first
-            if job_id and self.tracker.is_job_applied(job_id):
-                self.logger.info(f"Found job ID {job_id} in tracker as already applied")
-                return True
-                
-            # Also check our in-memory set for this session
-            if job_id in self.processed_job_ids:
-                self.logger.info(f"Already processed job ID {job_id} in this session")
-                return True
-        except Exception as e:
-            self.logger.warning(f"Error checking job ID: {str(e)}")
+        # Also check our in-memory set for this session
+        if job_id in self.processed_job_ids:
+            self.logger.info(f"Already processed job ID {job_id} in this session")
+            return True
         
-        # Proceed with UI checks with retries
-        for attempt in range(max_retries):
-            try:
-                self.logger.debug(f"Checking if already applied (attempt {attempt+1}/{max_retries})")
-                
-                # Add delay to allow the page to update its status
-                self.random_delay('status_check')
-                
-                # Method 1: Look for "Applied" text with checkmark SVG (new UI)
-                try:
-                    # Look for the checkmark SVG path that indicates Applied status
-                    checkmark_svg_paths = [
-                        'M448 256c0-106-86-192-192-192S64 150 64 256s86 192 192 192 192-86 192-192z',  # Circle
-                        'M352 176 217.6 336 160 272'  # Checkmark
-                    ]
-                    
-                    for svg_path in checkmark_svg_paths:
-                        checkmark_elements = card.find_elements(
-                            By.XPATH,
-                            f".//svg//path[@d='{svg_path}']"
-                        )
-                        
-                        for checkmark in checkmark_elements:
-                            # Check if this SVG is part of an Applied button
-                            parent_element = checkmark
-                            for _ in range(5):  # Check up to 5 levels up
-                                parent_element = parent_element.find_element(By.XPATH, "..")
-                                if parent_element.tag_name in ['a', 'button']:
-                                    parent_text = parent_element.text.lower()
-                                    if 'applied' in parent_text and parent_element.is_displayed():
-                                        self.logger.info("Found Applied status via checkmark SVG")
-                                        return True
-                                    break
-                except Exception as e:
-                    self.logger.debug(f"Checkmark SVG check failed: {e}")
-                
-                # Method 2: Look for "Applied" text in the card
-                card_text = card.text.lower()
-                applied_indicators = ["applied", "application submitted", "app submitted"]
-                if any(indicator in card_text for indicator in applied_indicators):
-                    self.logger.info(f"Found applied text in card")
-                    return True
-                
-                # Method 3: Look for Applied text in buttons/links
-                try:
-                    applied_elements = card.find_elements(
-                        By.XPATH, 
-                        ".//a[contains(text(), 'Applied')] | .//button[contains(text(), 'Applied')] | .//span[contains(text(), 'Applied')]"
-                    )
-                    
-                    for elem in applied_elements:
-                        if elem.is_displayed():
-                            self.logger.info("Found Applied text element")
-                            return True
-                except Exception as e:
-                    self.logger.debug(f"Applied text check failed: {e}")
-                
-                # Method 4: Check for any CSS classes that might indicate applied status
-                try:
-                    applied_elements = card.find_elements(
-                        By.XPATH, 
-                        ".//*[contains(@class, 'applied') or contains(@class, 'submitted')]"
-                    )
-                    if applied_elements and any(elem.is_displayed() for elem in applied_elements):
-                        self.logger.info("Found applied class indicator")
-                        return True
-                except:
-                    pass
-                
-                # Method 5: Old UI indicators (fallback)
-                applied_indicators = [
-                    ".ribbon-status-applied",
-                    ".search-status-ribbon-mobile.ribbon-status-applied",
-                    ".status-applied",
-                    ".already-applied"
-                ]
-                
-                for indicator in applied_indicators:
-                    if card.find_elements(By.CSS_SELECTOR, indicator):
-                        self.logger.info(f"Found applied indicator: {indicator}")
-                        return True
-                
-                # If this is not the last attempt, wait before retry
-                if attempt < max_retries - 1:
-                    self.logger.debug(f"Applied status not found, waiting before retry {attempt+1}")
-                    time.sleep(2 * (attempt + 1))  # Progressive delay
-                    
-            except Exception as e:
-                self.logger.warning(f"Error checking applied status (attempt {attempt+1}): {str(e)}")
-                if attempt < max_retries - 1:
-                    time.sleep(2)  # Wait before retry
+        if record.get('applied'):
+            self.logger.info("Found applied status on job card")
+            return True
         
-        self.logger.debug("No applied status found after all attempts")
         return False
 
     def _verify_easy_apply_on_details_page(self) -> bool:
@@ -567,8 +420,10 @@ class DiceBot:
         the shadow DOM content of apply-button-wc element
         """
         try:
-            # Give the page a moment to fully load the shadow DOM content
-            time.sleep(3)
+            # Wait for the apply button's shadow DOM to render its state
+            self.waits.shadow_root_populated(
+                "apply-button-wc", "apply-button, application-submitted, button.btn-primary", timeout=10
+            )
             
             # Look for the apply-button-wc element
             apply_button_wc = self.driver.find_element(By.CSS_SELECTOR, "apply-button-wc")
@@ -671,123 +526,59 @@ class DiceBot:
             self.logger.warning(f"Could not extract job ID from URL: {str(e)}")
             return None
 
-    def extract_job_details(self, card) -> Optional[Tuple[Dict, str]]:
-        """Extract job details from card and detailed view with early application status verification"""
+    def extract_job_details(self, record: Dict) -> Optional[Tuple[Dict, str]]:
+        """Extract job details from a card record and the detailed view with early application status verification"""
         original_window = self.driver.current_window_handle
         
         try:
-            # Basic details from card
+            # Basic details from the card record
             job_details = {
-                'title': 'Unknown Job',
-                'company': 'Unknown Company',
-                'location': 'Unknown Location'
+                'title': record.get('title') or 'Unknown Job',
+                'company': record.get('company') or 'Unknown Company',
+                'location': record.get('location') or 'Unknown Location'
             }
             
-            # Extract title (new UI)
-            try:
-                title_elem = card.find_element(By.CSS_SELECTOR, "a[data-testid='job-search-job-detail-link']")
-                if title_elem:
-                    job_details['title'] = title_elem.text.strip()
-            except NoSuchElementException:
-                # Fallback to old UI selectors
-                for selector in ["[data-cy='card-title-link']", ".card-title-link", "a.job-title", "h2 a", "h3 a"]:
-                    try:
-                        title_elem = card.find_element(By.CSS_SELECTOR, selector)
-                        if title_elem:
-                            job_details['title'] = title_elem.text.strip()
-                            break
-                    except:
-                        continue
-            
-            # Extract company (new UI)
-            try:
-                company_elem = card.find_element(By.CSS_SELECTOR, "a[data-rac][href*='company-profile']")
-                if company_elem:
-                    job_details['company'] = company_elem.text.strip()
-            except NoSuchElementException:
-                # Fallback to old UI selectors
-                for selector in ["[data-cy='search-result-company-name']", ".company-name", ".employer", "[data-cy='company-name']"]:
-                    try:
-                        company_elem = card.find_element(By.CSS_SELECTOR, selector)
-                        if company_elem:
-                            job_details['company'] = company_elem.text.strip()
-                            break
-                    except:
-                        continue
-            
-            # Extract location (new UI) - filter out dates
-            try:
-                location_elems = card.find_elements(By.CSS_SELECTOR, "p.text-sm.font-normal.text-zinc-600")
-                if location_elems:
-                    for loc_elem in location_elems:
-                        text = loc_elem.text.strip()
-                        # Filter out date information (contains "ago", "Yesterday", "Today", etc.)
-                        date_indicators = ["ago", "yesterday", "today", "•"]
-                        if not any(indicator in text.lower() for indicator in date_indicators) and len(text) > 2:
-                            job_details['location'] = text
-                            break
-            except NoSuchElementException:
-                # Fallback to old UI selectors
-                for selector in ["[data-cy='search-result-location']", ".location", ".job-location"]:
-                    try:
-                        location_elem = card.find_element(By.CSS_SELECTOR, selector)
-                        if location_elem:
-                            job_details['location'] = location_elem.text.strip()
-                            break
-                    except:
-                        continue
+            # Title link to click
+            title_link = record.get('link')
+            job_details['url'] = record.get('url') or ''
             
-            # Find title link to click (new UI)
-            title_link = None
-            try:
-                title_link = card.find_element(By.CSS_SELECTOR, "a[data-testid='job-search-job-detail-link']")
-            except NoSuchElementException:
-                # Fallback to old UI selectors
-                for selector in ["[data-cy='card-title-link']", ".card-title-link", "a.job-title", "h2 a", "h3 a"]:
+            if title_link:
+                # Click on title link to open job details
+                try:
+                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", title_link)
+                    self.waits.element_clickable(title_link, timeout=2)
+                    title_link.click()
+                except:
                     try:
-                        title_link = card.find_element(By.CSS_SELECTOR, selector)
-                        if title_link:
-                            break
-                    except:
-                        continue
-            
-            if not title_link:
-                self.logger.error("Could not find job title link to click")
-                return None
-            
-            job_details['url'] = title_link.get_attribute('href') or ''
-            
-            # Click on title link to open job details
-            try:
-                self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", title_link)
-                time.sleep(0.5)
-                title_link.click()
-            except:
+                        self.driver.execute_script("arguments[0].click();", title_link)
+                    except Exception as e:
+                        self.logger.error(f"Could not click job title link: {str(e)}")
+                        return None
+                
+                self.random_delay('between_actions')
+                
+                # Switch to new window
                 try:
-                    self.driver.execute_script("arguments[0].click();", title_link)
-                except Exception as e:
-                    self.logger.error(f"Could not click job title link: {str(e)}")
+                    WebDriverWait(self.driver, 10).until(lambda d: len(d.window_handles) > 1)
+                    
+                    for window in self.driver.window_handles:
+                        if window != original_window:
+                            self.driver.switch_to.window(window)
+                            break
+                except:
+                    self.logger.error("Timeout waiting for new window")
                     return None
-            
-            self.random_delay('between_actions')
-            
-            # Switch to new window
-            try:
-                WebDriverWait(self.driver, 10).until(lambda d: len(d.window_handles) > 1)
-                
-                for window in self.driver.window_handles:
-                    if window != original_window:
-                        self.driver.switch_to.window(window)
-                        break
-            except:
-                self.logger.error("Timeout waiting for new window")
+            elif job_details['url']:
+                # Records captured from the search API have no card to click
+                self.driver.switch_to.new_window('tab')
+                self.driver.get(job_details['url'])
+            else:
+                self.logger.error("Could not find job title link to click")
                 return None
             
             # Wait for job details page to load
-            time.sleep(5)
-            WebDriverWait(self.driver, 15).until(
-                lambda d: d.execute_script("return document.readyState") == "complete"
-            )
+            if not self.waits.document_ready():
+                raise TimeoutException("Job details page did not finish loading")
             
             # *** CRITICAL NEW CHECK: Verify Easy Apply is still available on job details page ***
             self.logger.info(f"Verifying Easy Apply availability on job details page for: {job_details['title']}")
@@ -942,7 +733,7 @@ class DiceBot:
                 
                 if clicked:
                     self.logger.info("Clicked Easy Apply button in shadow DOM")
-                    time.sleep(2)
+                    self.waits.network_idle()
                     return True
             except NoSuchElementException:
                 self.logger.info("No apply-button-wc found, trying alternative methods")
@@ -969,9 +760,9 @@ class DiceBot:
                             if button.is_displayed() and button.is_enabled():
                                 self.logger.info(f"Found Easy Apply button with selector: {selector}")
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                                time.sleep(0.5)
+                                self.waits.element_clickable(button, timeout=2)
                                 button.click()
-                                time.sleep(1)
+                                self.waits.network_idle()
                                 return True
                     except:
                         continue
@@ -998,14 +789,14 @@ class DiceBot:
                         # Try clicking
                         try:
                             self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                            time.sleep(0.5)
+                            self.waits.element_clickable(button, timeout=2)
                             button.click()
-                            time.sleep(1)
+                            self.waits.network_idle()
                             return True
                         except:
                             try:
                                 self.driver.execute_script("arguments[0].click();", button)
-                                time.sleep(1)
+                                self.waits.network_idle()
                                 return True
                             except:
                                 continue
@@ -1020,14 +811,14 @@ class DiceBot:
                 if element.is_displayed() and element.is_enabled():
                     try:
                         self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", element)
-                        time.sleep(0.5)
+                        self.waits.element_clickable(element, timeout=2)
                         element.click()
-                        time.sleep(1)
+                        self.waits.network_idle()
                         return True
                     except:
                         try:
                             self.driver.execute_script("arguments[0].click();", element)
-                            time.sleep(1)
+                            self.waits.network_idle()
                             return True
                         except:
                             continue
@@ -1039,40 +830,62 @@ class DiceBot:
             self.logger.error(f"Error clicking Easy Apply: {str(e)}")
             return False
 
-    def submit_application(self, job_details: Dict) -> bool:
-        """Submit job application with support for new UI"""
+    def prepare_application_files(self, job_details: Dict) -> Tuple[Optional[str], Optional[Path]]:
+        """Generate the resume and cover letter for a job; runs on pipeline workers as well"""
+        self.logger.info(f"Generating optimized resume for {job_details['title']}")
+        # Generate resume
+        resume_path = self.resume_handler.generate_resume(job_details)
+        if not resume_path:
+            return None, None
+            
+        # Generate cover letter
+        self.logger.info("Generating cover letter")
+        cover_letter = self.gemini.generate_cover_letter(job_details, resume_path)
+        
+        cover_letter_path = None
+        if cover_letter:
+            # Save cover letter
+            resume_filename = os.path.basename(resume_path)
+            base_name = os.path.splitext(resume_filename)[0]
+            cover_letter_base = base_name.replace("Resume", "Cover_Letter")
+            
+            # Ensure unique filename; exclusive create so parallel workers never share one
+            cover_letter_filename = f"{cover_letter_base}.txt"
+            counter = 1
+            while True:
+                cover_letter_path = RESUME_DIR / cover_letter_filename
+                try:
+                    with open(cover_letter_path, 'x') as f:
+                        try:
+                            f.write(cover_letter)
+                        except Exception:
+                            # Don't leave a partial cover letter under the reserved name
+                            f.close()
+                            os.remove(cover_letter_path)
+                            raise
+                    break
+                except FileExistsError:
+                    cover_letter_filename = f"{cover_letter_base}_v{counter}.txt"
+                    counter += 1
+            self.logger.info(f"Cover letter saved to {cover_letter_path}")
+        
+        return resume_path, cover_letter_path
+
+    def submit_application(self, job_details: Dict, prepared: Optional[Tuple] = None) -> bool:
+        """Submit job application with support for new UI
+        
+        `prepared` is (resume_path, cover_letter_path) when the pipeline already generated them.
+        """
         try:
-            self.logger.info(f"Generating optimized resume for {job_details['title']}")
-            # Generate resume
-            resume_path = self.resume_handler.generate_resume(job_details)
+            # Generate the resume and cover letter unless the pipeline already did
+            if prepared is None:
+                prepared = self.prepare_application_files(job_details)
+            resume_path, cover_letter_path = prepared
             if not resume_path:
                 self.logger.error("Failed to generate resume")
                 self.tracker.add_application(job_details, 'failed', notes="Failed to generate resume")
                 return False
                 
-            # Generate cover letter
-            self.logger.info("Generating cover letter")
-            cover_letter = self.gemini.generate_cover_letter(job_details, resume_path)
-            
-            cover_letter_path = None
-            if cover_letter:
-                # Save cover letter
-                resume_filename = os.path.basename(resume_path)
-                base_name = os.path.splitext(resume_filename)[0]
-                cover_letter_base = base_name.replace("Resume", "Cover_Letter")
-                
-                # Ensure unique filename
-                cover_letter_filename = f"{cover_letter_base}.txt"
-                counter = 1
-                while (RESUME_DIR / cover_letter_filename).exists():
-                    cover_letter_filename = f"{cover_letter_base}_v{counter}.txt"
-                    counter += 1
-                
-                cover_letter_path = RESUME_DIR / cover_letter_filename
-                with open(cover_letter_path, 'w') as f:
-                    f.write(cover_letter)
-                self.logger.info(f"Cover letter saved to {cover_letter_path}")
-            
             # Click Easy Apply
             self.logger.info("Clicking Easy Apply button")
             if not self.click_easy_apply():
@@ -1097,16 +910,10 @@ class DiceBot:
             ]
             
             application_container = None
-            for selector in application_selectors:
-                try:
-                    application_container = WebDriverWait(self.driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    if application_container:
-                        self.logger.info(f"Found application container with selector: {selector}")
-                        break
-                except:
-                    continue
+            opened = self.waits.modal_open(application_selectors, timeout=10)
+            if opened:
+                application_container, selector = opened
+                self.logger.info(f"Found application container with selector: {selector}")
             
             if not application_container:
                 self.logger.error("Application form not found")
@@ -1118,7 +925,7 @@ class DiceBot:
                 
             # Handle resume upload
             self.logger.info("Handling resume upload")
-            time.sleep(2)
+            self.waits.network_idle()
             
             # Look for file upload element
             try:
@@ -1143,7 +950,7 @@ class DiceBot:
                         replace_buttons = resume_container.find_elements(By.CSS_SELECTOR, ".file-remove, .replace-button")
                         if replace_buttons:
                             replace_buttons[0].click()
-                            time.sleep(1)
+                            self.waits.network_idle()
                     
                     # Look for file input in/near resume container
                     file_inputs = resume_container.find_elements(By.CSS_SELECTOR, "input[type='file']")
@@ -1154,7 +961,7 @@ class DiceBot:
                     if file_inputs:
                         file_inputs[0].send_keys(os.path.abspath(resume_path))
                         self.logger.info("Uploaded resume via file input")
-                        time.sleep(2)
+                        self.waits.network_idle()
                     else:
                         # Try to find a button that might trigger file selection
                         upload_buttons = resume_container.find_elements(
@@ -1164,21 +971,21 @@ class DiceBot:
                         if upload_buttons:
                             upload_buttons[0].click()
                             self.logger.info("Clicked upload button to trigger file selection")
-                            time.sleep(2)
+                            self.waits.network_idle()
                             
                             # Now try to find file input that might have appeared
                             file_inputs = self.driver.find_elements(By.CSS_SELECTOR, "input[type='file']")
                             if file_inputs:
                                 file_inputs[0].send_keys(os.path.abspath(resume_path))
                                 self.logger.info("Uploaded resume after clicking upload button")
-                                time.sleep(2)
+                                self.waits.network_idle()
                 else:
                     # Look for any file input
                     file_inputs = self.driver.find_elements(By.CSS_SELECTOR, "input[type='file']")
                     if file_inputs:
                         file_inputs[0].send_keys(os.path.abspath(resume_path))
                         self.logger.info("Uploaded resume via file input (no container found)")
-                        time.sleep(2)
+                        self.waits.network_idle()
                     else:
                         # Look for upload buttons
                         upload_buttons = self.driver.find_elements(
@@ -1191,14 +998,14 @@ class DiceBot:
                                     if button.is_displayed():
                                         button.click()
                                         self.logger.info("Clicked upload button")
-                                        time.sleep(2)
+                                        self.waits.network_idle()
                                         
                                         # Now try to find file input that might have appeared
                                         file_inputs = self.driver.find_elements(By.CSS_SELECTOR, "input[type='file']")
                                         if file_inputs:
                                             file_inputs[0].send_keys(os.path.abspath(resume_path))
                                             self.logger.info("Uploaded resume after clicking button")
-                                            time.sleep(2)
+                                            self.waits.network_idle()
                                             break
                                 except:
                                     continue
@@ -1226,7 +1033,7 @@ class DiceBot:
                     file_input = self.driver.find_element(By.CSS_SELECTOR, "#fsp-fileUpload, input[type='file']")
                     file_input.send_keys(os.path.abspath(resume_path))
                     self.logger.info("Uploaded file using file input in modal")
-                    time.sleep(2)
+                    self.waits.network_idle()
                 except:
                     # If standard file input not found, try JavaScript approach
                     self.logger.info("Standard file input not found, trying JavaScript approach")
@@ -1262,7 +1069,7 @@ class DiceBot:
                             if button.is_displayed() and 'disabled' not in button.get_attribute('class'):
                                 # Scroll to the button first
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                                time.sleep(0.5)
+                                self.waits.element_clickable(button, timeout=2)
                                 button.click()
                                 self.logger.info("Clicked Upload button using standard method")
                                 break
@@ -1270,7 +1077,7 @@ class DiceBot:
                             continue
                 
                 # Wait for modal to disappear
-                time.sleep(3)
+                self.waits.modal_closed(FILE_PICKER_SELECTORS)
             except Exception as e:
                 self.logger.warning(f"Error handling file picker: {str(e)}")
                 
@@ -1278,8 +1085,8 @@ class DiceBot:
             if cover_letter_path:
                 try:
                     self.logger.info("Uploading cover letter")
-                    # Wait a bit to make sure the previous modal is gone
-                    time.sleep(2)
+                    # Make sure the previous modal is gone
+                    self.waits.modal_closed(FILE_PICKER_SELECTORS)
                     
                     cover_letter_selectors = [
                         ".file-picker-wrapper.cover-letter",
@@ -1325,7 +1132,7 @@ class DiceBot:
                             buttons = cover_letter_container.find_elements(By.TAG_NAME, "button")
                             if buttons:
                                 self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", buttons[0])
-                                time.sleep(0.5)
+                                self.waits.element_clickable(buttons[0], timeout=2)
                                 buttons[0].click()
                                 self.logger.info("Clicked button in cover letter container")
                             else:
@@ -1334,10 +1141,7 @@ class DiceBot:
                                 if file_inputs:
                                     file_inputs[0].send_keys(os.path.abspath(cover_letter_path))
                                     self.logger.info("Uploaded cover letter directly via file input")
-                                    time.sleep(2)
-                        
-                        # Wait for file picker modal
-                        time.sleep(2)
+                                    self.waits.network_idle()
                         
                         # Handle file picker modal for cover letter
                         try:
@@ -1350,7 +1154,7 @@ class DiceBot:
                             file_input = self.driver.find_element(By.CSS_SELECTOR, "#fsp-fileUpload, input[type='file']")
                             file_input.send_keys(os.path.abspath(cover_letter_path))
                             self.logger.info("Uploaded cover letter via file input in modal")
-                            time.sleep(2)
+                            self.waits.network_idle()
                             
                             # Click upload button using JavaScript for reliability
                             self.driver.execute_script("""
@@ -1363,7 +1167,7 @@ class DiceBot:
                             """)
                             
                             self.logger.info("Cover letter uploaded successfully")
-                            time.sleep(3)
+                            self.waits.modal_closed(FILE_PICKER_SELECTORS)
                         except Exception as e:
                             self.logger.warning(f"Error handling cover letter file picker: {str(e)}")
                 except Exception as e:
@@ -1407,11 +1211,11 @@ class DiceBot:
                             for button in buttons:
                                 if button.is_displayed() and button.is_enabled():
                                     self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", button)
-                                    time.sleep(0.5)
+                                    self.waits.element_clickable(button, timeout=2)
                                     button.click()
                                     self.logger.info(f"Clicked {selector} button in step {step+1}")
                                     button_found = True
-                                    time.sleep(2)
+                                    self.waits.network_idle()
                                     break
                             if button_found:
                                 break
@@ -1599,53 +1403,17 @@ class DiceBot:
                 self.logger.error("Could not find job search results container")
                 return new_jobs_found
             
-            # Wait a bit more for dynamic content to load
-            time.sleep(3)
-            
-            # Try multiple selectors in order of preference
-            job_cards = []
-            selectors_to_try = [
-                # New UI - most specific
-                "div[data-testid='job-search-serp-card'][data-id]",
-                # New UI - less specific
-                "div[data-testid='job-search-serp-card']",
-                # New UI - by role
-                "div[role='listitem'] div[data-testid='job-search-serp-card']",
-                # New UI - by data-id only
-                "div[data-id]",
-                # Old UI fallbacks
-                "dhi-search-card[data-cy='search-card']",
-                ".search-card",
-                ".job-card"
-            ]
-            
-            for selector in selectors_to_try:
-                try:
-                    self.logger.info(f"Trying selector: {selector}")
-                    cards = self.driver.find_elements(By.CSS_SELECTOR, selector)
-                    
-                    if cards and len(cards) > 0:
-                        # Filter out any cards that might not be actual job cards
-                        valid_cards = []
-                        for card in cards:
-                            try:
-                                # Check if card has job-related content
-                                card_text = card.text.strip()
-                                if len(card_text) > 50:  # Job cards should have substantial content
-                                    valid_cards.append(card)
-                            except:
-                                continue
-                        
-                        if valid_cards:
-                            job_cards = valid_cards
-                            self.logger.info(f"Found {len(job_cards)} valid job cards with selector: {selector}")
-                            break
-                    else:
-                        self.logger.debug(f"No cards found with selector: {selector}")
-                        
-                except Exception as e:
-                    self.logger.debug(f"Selector {selector} failed: {str(e)}")
-                    continue
+            # Network capture mode: take the jobs from the search API response
+            job_cards = self.capture_search_records() if self.search_capture else []
+            if job_cards:
+                self.logger.info(f"Read {len(job_cards)} jobs from the search API response")
+            else:
+                # Wait once for the card statuses to render instead of sleeping per card
+                wait_for_cards_ready(self.driver, CARD_STATUS_TIMEOUT, CARD_STATUS_QUIET_MS)
+                
+                # Read every card's details and status in a single round trip
+                job_cards = extract_card_records(self.driver)
+                self.logger.info(f"Found {len(job_cards)} valid job cards")
             
             if not job_cards:
                 self.logger.error("No job cards found with any selector")
@@ -1670,24 +1438,7 @@ class DiceBot:
                     self.tracker.increment_jobs_found()
                     new_jobs_found += 1
                     
-                    # Scroll to the card to ensure it's in view
-                    self.driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", card)
-                    
-                    # Allow the page some time to update statuses after scrolling
-                    time.sleep(3)
-                    
-                    # Get basic job info for logging
-                    job_title = "Unknown"
-                    try:
-                        title_elem = card.find_element(By.CSS_SELECTOR, "a[data-testid='job-search-job-detail-link']")
-                        job_title = title_elem.text.strip()
-                    except:
-                        try:
-                            title_elem = card.find_element(By.CSS_SELECTOR, "[data-cy='card-title-link']")
-                            job_title = title_elem.text.strip()
-                        except:
-                            pass
-                    
+                    job_title = card['title'] or "Unknown"
                     self.logger.info(f"Processing job: {job_title}")
                     
                     # Check if already applied first
@@ -1696,24 +1447,19 @@ class DiceBot:
                         self.jobs_skipped += 1
                         continue
                     
+                    # In pool mode, leave jobs another browser already picked up to that browser
+                    if self.shared and not self.shared.claim_job(card['job_id']):
+                        self.logger.info(f"Skipping job claimed by another worker: {job_title}")
+                        self.jobs_skipped += 1
+                        continue
+                    
                     # Then check if Easy Apply is available
                     if not self.check_easy_apply_available(card):
                         self.logger.info(f"Skipping job without Easy Apply: {job_title}")
                         
                         # Record this skip with basic info
-                        job_id = self.get_job_id_from_card(card)
-                        company = "Unknown"
-                        
-                        # Try to extract company
-                        try:
-                            company_elem = card.find_element(By.CSS_SELECTOR, "a[data-rac][href*='company-profile']")
-                            company = company_elem.text.strip()
-                        except:
-                            try:
-                                company_elem = card.find_element(By.CSS_SELECTOR, "[data-cy='search-result-company-name']")
-                                company = company_elem.text.strip()
-                            except:
-                                pass
+                        job_id = card['job_id']
+                        company = card['company'] or "Unknown"
                         
                         job_info = {
                             'job_id': job_id or f"unknown_{self.jobs_processed}",
@@ -1738,6 +1484,14 @@ class DiceBot:
                         
                     job_details, original_window = result
                     
+                    if self.pipeline:
+                        # Generate files in the background; the job is reopened once they are ready
+                        if len(self.driver.window_handles) > 1:
+                            self.driver.close()
+                            self.driver.switch_to.window(original_window)
+                        self.queue_for_pipeline(job_details)
+                        continue
+                    
                     # Submit application
                     self.logger.info(f"Submitting application for: {job_details['title']}")
                     application_result = self.submit_application(job_details)
@@ -1762,6 +1516,14 @@ class DiceBot:
                         self.driver.switch_to.window(self.driver.window_handles[0])
                     continue
             
+            # Submit whatever the pipeline finished while we were scanning
+            if self.pipeline:
+                self.submit_ready_applications()
+            
+            # Count this page's blocked requests (also keeps the performance log short)
+            if self.request_blocker or self.search_capture:
+                self.read_network_events()
+            
             self.logger.info(f"Completed processing {len(job_cards)} job cards. Found {new_jobs_found} new jobs.")
             return new_jobs_found
                 
@@ -1773,6 +1535,86 @@ class DiceBot:
                 self.driver.switch_to.window(self.driver.window_handles[0])
             return new_jobs_found
 
+    def read_network_events(self) -> List[Dict]:
+        """DevTools network events since the last read; lean mode counts them on the way"""
+        if self.request_blocker:
+            return self.request_blocker.collect(self.driver)
+        return read_performance_log(self.driver)
+
+    def capture_search_records(self) -> List[Dict]:
+        """Job records from the results page's search API responses, empty if none was seen"""
+        self.waits.network_idle()
+        records = self.search_capture.records_from_events(self.driver, self.read_network_events())
+        if not records:
+            self.logger.info("No search API response captured, reading the job cards instead")
+        elif has_unknown_flags(records):
+            self.logger.info("Search API response lacks Easy Apply or applied status, reading them from the job cards")
+            wait_for_cards_ready(self.driver, CARD_STATUS_TIMEOUT, CARD_STATUS_QUIET_MS)
+            fill_unknown_flags(records, extract_card_records(self.driver))
+        return records
+
+    def queue_for_pipeline(self, job_details: Dict) -> None:
+        """Queue a job for background file generation, submitting finished ones while the queue is full"""
+        while not self.pipeline.has_capacity():
+            self.submit_prepared(self.pipeline.get_ready(block=True))
+        
+        self.pipeline.put(job_details)
+        self.logger.info(f"Queued for resume generation: {job_details['title']} ({self.pipeline.in_flight} in pipeline)")
+        
+        self.submit_ready_applications()
+
+    def submit_ready_applications(self, wait: bool = False) -> None:
+        """Submit every application whose files are ready; with wait, also the ones still being generated"""
+        while self.pipeline.in_flight:
+            prepared = self.pipeline.get_ready(block=wait)
+            if prepared is None:
+                break
+            self.submit_prepared(prepared)
+
+    def submit_prepared(self, prepared: PreparedApplication) -> bool:
+        """Reopen a job whose resume and cover letter are ready and submit the application"""
+        job_details = prepared.job_details
+        files = (prepared.resume_path, prepared.cover_letter_path)
+        
+        # Nothing to upload: submit_application records the failure
+        if not prepared.resume_path:
+            return self.submit_application(job_details, files)
+        
+        search_window = self.driver.current_window_handle
+        try:
+            self.driver.switch_to.new_window('tab')
+            self.driver.get(job_details['url'])
+            if not self.waits.document_ready():
+                raise TimeoutException("Job details page did not finish loading")
+            
+            if not self._verify_easy_apply_on_details_page():
+                self.logger.warning(f"Easy Apply no longer available for: {job_details['title']}")
+                self.tracker.add_application(
+                    job_details, 'skipped', prepared.resume_path, prepared.cover_letter_path,
+                    notes="Easy Apply no longer available when submitting"
+                )
+                return False
+            
+            self.logger.info(f"Submitting application for: {job_details['title']}")
+            application_result = self.submit_application(job_details, files)
+            
+            if application_result:
+                self.logger.info(f"Successfully applied to {job_details['title']}")
+            else:
+                self.logger.warning(f"Failed to apply to {job_details['title']}")
+            return application_result
+            
+        except Exception as e:
+            self.logger.error(f"Error submitting prepared application for {job_details['title']}: {str(e)}")
+            return False
+            
+        finally:
+            # Close the job tab and return to search results
+            if len(self.driver.window_handles) > 1:
+                self.driver.close()
+            self.driver.switch_to.window(search_window)
+            self.random_delay('between_applications')
+
     def next_page_exists(self) -> bool:
         """Check if next page exists with updated selectors for new UI"""
         try:
@@ -1837,16 +1679,13 @@ class DiceBot:
         except:
             return False
 
-    def search_jobs(self, title: str) -> bool:
-        """Search for jobs with given title and enhanced debugging"""
+    def search_jobs(self, title: str, page: int = 1) -> bool:
+        """Open a results page for the given title directly by URL, with enhanced debugging"""
         try:
-            search_url = DICE_SEARCH_URL.format(quote(title))
+            search_url = search_page_url(DICE_SEARCH_URL, title, page, SEARCH_PAGE_SIZE)
             self.logger.info(f"Navigating to search URL: {search_url}")
             self.driver.get(search_url)
-            self.random_delay('page_load')
-            
-            # Wait longer for the new UI to load completely
-            time.sleep(5)
+            self.waits.document_ready()
             
             # Verify search results loaded (new UI)
             results_selectors = [
@@ -1905,7 +1744,36 @@ class DiceBot:
         ]
         
         for title, page in self.processed_titles.items():
-            session_report.append(f"- {title}: processed up to page {page}")
+            if page:
+                session_report.append(f"- {title}: processed up to page {page}")
+            else:
+                session_report.append(f"- {title}: all pages processed")
+        
+        # How long the page waits actually took
+        if self.waits and self.waits.timings:
+            session_report.append("")
+            session_report.append("Page Wait Timings:")
+            for name, timing in self.waits.get_stats().items():
+                session_report.append(
+                    f"- {name}: {timing['count']} waits, avg {timing['average_seconds']:.2f}s, "
+                    f"max {timing['max_seconds']:.2f}s, {timing['timeouts']} timeouts"
+                )
+        
+        # What lean mode kept the browser from downloading
+        if self.request_blocker:
+            if self.driver:
+                self.request_blocker.collect(self.driver)
+            lean_stats = self.request_blocker.get_stats()
+            session_report.append("")
+            session_report.append("Lean Mode:")
+            session_report.append(f"- Requests blocked: {lean_stats['requests_blocked']}")
+            for resource_type, count in sorted(lean_stats['blocked_by_type'].items()):
+                session_report.append(f"  - {resource_type}: {count}")
+            session_report.append(f"- Estimated bytes saved: {lean_stats['estimated_bytes_saved'] / 1_000_000:.1f} MB")
+            session_report.append(
+                f"- Requests loaded: {lean_stats['requests_loaded']} "
+                f"({lean_stats['bytes_loaded'] / 1_000_000:.1f} MB)"
+            )
         
         full_report = report + "\n" + "\n".join(session_report)
         
@@ -1987,9 +1855,175 @@ class DiceBot:
         self.logger.info("Page structure analysis completed and saved to debug directory")
         return analysis_results
 
+    def start_pipeline(self) -> None:
+        """Pipeline mode: resumes and cover letters are generated while the browser keeps searching"""
+        if PIPELINE_MODE:
+            self.pipeline = ApplicationPipeline(
+                self.prepare_application_files, PIPELINE_WORKERS, PIPELINE_QUEUE_SIZE
+            )
+            self.logger.info(f"Pipeline mode enabled with {PIPELINE_WORKERS} generation workers")
+
+    def load_title_progress(self, tracking_file: Path) -> Dict[str, int]:
+        """Load the last page processed per job title"""
+        if tracking_file.exists():
+            try:
+                with open(tracking_file, 'r') as f:
+                    processed_titles = json.load(f)
+                self.logger.info(f"Loaded tracking data: {processed_titles}")
+                return processed_titles
+            except:
+                pass
+        return {}
+
+    def save_title_progress(self, tracking_file: Path, title: str, page: int) -> None:
+        """Record the last page processed for a title"""
+        try:
+            if self.shared:
+                self.shared.save_title_progress(tracking_file, title, page)
+                return
+            
+            self.processed_titles[title] = page
+            tracking_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(tracking_file, 'w') as f:
+                json.dump(self.processed_titles, f)
+        except Exception as e:
+            self.logger.warning(f"Error saving tracking data: {str(e)}")
+
+    def title_resume_page(self, title: str) -> int:
+        """First results page to open for a title: the one after the last page saved for it"""
+        if not RESUME_TITLE_PAGES:
+            return 1
+        progress = self.shared.processed_titles if self.shared else self.processed_titles
+        return progress.get(title, 0) + 1
+
+    def process_title_pages(self, current_title: str, gemini_service: GeminiService,
+                            tracking_file: Path, max_pages: int, start_page: int = 1) -> bool:
+        """Process result pages for the title just searched; False once all API keys are exhausted"""
+        current_page = start_page
+        max_page = current_page + max_pages
+        
+        while current_page < max_page:
+            self.logger.info(f"Processing page {current_page} for '{current_title}'")
+            new_jobs = self.process_search_results()
+            
+            self.logger.info(f"Found {new_jobs} new jobs on page {current_page}")
+            
+            # Update processed titles tracking
+            self.save_title_progress(tracking_file, current_title, current_page)
+            
+            # Check if all API keys are exhausted after processing each page
+            if gemini_service.are_all_keys_exhausted():
+                self.logger.error("All API keys have reached their daily limit during page processing. Stopping operation.")
+                print("\n⚠️ OPERATION HALTED: All API keys have reached their daily limit!")
+                print("Please try again tomorrow or add new API keys to config.py.")
+                return False
+            
+            # Check if we should move to next page
+            if not self.next_page_exists():
+                # Last page reached: the next run starts this title over at page 1
+                self.save_title_progress(tracking_file, current_title, 0)
+                break
+            
+            self.random_delay('between_pages')
+            
+            # Open the next page by URL instead of clicking through the pagination
+            if not self.search_jobs(current_title, current_page + 1):
+                break
+                
+            current_page += 1
+        
+        return True
+
+    def run_pool(self, size: int) -> None:
+        """Run `size` headless browsers that share one title queue and claim jobs before applying
+        
+        Each title is searched once per run by whichever worker takes it. Workers share
+        this bot's tracker and Gemini services, so API key rotation and limits stay global.
+        """
+        tracking_file = DATA_DIR / 'tracking' / 'title_tracking.json'
+        available_titles = list(JOB_TITLES)
+        random.shuffle(available_titles)
+        shared = SharedRunState(available_titles, self.load_title_progress(tracking_file))
+        
+        workers = [
+            DiceBot(tracker=self.tracker, shared=shared, headless=True,
+                    gemini=self.gemini, resume_handler=self.resume_handler, worker_id=n)
+            for n in range(1, size + 1)
+        ]
+        
+        self.logger.info(f"Pool mode: {size} headless browsers for {len(available_titles)} job titles")
+        try:
+            BrowserWorkerPool(workers).run()
+        finally:
+            # Roll the workers' counters and title progress up for the session report
+            self.processed_titles = shared.processed_titles
+            for worker in workers:
+                self.jobs_processed += worker.jobs_processed
+                self.jobs_applied += worker.jobs_applied
+                self.jobs_skipped += worker.jobs_skipped
+                if self.request_blocker and worker.request_blocker:
+                    self.request_blocker.merge(worker.request_blocker)
+        
+        if self.gemini.are_all_keys_exhausted():
+            self.logger.error("All API keys have reached their daily limit. Pool run stopped.")
+        
+        # Generate summary report
+        report_path = self.generate_summary_report()
+        self.logger.info(f"Session report saved to: {report_path}")
+
+    def run_worker(self) -> None:
+        """Pool worker: log in with its own browser and process titles from the shared queue"""
+        try:
+            if not self.setup_driver():
+                return
+            
+            if not self.login_to_dice():
+                self.logger.error("Failed to login to Dice")
+                return
+            
+            self.start_pipeline()
+            tracking_file = DATA_DIR / 'tracking' / 'title_tracking.json'
+            max_pages_per_title = 50
+            
+            while True:
+                current_title = self.shared.next_title()
+                if current_title is None:
+                    break
+                self.logger.info(f"Processing job title: {current_title}")
+                
+                start_page = self.title_resume_page(current_title)
+                if not self.search_jobs(current_title, start_page):
+                    continue
+                
+                if not self.process_title_pages(current_title, self.gemini, tracking_file,
+                                                max_pages_per_title, start_page):
+                    # Out of API keys: no worker should start another title
+                    self.shared.stop()
+                    break
+                
+                self.random_delay('between_actions')
+            
+            # Submit the applications still in the pipeline
+            if self.pipeline:
+                self.submit_ready_applications(wait=True)
+                
+        finally:
+            if self.pipeline:
+                self.pipeline.shutdown()
+            if self.driver:
+                if self.request_blocker:
+                    self.request_blocker.collect(self.driver)
+                self.driver.quit()
+                self.logger.info("Browser closed")
+
     def run(self):
         """Main execution flow with improved job title handling and API key monitoring"""
         try:
+            # Pool mode: several headless browsers share the title queue
+            if BROWSER_WORKERS > 1:
+                self.run_pool(BROWSER_WORKERS)
+                return
+            
             if not self.setup_driver():
                 return
             
@@ -2000,18 +2034,15 @@ class DiceBot:
                 return
                 
             self.logger.info("Successfully logged in - proceeding with job search...")
+            
+            self.start_pipeline()
+            
             # Initialize the Gemini service for API key monitoring
             gemini_service = GeminiService()
                 
             # Load tracking data if it exists
             tracking_file = DATA_DIR / 'tracking' / 'title_tracking.json'
-            if tracking_file.exists():
-                try:
-                    with open(tracking_file, 'r') as f:
-                        self.processed_titles = json.load(f)
-                    self.logger.info(f"Loaded tracking data: {self.processed_titles}")
-                except:
-                    self.processed_titles = {}
+            self.processed_titles = self.load_title_progress(tracking_file)
             
             # Create a copy of job titles for this run
             available_titles = list(JOB_TITLES)
@@ -2062,52 +2093,18 @@ class DiceBot:
                 current_title = available_titles.pop(0)
                 self.logger.info(f"Processing job title: {current_title}")
                 
-                # Search for this title
-                if not self.search_jobs(current_title):
+                # Search for this title, resuming after the last page processed
+                start_page = self.title_resume_page(current_title)
+                if not self.search_jobs(current_title, start_page):
                     continue
                 
-                # Get starting page (default to 1)
-                current_page = 1
-                max_page = current_page + max_pages_per_title
-                
                 # Process pages for this title
-                while current_page < max_page:
-                    self.logger.info(f"Processing page {current_page} for '{current_title}'")
-                    new_jobs = self.process_search_results()
-                    
-                    self.logger.info(f"Found {new_jobs} new jobs on page {current_page}")
-                    
-                    # Update processed titles tracking
-                    self.processed_titles[current_title] = current_page
-                    
-                    # Save tracking data
-                    try:
-                        tracking_file.parent.mkdir(parents=True, exist_ok=True)
-                        with open(tracking_file, 'w') as f:
-                            json.dump(self.processed_titles, f)
-                    except Exception as e:
-                        self.logger.warning(f"Error saving tracking data: {str(e)}")
-                    
-                    # Check if all API keys are exhausted after processing each page
-                    if gemini_service.are_all_keys_exhausted():
-                        self.logger.error("All API keys have reached their daily limit during page processing. Stopping operation.")
-                        print("\n⚠️ OPERATION HALTED: All API keys have reached their daily limit!")
-                        print("Please try again tomorrow or add new API keys to config.py.")
-                        
-                        # Generate final report before stopping
-                        report_path = self.generate_summary_report()
-                        self.logger.info(f"Final report saved to: {report_path}")
-                        return
-                    
-                    # Check if we should move to next page
-                    if not self.next_page_exists():
-                        break
-                        
-                    if not self.go_to_next_page():
-                        break
-                        
-                    current_page += 1
-                    self.random_delay('between_pages')
+                if not self.process_title_pages(current_title, gemini_service, tracking_file,
+                                                max_pages_per_title, start_page):
+                    # Generate final report before stopping
+                    report_path = self.generate_summary_report()
+                    self.logger.info(f"Final report saved to: {report_path}")
+                    return
                 
                 # Put this title back at the end of the queue if it had more pages
                 if self.next_page_exists():
@@ -2127,6 +2124,10 @@ class DiceBot:
                     if user_input != 'y':
                         break
             
+            # Submit the applications still in the pipeline
+            if self.pipeline:
+                self.submit_ready_applications(wait=True)
+            
             # Generate summary report
             report_path = self.generate_summary_report()
             self.logger.info(f"Session report saved to: {report_path}")
@@ -2135,6 +2136,8 @@ class DiceBot:
             self.logger.error(f"Error in main execution: {str(e)}")
             
         finally:
+            if self.pipeline:
+                self.pipeline.shutdown()
             if self.driver:
                 self.driver.quit()
                 self.logger.info("Browser closed")
\ No newline at end of file
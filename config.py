@@ -36,6 +36,22 @@ BLACKLISTED_COMPANIES = [
 API_DAILY_LIMIT = 800  # Maximum requests per day per key
 API_WARNING_THRESHOLD = 0.85  # Warn when usage reaches 85% of limit
 
+# Gemini response cache - identical prompts are answered from disk instead of the API
+API_CACHE_ENABLED = True
+API_CACHE_DIR = DATA_DIR / 'cache' / 'gemini'
+API_CACHE_MAX_ENTRIES = 2000  # Least recently used entries are evicted beyond this
+API_CACHE_MAX_SIZE_MB = 100
+API_CACHE_MAX_AGE_DAYS = 7  # Entries older than this are treated as misses
+
+# Resume optimization concurrency - sections and experience entries are optimized in parallel
+RESUME_CONCURRENT_MODE = True
+RESUME_MAX_CONCURRENCY = 4  # Maximum Gemini calls in flight at once
+RESUME_BATCH_MODE = False  # Optimize all sections with one request; failed sections fall back to per-section calls
+
+# Per-key rate limits enforced before every Gemini call, shared by all threads and processes
+API_REQUESTS_PER_MINUTE = 15
+API_RATE_LIMIT_BURST = 5  # Calls allowed back-to-back before requests are spaced out
+
 # Chrome Settings
 CHROME_PROFILE = {
     'user_data_dir': 'C:\\Users\\ABC\\AppData\\Local\\Google\\Chrome\\User Data',
@@ -48,6 +64,46 @@ DICE_LOGIN = {
 }
 
 HEADLESS_MODE = True
+
+# Number of browsers to run at once. Above 1, each worker is a headless browser with its
+# own login; they take job titles from a shared queue and never apply to the same job
+BROWSER_WORKERS = 1
+
+# Reuse the cookies and localStorage of the last successful login instead of logging in on
+# every start. The saved session is checked with one request and dropped if it fails
+REUSE_SESSION = True
+SESSION_FILE = DATA_DIR / 'session' / 'dice_session.json'
+SESSION_MAX_AGE_HOURS = 24
+
+# Lean browser mode: eager page loads and DevTools request blocking for the URL patterns
+# below plus whole resource types ('image', 'font', 'media')
+LEAN_MODE = False
+LEAN_BLOCKED_URLS = [
+    "*google-analytics.com*",
+    "*googletagmanager.com*",
+    "*doubleclick.net*",
+    "*googlesyndication.com*",
+    "*facebook.net*",
+    "*connect.facebook.com*",
+    "*hotjar.com*",
+    "*segment.io*",
+    "*segment.com*",
+    "*newrelic.com*",
+    "*nr-data.net*",
+    "*optimizely.com*",
+    "*adsrvr.org*",
+    "*bing.com/bat*",
+    "*linkedin.com/px*",
+    "*quantserve.com*",
+    "*scorecardresearch.com*"
+]
+LEAN_BLOCKED_RESOURCE_TYPES = ['image', 'font', 'media']
+
+# Read search results from the JSON responses the results page fetches (falls back to
+# the job cards when no response matching these URL fragments is seen)
+NETWORK_CAPTURE_MODE = False
+SEARCH_RESPONSE_URL_PATTERNS = ['job-search-api', '/jobs/search']
+
 # ChromeDriver path
 CHROMEDRIVER_PATH = "webdriver\\chromedriver.exe"
 
@@ -64,17 +120,26 @@ DELAYS = {
     'page_load': (4, 8),
     'between_actions': (2, 5),
     'between_applications': (8, 15),
-    'between_pages': (5, 10),
-    'status_check': (5, 10)  # New delay for status checks (Easy Apply, Already Applied)
+    'between_pages': (5, 10)
 }
 
+# Search results readiness: wait up to CARD_STATUS_TIMEOUT seconds for every card's
+# apply status to render, or until the results have been quiet for CARD_STATUS_QUIET_MS
+CARD_STATUS_TIMEOUT = 10
+CARD_STATUS_QUIET_MS = 1500
+
 MAX_RETRIES = {
     'click': 3,
     'form': 2,
-    'page_load': 2,
-    'status_check': 3  # New retry setting for status checks
+    'page_load': 2
 }
 
+# Pipeline mode: resumes and cover letters are generated by PIPELINE_WORKERS background
+# threads while the browser keeps discovering jobs; at most PIPELINE_QUEUE_SIZE jobs wait
+PIPELINE_MODE = False
+PIPELINE_WORKERS = 2
+PIPELINE_QUEUE_SIZE = 4
+
 # Job Search Settings
 # Job Search Settings
 JOB_TITLES = [
@@ -96,12 +161,28 @@ JOB_TITLES = [
     "Software Test Engineer"
 ]
 # Search URL template
-DICE_SEARCH_URL = "https://www.dice.com/jobs?q={}&countryCode=US&pageSize=20&filters.workplaceTypes=Remote&filters.easyApply=true&language=en"
+DICE_SEARCH_URL = "https://www.dice.com/jobs?q={}&countryCode=US&filters.workplaceTypes=Remote&filters.easyApply=true&language=en"
+
+# Results pages are opened directly by URL with these page and pageSize parameters
+SEARCH_PAGE_SIZE = 100
+# Start each title at the page after the last one saved in title_tracking.json
+RESUME_TITLE_PAGES = True
 
 # Application Limits
 MAX_APPLICATIONS_PER_DAY = 2
 MAX_PAGES_PER_TITLE = 50  # How many pages to process before moving to next title
 
+# Application tracker storage: 'csv' (applications.csv + JSON files) or 'sqlite'
+# The first start on 'sqlite' imports the existing CSV/JSON history
+TRACKER_BACKEND = 'csv'
+TRACKER_STATS_FLUSH_EVERY = 20  # Statistics events buffered before they are journaled to disk
+TRACKER_STATS_FLUSH_INTERVAL = 30  # Seconds before buffered statistics events are journaled anyway
+TRACKER_JOB_IDS_COMPACT_EVERY = 1000  # Job IDs journaled before the journal is folded into job_ids.json
+
+# Dashboard status (bot_status.json): changes are kept in memory and written at most
+# once per interval; 0 writes every change straight away
+STATUS_FLUSH_INTERVAL_MS = 500
+
 # Debug Mode - Set to True for additional debugging information
 DEBUG_MODE = False
 
@@ -0,0 +1,27 @@
+import json
+import logging
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+
+def enable_performance_log(options) -> None:
+    """Have ChromeDriver record DevTools events (network included) in its performance log"""
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
+
+def read_performance_log(driver) -> List[Dict]:
+    """Take the DevTools events logged since the last read, as {'method', 'params'} dicts"""
+    try:
+        entries = driver.get_log('performance')
+    except Exception as e:
+        logger.debug(f"Could not read performance log: {str(e)}")
+        return []
+
+    events = []
+    for entry in entries:
+        try:
+            events.append(json.loads(entry['message'])['message'])
+        except (KeyError, ValueError):
+            continue
+    return events
@@ -0,0 +1,281 @@
+import hashlib
+import logging
+import time
+from typing import Dict, List
+from urllib.parse import parse_qsl, quote, urlencode, urlparse, urlunparse
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+logger = logging.getLogger(__name__)
+
+# Card selectors in order of preference; the first one matching real job cards wins
+CARD_SELECTORS = [
+    # New UI - most specific
+    "div[data-testid='job-search-serp-card'][data-id]",
+    # New UI - less specific
+    "div[data-testid='job-search-serp-card']",
+    # New UI - by role
+    "div[role='listitem'] div[data-testid='job-search-serp-card']",
+    # New UI - by data-id only
+    "div[data-id]",
+    # Old UI fallbacks
+    "dhi-search-card[data-cy='search-card']",
+    ".search-card",
+    ".job-card"
+]
+
+# Shared by the page scripts: the job cards on the page, using the first selector that matches
+FIND_CARDS_JS = r"""
+function findCards(selectors) {
+    for (const selector of selectors) {
+        const found = Array.from(document.querySelectorAll(selector))
+            .filter(card => (card.innerText || card.textContent || '').trim().length > 50);
+        if (found.length) {
+            return found;
+        }
+    }
+    return [];
+}
+"""
+
+# Installs a MutationObserver that records when the results last changed
+CARD_OBSERVER_SCRIPT = r"""
+const target = document.querySelector("[data-testid='job-search-results-container']") || document.body;
+const state = window.__cardReadiness;
+if (state && state.target === target) {
+    state.lastMutation = Date.now();
+    return;
+}
+if (state) {
+    state.observer.disconnect();
+}
+const newState = {target: target, lastMutation: Date.now()};
+newState.observer = new MutationObserver(() => { newState.lastMutation = Date.now(); });
+newState.observer.observe(target, {childList: true, subtree: true, attributes: true, characterData: true});
+window.__cardReadiness = newState;
+"""
+
+# Readiness predicate: 'rendered' once every card shows an apply status, 'quiet' once
+# the results stopped changing, otherwise false after scrolling the next pending card
+# into view (statuses render lazily as cards become visible)
+CARD_READINESS_SCRIPT = FIND_CARDS_JS + r"""
+const cards = findCards(arguments[0]);
+const quietMs = arguments[1];
+const STATUS_PATTERN = /^\s*(easy apply|applied|apply now|apply)\b/i;
+
+function hasStatus(card) {
+    if (card.querySelector('.ribbon-status-applied, .status-applied, .already-applied, [aria-labelledby="easyApply-label"]')) {
+        return true;
+    }
+    return Array.from(card.querySelectorAll('a, button')).some(
+        el => STATUS_PATTERN.test(el.innerText || el.textContent || ''));
+}
+
+if (!cards.length) {
+    return false;
+}
+const pending = cards.filter(card => !hasStatus(card));
+if (!pending.length) {
+    return 'rendered';
+}
+const state = window.__cardReadiness;
+if (state && Date.now() - state.lastMutation >= quietMs) {
+    return 'quiet';
+}
+pending[0].scrollIntoView({block: 'center'});
+return false;
+"""
+
+# Reads every job card on a results page and returns one plain record per card.
+# Mirrors the per-card WebDriver checks the bots used to make, but runs in the page.
+CARD_RECORDS_SCRIPT = FIND_CARDS_JS + r"""
+const selectors = arguments[0];
+const LIGHTNING_PATH = 'M315.27 33 96 304h128l-31.51 173.23a2.36 2.36 0 0 0 2.33 2.77h0a2.36 2.36 0 0 0 1.89-.95L416 208H288l31.66-173.25a2.45 2.45 0 0 0-2.44-2.75h0a2.42 2.42 0 0 0-1.95 1z';
+const CHECKMARK_PATHS = [
+    'M448 256c0-106-86-192-192-192S64 150 64 256s86 192 192 192 192-86 192-192z',
+    'M352 176 217.6 336 160 272'
+];
+
+function visible(el) {
+    return !!(el.offsetWidth || el.offsetHeight || el.getClientRects().length);
+}
+
+function text(el) {
+    return el ? (el.innerText || el.textContent || '').trim() : '';
+}
+
+function ownText(el) {
+    return Array.from(el.childNodes)
+        .filter(node => node.nodeType === Node.TEXT_NODE)
+        .map(node => node.textContent)
+        .join('');
+}
+
+function first(card, selectorList) {
+    for (const selector of selectorList) {
+        const el = card.querySelector(selector);
+        if (el) {
+            return el;
+        }
+    }
+    return null;
+}
+
+// First <a>/<button> within 5 ancestors of an SVG path, checked for a label
+function svgButtonHasLabel(card, path, label) {
+    for (const el of card.querySelectorAll('svg path')) {
+        if (el.getAttribute('d') !== path) {
+            continue;
+        }
+        let parent = el;
+        for (let i = 0; i < 5 && parent.parentElement; i++) {
+            parent = parent.parentElement;
+            const tag = parent.tagName.toLowerCase();
+            if (tag === 'a' || tag === 'button') {
+                if (text(parent).toLowerCase().includes(label) && visible(parent)) {
+                    return true;
+                }
+                break;
+            }
+        }
+    }
+    return false;
+}
+
+function labelledElements(card, label) {
+    return Array.from(card.querySelectorAll('a, button, span'))
+        .filter(el => ownText(el).includes(label));
+}
+
+function isEasyApply(card) {
+    if (svgButtonHasLabel(card, LIGHTNING_PATH, 'easy apply')) {
+        return true;
+    }
+    for (const el of labelledElements(card, 'Easy Apply')) {
+        let clickable = el;
+        for (let i = 0; i < 3 && clickable; i++) {
+            const tag = clickable.tagName.toLowerCase();
+            if ((tag === 'a' || tag === 'button') && visible(clickable)) {
+                return true;
+            }
+            clickable = clickable.parentElement;
+        }
+    }
+    for (const box of card.querySelectorAll("div.box[aria-labelledby='easyApply-label'], p[id='easyApply-label']")) {
+        if (visible(box) && text(box).toLowerCase().includes('easy apply')) {
+            return true;
+        }
+    }
+    const oldSelectors = "[data-cy='easyApplyBtn'], .easy-apply-button, .easy-apply, button[class*='easyApply'], button[class*='easy-apply']";
+    return Array.from(card.querySelectorAll(oldSelectors)).some(visible);
+}
+
+function isApplied(card) {
+    if (CHECKMARK_PATHS.some(path => svgButtonHasLabel(card, path, 'applied'))) {
+        return true;
+    }
+    const cardText = text(card).toLowerCase();
+    if (['applied', 'application submitted', 'app submitted'].some(indicator => cardText.includes(indicator))) {
+        return true;
+    }
+    if (labelledElements(card, 'Applied').some(visible)) {
+        return true;
+    }
+    if (Array.from(card.querySelectorAll("[class*='applied'], [class*='submitted']")).some(visible)) {
+        return true;
+    }
+    return !!card.querySelector('.ribbon-status-applied, .search-status-ribbon-mobile.ribbon-status-applied, .status-applied, .already-applied');
+}
+
+function cardLocation(card) {
+    const dateIndicators = ['ago', 'yesterday', 'today', '•'];
+    const candidates = card.querySelectorAll('p.text-sm.font-normal.text-zinc-600');
+    for (const el of candidates) {
+        const value = text(el);
+        if (!dateIndicators.some(indicator => value.toLowerCase().includes(indicator)) && value.length > 2) {
+            return value;
+        }
+    }
+    if (candidates.length) {
+        return '';
+    }
+    return text(first(card, ["[data-cy='search-result-location']", '.location', '.job-location']));
+}
+
+return findCards(selectors).map(card => {
+    const link = card.querySelector("a[data-testid='job-search-job-detail-link']")
+        || first(card, ["[data-cy='card-title-link']", '.card-title-link', 'a.job-title', 'h2 a', 'h3 a']);
+    const url = link ? (link.getAttribute('href') ? link.href : '') : '';
+
+    let jobId = card.getAttribute('data-id') || card.getAttribute('data-job-guid') || '';
+    if (!jobId && url.includes('/job-detail/')) {
+        jobId = url.split('/job-detail/')[1];
+    }
+    if (!jobId && url.includes('/jobs/')) {
+        jobId = url.split('/jobs/')[1].split('/')[0];
+    }
+
+    const company = card.querySelector("a[data-rac][href*='company-profile']")
+        || first(card, ["[data-cy='search-result-company-name']", '.company-name', '.employer', "[data-cy='company-name']"]);
+
+    return {
+        element: card,
+        link: link,
+        job_id: jobId,
+        title: text(link),
+        company: text(company),
+        location: cardLocation(card),
+        url: url,
+        easy_apply: isEasyApply(card),
+        applied: isApplied(card),
+        text: text(card)
+    };
+});
+"""
+
+
+def search_page_url(search_url: str, title: str, page: int = 1, page_size: int = 20) -> str:
+    """Results page URL for a title from the DICE_SEARCH_URL template, with page and pageSize set"""
+    parts = urlparse(search_url.format(quote(title)))
+    query = [(key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+             if key not in ('page', 'pageSize')]
+    query += [('page', str(page)), ('pageSize', str(page_size))]
+    return urlunparse(parts._replace(query=urlencode(query, safe=':/')))
+
+
+def wait_for_cards_ready(driver, timeout: float = 10, quiet_ms: int = 1500) -> bool:
+    """Wait once per results page until the cards' apply statuses have rendered
+
+    Returns False if the page was still changing when the timeout ran out.
+    """
+    start = time.monotonic()
+    driver.execute_script(CARD_OBSERVER_SCRIPT)
+
+    try:
+        reason = WebDriverWait(driver, timeout, poll_frequency=0.25).until(
+            lambda d: d.execute_script(CARD_READINESS_SCRIPT, CARD_SELECTORS, quiet_ms)
+        )
+    except TimeoutException:
+        logger.warning(f"Job card statuses still loading after {timeout}s, reading them anyway")
+        return False
+
+    logger.info(f"Job card statuses ready ({reason}) after {time.monotonic() - start:.1f}s")
+    return True
+
+
+def extract_card_records(driver) -> List[Dict]:
+    """Read all job cards on the current results page with a single WebDriver call
+
+    Each record holds job_id, title, company, location, url, easy_apply and applied,
+    plus the card `element` and title `link` for clicking through to the job.
+    """
+    records = driver.execute_script(CARD_RECORDS_SCRIPT, CARD_SELECTORS) or []
+
+    for record in records:
+        # Same last-resort ID as before: a hash of the card text
+        if not record.get('job_id'):
+            record['job_id'] = hashlib.md5(record.get('text', '').encode()).hexdigest()
+            logger.debug(f"Generated hash-based job ID: {record['job_id']}")
+
+    return records
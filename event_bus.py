@@ -0,0 +1,65 @@
+import logging
+import queue
+import threading
+from typing import Any, Dict, List
+
+
+class EventBus:
+    """In-process publish/subscribe bus for pushing bot activity to the dashboard
+
+    Every subscriber gets its own bounded queue. Publishing never blocks the bot:
+    when a subscriber falls behind its queue fills up and further events for it
+    are dropped.
+    """
+
+    def __init__(self, max_queue_size: int = 1000):
+        self.max_queue_size = max_queue_size
+        self._subscribers: List[queue.Queue] = []
+        self._lock = threading.Lock()
+
+    def subscribe(self) -> queue.Queue:
+        """Register a new subscriber and return the queue its events arrive on"""
+        events = queue.Queue(maxsize=self.max_queue_size)
+        with self._lock:
+            self._subscribers.append(events)
+        return events
+
+    def unsubscribe(self, events: queue.Queue) -> None:
+        """Stop delivering events to a subscriber queue"""
+        with self._lock:
+            if events in self._subscribers:
+                self._subscribers.remove(events)
+
+    def publish(self, event_type: str, data: Dict[str, Any]) -> None:
+        """Send an event to all current subscribers"""
+        with self._lock:
+            subscribers = list(self._subscribers)
+
+        for events in subscribers:
+            try:
+                events.put_nowait((event_type, data))
+            except queue.Full:
+                pass
+
+
+class EventBusHandler(logging.Handler):
+    """Logging handler that announces new lines in a dashboard log file"""
+
+    def __init__(self, log_file: str, bus: EventBus = None, level=logging.NOTSET):
+        super().__init__(level)
+        self.log_file = log_file
+        self.bus = bus or event_bus
+
+    def emit(self, record):
+        try:
+            self.bus.publish('log', {
+                'file': self.log_file,
+                'level': record.levelname,
+                'message': self.format(record)
+            })
+        except Exception:
+            self.handleError(record)
+
+
+# Shared bus for the bot and the dashboard running in the same process
+event_bus = EventBus()
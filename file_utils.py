@@ -0,0 +1,110 @@
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+if os.name == 'nt':
+    import msvcrt
+else:
+    import fcntl
+
+
+class FileLockTimeout(Exception):
+    """Raised when a FileLock cannot be acquired within its timeout"""
+
+
+class FileLock:
+    """Exclusive lock shared between threads and processes, backed by a lock file"""
+
+    def __init__(self, path: Path, timeout: float = 30.0, poll_interval: float = 0.05):
+        self.path = Path(path)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        # OS-level locks are per process on Windows, so threads are serialized here first
+        self._thread_lock = threading.RLock()
+        self._handle = None
+        self._depth = 0
+
+    def acquire(self) -> None:
+        """Block until the lock is held, raising FileLockTimeout after the timeout"""
+        deadline = time.monotonic() + self.timeout
+        if not self._thread_lock.acquire(timeout=self.timeout):
+            raise FileLockTimeout(f"Timed out waiting for {self.path}")
+
+        # Re-entrant use from the thread that already holds the file lock
+        if self._depth > 0:
+            self._depth += 1
+            return
+
+        handle = open(self.path, 'a+')
+        while True:
+            try:
+                self._lock_handle(handle)
+                break
+            except OSError:
+                if time.monotonic() >= deadline:
+                    handle.close()
+                    self._thread_lock.release()
+                    raise FileLockTimeout(f"Timed out waiting for {self.path}")
+                time.sleep(self.poll_interval)
+
+        self._handle = handle
+        self._depth = 1
+
+    def release(self) -> None:
+        """Release the lock"""
+        if self._depth == 0:
+            return
+
+        self._depth -= 1
+        if self._depth == 0:
+            try:
+                self._unlock_handle(self._handle)
+            finally:
+                self._handle.close()
+                self._handle = None
+        self._thread_lock.release()
+
+    @staticmethod
+    def _lock_handle(handle) -> None:
+        if os.name == 'nt':
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_NBLCK, 1)
+        else:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+    @staticmethod
+    def _unlock_handle(handle) -> None:
+        if os.name == 'nt':
+            handle.seek(0)
+            msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+        else:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+
+def atomic_write_json(path: Path, data, **dump_kwargs) -> None:
+    """Write JSON to a temp file and rename it over the target so readers never see a partial file"""
+    path = Path(path)
+    temp_path = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, **dump_kwargs)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except Exception:
+        try:
+            temp_path.unlink()
+        except FileNotFoundError:
+            pass
+        raise
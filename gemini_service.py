@@ -2,15 +2,28 @@ import json
 import logging
 import os
 import re
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import google.generativeai as genai
-from config import GEMINI_API_KEYS, DATA_DIR, API_DAILY_LIMIT, API_WARNING_THRESHOLD
+from config import (
+    GEMINI_API_KEYS, DATA_DIR, API_DAILY_LIMIT, API_WARNING_THRESHOLD,
+    API_CACHE_ENABLED, API_CACHE_DIR, API_CACHE_MAX_ENTRIES,
+    API_CACHE_MAX_SIZE_MB, API_CACHE_MAX_AGE_DAYS,
+    RESUME_CONCURRENT_MODE, RESUME_MAX_CONCURRENCY, RESUME_BATCH_MODE,
+    API_REQUESTS_PER_MINUTE, API_RATE_LIMIT_BURST
+)
 from api_key_manager import APIKeyManager
+from response_cache import ResponseCache, CachedResponse
+from rate_limiter import RateLimiter
 
 class GeminiService:
     """Handles all interactions with Gemini AI with support for new v2 resume format"""
     
+    # Sections that optimize_resume_sections can combine into one request
+    BATCHABLE_SECTIONS = ('professional_summary', 'core_competencies', 'professional_experience')
+    
     def __init__(self):
         # Initialize logger first
         self.logger = logging.getLogger(__name__)
@@ -27,14 +40,43 @@ class GeminiService:
             warning_threshold=API_WARNING_THRESHOLD
         )
         
+        # Persistent cache so repeated prompts don't spend API quota
+        self.response_cache = None
+        if API_CACHE_ENABLED:
+            self.response_cache = ResponseCache(
+                API_CACHE_DIR,
+                max_entries=API_CACHE_MAX_ENTRIES,
+                max_size_mb=API_CACHE_MAX_SIZE_MB,
+                max_age_days=API_CACHE_MAX_AGE_DAYS
+            )
+        
+        self.model_name = "gemini-2.5-flash-lite"
+        
+        # Per-key token buckets shared with every other thread and process using these keys
+        self.rate_limiter = RateLimiter(
+            DATA_DIR / 'tracking' / 'rate_limits.json',
+            requests_per_minute=API_REQUESTS_PER_MINUTE,
+            requests_per_day=API_DAILY_LIMIT,
+            burst=API_RATE_LIMIT_BURST
+        )
+        
+        # Concurrency controls shared by every thread using this service:
+        # key rotation/usage counting is serialized and in-flight calls are capped
+        self.concurrent_mode = RESUME_CONCURRENT_MODE
+        self.batch_mode = RESUME_BATCH_MODE
+        self.max_concurrency = max(1, RESUME_MAX_CONCURRENCY)
+        self._key_lock = threading.RLock()
+        self._call_slots = threading.BoundedSemaphore(self.max_concurrency)
+        
         # Setup Gemini (now the logger is available)
         self.setup_gemini()
         
-    def setup_gemini(self):
-        """Initialize Gemini AI with current API key"""
-        current_key = self.api_key_manager.get_current_key()
+    def setup_gemini(self, api_key=None):
+        """Initialize Gemini AI with the given API key, by default the current one"""
+        current_key = api_key or self.api_key_manager.get_current_key()
         genai.configure(api_key=current_key)
-        self.model = genai.GenerativeModel("gemini-2.5-flash-lite")
+        self.model = genai.GenerativeModel(self.model_name)
+        self.model_key = current_key
         self.logger.info("Configured Gemini with current API key")
 
     def _handle_api_error(self, error):
@@ -55,6 +97,9 @@ class GeminiService:
         if is_rate_limit:
             self.logger.warning(f"API rate limit reached: {error_str}")
             
+            # Stop other threads and processes from bursting on the same key
+            self.rate_limiter.drain(self.api_key_manager.get_current_key())
+            
             # Try to rotate to next key
             if self.api_key_manager.increment_usage():
                 self.setup_gemini()  # Reconfigure with new key
@@ -67,22 +112,54 @@ class GeminiService:
         self.logger.error(f"API error (not rate-limit related): {error_str}")
         return None  # Not a rate limit error
 
-    def make_api_call(self, prompt, max_retries=2, **kwargs):
-        """Make an API call with retry logic for rate limits"""
+    def make_api_call(self, prompt, max_retries=2, use_cache=True, **kwargs):
+        """Make an API call with retry logic for rate limits, serving repeats from the response cache"""
+        cache_key = None
+        if use_cache and self.response_cache:
+            cache_key = ResponseCache.make_key(prompt, self.model_name, kwargs.get('generation_config'))
+            cached_text = self.response_cache.get(cache_key)
+            if cached_text is not None:
+                self.logger.info("Using cached Gemini response")
+                return CachedResponse(cached_text)
+        
         retry_count = 0
         
         while retry_count <= max_retries:
             try:
+                # Wait for the rate limiter before spending a request
+                limited_key = self._wait_for_rate_limit()
+                if not limited_key:
+                    self.logger.error("All API keys have used their daily request budget")
+                    return None
+                
                 # Increment usage counter before making the call
-                if not self.api_key_manager.increment_usage():
-                    self.logger.error("All API keys have reached their daily limit")
+                with self._key_lock:
+                    charged_key = self.api_key_manager.increment_usage()
+                    if not charged_key:
+                        self.logger.error("All API keys have reached their daily limit")
+                        return None
+                    
+                    # Send the request on the key it was counted against
+                    if charged_key != self.model_key:
+                        self.setup_gemini(charged_key)
+                    model = self.model
+                
+                # Another process used up the key the limiter token was taken for
+                if charged_key != limited_key and not self.rate_limiter.acquire(charged_key):
+                    self.logger.error("All API keys have used their daily request budget")
                     return None
                 
-                response = self.model.generate_content(prompt, **kwargs)
+                with self._call_slots:
+                    response = model.generate_content(prompt, **kwargs)
+                
+                if cache_key:
+                    self._cache_response(cache_key, response)
+                
                 return response
                 
             except Exception as e:
-                result = self._handle_api_error(e)
+                with self._key_lock:
+                    result = self._handle_api_error(e)
                 
                 if result is True:
                     # Rate limit error, but successfully rotated to new key
@@ -105,6 +182,44 @@ class GeminiService:
         self.logger.error(f"Max retries ({max_retries}) reached for API call")
         return None
 
+    def _wait_for_rate_limit(self):
+        """Block until the current key has rate limit budget, rotating keys whose daily budget is spent
+        
+        Returns the key a token was taken for, or None when every key's budget is spent.
+        """
+        for _ in range(len(self.api_key_manager.api_keys)):
+            with self._key_lock:
+                current_key = self.api_key_manager.get_current_key()
+                
+            if self.rate_limiter.acquire(current_key):
+                return current_key
+            
+            self.logger.warning("Current API key has used its daily request budget")
+            with self._key_lock:
+                # Another thread may already have rotated away from this key
+                if self.api_key_manager.get_current_key() == current_key:
+                    if not self.api_key_manager.rotate_key():
+                        return None
+                    self.setup_gemini()
+                    
+        return None
+
+    def _debug_file(self, name: str, job_details: dict) -> Path:
+        """Debug file path, prefixed with the job ID so jobs optimized at the same time don't overwrite each other"""
+        job_id = re.sub(r'[^\w-]', '_', str(job_details.get('job_id') or ''))
+        return self.debug_dir / (f"{job_id}_{name}" if job_id else name)
+
+    def _cache_response(self, cache_key, response):
+        """Store a successful response's text in the cache"""
+        try:
+            text = response.text
+        except Exception:
+            # Blocked or empty candidates have no text to cache
+            return
+        
+        if text and text.strip():
+            self.response_cache.set(cache_key, text, self.model_name)
+
     def optimize_resume_section(self, section_name: str, current_content, job_details: dict):
         """Main method to optimize a resume section based on job details - updated for v2 format"""
         try:
@@ -121,7 +236,7 @@ class GeminiService:
                 return current_content
             
             # Save the prompt for debugging
-            with open(self.debug_dir / f"{section_name}_prompt.txt", 'w', encoding='utf-8') as f:
+            with open(self._debug_file(f"{section_name}_prompt.txt", job_details), 'w', encoding='utf-8') as f:
                 f.write(prompt)
                 
             # Get response from Gemini with API key rotation
@@ -140,7 +255,7 @@ class GeminiService:
                 return current_content
             
             # Save the raw response for debugging
-            with open(self.debug_dir / f"{section_name}_response.txt", 'w', encoding='utf-8') as f:
+            with open(self._debug_file(f"{section_name}_response.txt", job_details), 'w', encoding='utf-8') as f:
                 f.write(response.text)
                 
             # Process the response based on section type (updated for v2)
@@ -152,7 +267,7 @@ class GeminiService:
                 updated_content = current_content
                 
             # Save the processed content for debugging
-            with open(self.debug_dir / f"{section_name}_processed.json", 'w', encoding='utf-8') as f:
+            with open(self._debug_file(f"{section_name}_processed.json", job_details), 'w', encoding='utf-8') as f:
                 json.dump(updated_content, f, indent=2)
             
             # Compare original and updated content
@@ -170,6 +285,180 @@ class GeminiService:
             self.logger.error(f"Error optimizing {section_name}: {str(e)}")
             return current_content
     
+    def optimize_resume_sections(self, sections: dict, job_details: dict) -> dict:
+        """Optimize several resume sections with one batched prompt.
+        
+        Sections the response returns unchanged keep their original content. Sections
+        missing from the response, or without the shape the per-section path parses,
+        are re-optimized individually with optimize_resume_section.
+        """
+        batch_sections = {name: content for name, content in sections.items() if name in self.BATCHABLE_SECTIONS}
+        results = {name: content for name, content in sections.items() if name not in batch_sections}
+        if not batch_sections:
+            return results
+        
+        batched = {}
+        try:
+            prompt = self._create_batched_resume_prompt(batch_sections, job_details)
+            
+            # Save the prompt for debugging
+            with open(self._debug_file("batched_resume_prompt.txt", job_details), 'w', encoding='utf-8') as f:
+                f.write(prompt)
+            
+            response = self.make_api_call(
+                prompt,
+                generation_config=genai.GenerationConfig(
+                    temperature=0.1,
+                    top_p=1,
+                    top_k=1,
+                    max_output_tokens=8192,
+                )
+            )
+            
+            if response and hasattr(response, 'text') and response.text.strip():
+                # Save the raw response for debugging
+                with open(self._debug_file("batched_resume_response.txt", job_details), 'w', encoding='utf-8') as f:
+                    f.write(response.text)
+                batched = self._parse_batched_response(response.text)
+            else:
+                self.logger.warning("No response received for batched resume optimization")
+        except Exception as e:
+            self.logger.error(f"Error in batched resume optimization: {str(e)}")
+        
+        # Validate each section and queue the ones that need the per-section path
+        fallbacks = []
+        for section_name, current_content in batch_sections.items():
+            if section_name == 'professional_experience':
+                results[section_name] = list(current_content)
+                returned_jobs = batched.get(section_name)
+                if not isinstance(returned_jobs, list):
+                    returned_jobs = []
+                
+                # Only the first 3 jobs are optimized, matching _optimize_work_experience
+                for i, job in enumerate(current_content[:3]):
+                    returned_job = returned_jobs[i] if i < len(returned_jobs) else None
+                    if self._is_complete_section(section_name, returned_job, job):
+                        # Unchanged jobs come back as the original
+                        results[section_name][i] = self._process_work_experience_response(json.dumps(returned_job), job)
+                    else:
+                        fallbacks.append((section_name, i, job))
+                continue
+            
+            returned_content = batched.get(section_name)
+            if not self._is_complete_section(section_name, returned_content, current_content):
+                fallbacks.append((section_name, None, current_content))
+                continue
+            
+            section_json = json.dumps(returned_content)
+            if section_name == 'professional_summary':
+                results[section_name] = self._process_professional_summary_response(section_json, current_content)
+            else:
+                results[section_name] = self._process_core_competencies_response(section_json, current_content)
+        
+        if fallbacks:
+            self.logger.info(f"Batched response incomplete, re-optimizing {len(fallbacks)} part(s) individually")
+            
+            def run_fallback(fallback):
+                section_name, index, content = fallback
+                if index is None:
+                    return self.optimize_resume_section(section_name, content, job_details)
+                return self._optimize_single_job(index, content, job_details)
+            
+            if self.concurrent_mode and len(fallbacks) > 1:
+                with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(fallbacks))) as executor:
+                    fallback_results = list(executor.map(run_fallback, fallbacks))
+            else:
+                fallback_results = [run_fallback(fallback) for fallback in fallbacks]
+            
+            for (section_name, index, _), updated in zip(fallbacks, fallback_results):
+                if index is None:
+                    results[section_name] = updated
+                else:
+                    results[section_name][index] = updated
+        else:
+            self.logger.info("Successfully optimized all sections with a single batched request")
+        
+        return results
+    
+    def _is_complete_section(self, section_name, content, original_content):
+        """Whether a section (or one professional_experience job) from the batched response
+        has the fields its _process_*_response method needs"""
+        if not isinstance(content, dict):
+            return False
+        if section_name == 'professional_summary':
+            return all(field in content for field in ('title_experience', 'track_record', 'expertise', 'core_value'))
+        if section_name == 'core_competencies':
+            return any(category in original_content and isinstance(skills, list) for category, skills in content.items())
+        return all(field in content for field in ('company', 'location', 'position', 'duration'))
+    
+    def _create_batched_resume_prompt(self, sections, job_details):
+        """Create a single prompt covering every batchable resume section"""
+        skills_str = ', '.join(job_details.get('skills', []))
+        
+        payload = {}
+        instructions = []
+        if 'professional_summary' in sections:
+            payload['professional_summary'] = sections['professional_summary']
+            instructions.append(
+                '"professional_summary": keep the same 4 fields "title_experience", "track_record", "expertise", "core_value". '
+                'Keep the "Senior SDET with 10+ years" opening format in title_experience and preserve percentages and numbers in track_record.'
+            )
+        if 'core_competencies' in sections:
+            payload['core_competencies'] = sections['core_competencies']
+            instructions.append(
+                '"core_competencies": keep exactly the same categories, each a list of skills. '
+                'Do not remove important skills but add any relevant ones that are missing.'
+            )
+        if 'professional_experience' in sections:
+            payload['professional_experience'] = sections['professional_experience'][:3]
+            instructions.append(
+                '"professional_experience": return the same number of jobs in the same order with the exact same structure. '
+                'Keep company, location, position and duration unchanged. The "environment" field must ONLY be a '
+                'comma-separated list of technical tools and technologies, with no narrative text.'
+            )
+        
+        instruction_lines = '\n        '.join(f"- {line}" for line in instructions)
+        
+        prompt = f"""
+        I need you to optimize several sections of a resume for the following job in one pass.
+
+        Current Resume Sections:
+        {json.dumps(payload, indent=2)}
+        
+        Job Details:
+        Title: {job_details.get('title', '')}
+        Skills Required: {skills_str}
+        Description: {job_details.get('description', '')}
+
+        Instructions:
+        1. Return a single JSON object with exactly these top-level keys: {', '.join(payload.keys())}
+        2. Optimize every section to emphasize relevance to the job description
+        3. Use ** to highlight key terms relevant to the job (Example: **automation testing**)
+        4. Maintain the professional tone and specific metrics where they exist
+        5. Section-specific rules:
+        {instruction_lines}
+        
+        IMPORTANT: Return ONLY the JSON object, no other explanation or text before or after it.
+        """
+        
+        return prompt
+    
+    def _parse_batched_response(self, response_text):
+        """Parse the batched response into a dict of sections, or an empty dict on failure"""
+        for clean in (False, True):
+            try:
+                candidate = self._clean_json_string(response_text) if clean else response_text
+                json_match = re.search(r'\{[\s\S]*\}', candidate)
+                if json_match:
+                    content = json.loads(json_match.group(0))
+                    if isinstance(content, dict):
+                        return content
+            except Exception:
+                continue
+        
+        self.logger.warning("Could not parse batched resume response as JSON")
+        return {}
+    
     def _normalize_content(self, content):
         """Normalize content for comparison by removing formatting markers"""
         if isinstance(content, list):
@@ -506,50 +795,18 @@ class GeminiService:
     def _optimize_work_experience(self, experiences, job_details):
         """Optimize work experience entries - updated for v2 format"""
         try:
-            result = []
-            
             # Only process the first 3 jobs to avoid API limits
-            for i, job in enumerate(experiences[:3]):
-                self.logger.info(f"Optimizing job {i+1}: {job['company']}")
-                
-                # Create a prompt specific to this job (updated for v2)
-                prompt = self._create_work_experience_prompt(job, job_details)
-                
-                # Save the prompt for debugging
-                with open(self.debug_dir / f"job_{i+1}_prompt.txt", 'w', encoding='utf-8') as f:
-                    f.write(prompt)
-                
-                # Get response from Gemini with API key rotation
-                response = self.make_api_call(
-                    prompt,
-                    generation_config=genai.GenerationConfig(
-                        temperature=0.1,
-                        top_p=1,
-                        top_k=1,
-                        max_output_tokens=4000,
-                    )
-                )
-                
-                if not response or not hasattr(response, 'text') or not response.text.strip():
-                    self.logger.warning(f"No response received for job {i+1}")
-                    result.append(job)
-                    continue
-                
-                # Save the raw response for debugging
-                with open(self.debug_dir / f"job_{i+1}_response.txt", 'w', encoding='utf-8') as f:
-                    f.write(response.text)
-                
-                # Process the response to extract the updated job (updated for v2)
-                updated_job = self._process_work_experience_response(response.text, job)
-                
-                # Save the processed job for debugging
-                with open(self.debug_dir / f"job_{i+1}_processed.json", 'w', encoding='utf-8') as f:
-                    json.dump(updated_job, f, indent=2)
-                
-                result.append(updated_job)
-                
-                # Delay to avoid rate limiting
-                time.sleep(2)
+            jobs_to_optimize = experiences[:3]
+            
+            if self.concurrent_mode and len(jobs_to_optimize) > 1:
+                # Each job is an independent prompt, so they can run in parallel
+                with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(jobs_to_optimize))) as executor:
+                    result = list(executor.map(
+                        lambda indexed_job: self._optimize_single_job(indexed_job[0], indexed_job[1], job_details),
+                        enumerate(jobs_to_optimize)
+                    ))
+            else:
+                result = [self._optimize_single_job(i, job, job_details) for i, job in enumerate(jobs_to_optimize)]
                 
             # Add any remaining jobs unchanged
             result.extend(experiences[3:])
@@ -560,6 +817,50 @@ class GeminiService:
         except Exception as e:
             self.logger.error(f"Error optimizing work experience: {str(e)}")
             return experiences
+    
+    def _optimize_single_job(self, i, job, job_details):
+        """Optimize a single work experience entry, returning the original on failure"""
+        try:
+            self.logger.info(f"Optimizing job {i+1}: {job['company']}")
+            
+            # Create a prompt specific to this job (updated for v2)
+            prompt = self._create_work_experience_prompt(job, job_details)
+            
+            # Save the prompt for debugging
+            with open(self._debug_file(f"job_{i+1}_prompt.txt", job_details), 'w', encoding='utf-8') as f:
+                f.write(prompt)
+            
+            # Get response from Gemini with API key rotation
+            response = self.make_api_call(
+                prompt,
+                generation_config=genai.GenerationConfig(
+                    temperature=0.1,
+                    top_p=1,
+                    top_k=1,
+                    max_output_tokens=4000,
+                )
+            )
+            
+            if not response or not hasattr(response, 'text') or not response.text.strip():
+                self.logger.warning(f"No response received for job {i+1}")
+                return job
+            
+            # Save the raw response for debugging
+            with open(self._debug_file(f"job_{i+1}_response.txt", job_details), 'w', encoding='utf-8') as f:
+                f.write(response.text)
+            
+            # Process the response to extract the updated job (updated for v2)
+            updated_job = self._process_work_experience_response(response.text, job)
+            
+            # Save the processed job for debugging
+            with open(self._debug_file(f"job_{i+1}_processed.json", job_details), 'w', encoding='utf-8') as f:
+                json.dump(updated_job, f, indent=2)
+            
+            return updated_job
+            
+        except Exception as e:
+            self.logger.error(f"Error optimizing job {i+1}: {str(e)}")
+            return job
             
     def _create_work_experience_prompt(self, current_content, job_details):
         """Create prompt for work experience optimization with FIXED environment section handling"""
@@ -843,7 +1144,7 @@ class GeminiService:
             """
 
             # Save the prompt for debugging
-            with open(self.debug_dir / "cover_letter_prompt.txt", 'w', encoding='utf-8') as f:
+            with open(self._debug_file("cover_letter_prompt.txt", job_details), 'w', encoding='utf-8') as f:
                 f.write(prompt)
 
             # Use the API key rotation mechanism
@@ -859,7 +1160,7 @@ class GeminiService:
             
             if response and hasattr(response, 'text'):
                 # Save the raw response for debugging
-                with open(self.debug_dir / "cover_letter_response.txt", 'w', encoding='utf-8') as f:
+                with open(self._debug_file("cover_letter_response.txt", job_details), 'w', encoding='utf-8') as f:
                     f.write(response.text)
 
                 # Clean and format the cover letter
@@ -876,7 +1177,7 @@ class GeminiService:
                 cover_letter = re.sub(r'\n{3,}', '\n\n', cover_letter)
                 
                 # Save the processed cover letter for debugging
-                with open(self.debug_dir / "cover_letter_processed.txt", 'w', encoding='utf-8') as f:
+                with open(self._debug_file("cover_letter_processed.txt", job_details), 'w', encoding='utf-8') as f:
                     f.write(cover_letter)
                 
                 return cover_letter
@@ -1254,6 +1555,12 @@ class GeminiService:
         """Get current API usage statistics"""
         return self.api_key_manager.get_usage_stats()
         
+    def get_cache_stats(self):
+        """Get response cache statistics"""
+        if not self.response_cache:
+            return {}
+        return self.response_cache.get_stats()
+        
     def are_all_keys_exhausted(self):
         """Check if all API keys have reached their daily limit"""
         return self.api_key_manager.all_keys_exhausted()
@@ -1263,6 +1570,7 @@ class GeminiService:
         try:
             response = self.make_api_call(
                 "Hello, this is a connection test",
+                use_cache=False,
                 generation_config=genai.GenerationConfig(
                     temperature=0.1,
                     max_output_tokens=10,
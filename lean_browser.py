@@ -0,0 +1,126 @@
+import logging
+from typing import Dict, Iterable, List
+
+from devtools import enable_performance_log, read_performance_log
+
+# File extensions per resource type. Network.setBlockedURLs only matches URLs, so
+# resource types are blocked through their file extensions.
+RESOURCE_TYPE_EXTENSIONS = {
+    'image': ['png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'ico'],
+    'font': ['woff', 'woff2', 'ttf', 'otf', 'eot'],
+    'media': ['mp4', 'webm', 'mp3', 'ogg', 'wav']
+}
+
+
+def extension_patterns(extension: str) -> List[str]:
+    """URL patterns for paths ending in the extension, with or without a query string
+
+    Anchored to the end of the path so hosts and directories such as cdn.iconify...
+    or /ogg-player/ are not matched.
+    """
+    return [f"*.{extension}", f"*.{extension}?*"]
+
+
+RESOURCE_TYPE_PATTERNS = {
+    resource_type: [pattern for extension in extensions for pattern in extension_patterns(extension)]
+    for resource_type, extensions in RESOURCE_TYPE_EXTENSIONS.items()
+}
+
+# Rough transfer size of a blocked request by CDP resource type, used to estimate bytes saved
+ESTIMATED_BYTES = {
+    'Image': 25_000,
+    'Font': 40_000,
+    'Media': 500_000,
+    'Script': 60_000,
+    'XHR': 5_000,
+    'Fetch': 5_000,
+    'Other': 10_000
+}
+
+# Chrome switches that cut background work in a browser that only runs the bot
+LEAN_CHROME_ARGUMENTS = [
+    '--disable-background-networking',
+    '--disable-default-apps',
+    '--disable-sync',
+    '--disable-component-update',
+    '--mute-audio'
+]
+
+
+class RequestBlocker:
+    """Lean browser mode: block non-essential requests over CDP and count what was saved
+
+    configure() must run on the Options before Chrome starts (eager page loads and
+    performance logging); install() runs on the started driver. collect() reads
+    the DevTools network events since the last call and updates the counters.
+    """
+
+    def __init__(self, blocked_urls: Iterable[str], blocked_types: Iterable[str] = ()):
+        self.blocked_urls: List[str] = list(blocked_urls)
+        for resource_type in blocked_types:
+            self.blocked_urls.extend(RESOURCE_TYPE_PATTERNS.get(resource_type, []))
+
+        self.requests_blocked: Dict[str, int] = {}
+        self.requests_loaded = 0
+        self.bytes_loaded = 0
+        self._request_types: Dict[str, str] = {}
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def configure(options) -> None:
+        """Set eager page loads, lean Chrome switches and the DevTools performance log"""
+        options.page_load_strategy = 'eager'
+        for argument in LEAN_CHROME_ARGUMENTS:
+            options.add_argument(argument)
+        enable_performance_log(options)
+
+    def install(self, driver) -> None:
+        """Turn on request blocking for the browser session"""
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_urls})
+        self.logger.info(f"Lean mode: blocking {len(self.blocked_urls)} URL patterns")
+
+    def collect(self, driver) -> List[Dict]:
+        """Read the network events logged since the last call, count them and return them"""
+        events = read_performance_log(driver)
+        for event in events:
+            self._count(event)
+        return events
+
+    def _count(self, event: Dict) -> None:
+        method = event.get('method')
+        params = event.get('params', {})
+        request_id = params.get('requestId')
+
+        if method == 'Network.requestWillBeSent':
+            self._request_types[request_id] = params.get('type', 'Other')
+        elif method == 'Network.loadingFinished':
+            self.requests_loaded += 1
+            self.bytes_loaded += int(params.get('encodedDataLength', 0))
+            self._request_types.pop(request_id, None)
+        elif method == 'Network.loadingFailed':
+            resource_type = params.get('type') or self._request_types.get(request_id, 'Other')
+            self._request_types.pop(request_id, None)
+            if params.get('blockedReason'):
+                self.requests_blocked[resource_type] = self.requests_blocked.get(resource_type, 0) + 1
+
+    def merge(self, other: 'RequestBlocker') -> None:
+        """Add another browser's counters to these, for pool runs"""
+        for resource_type, count in other.requests_blocked.items():
+            self.requests_blocked[resource_type] = self.requests_blocked.get(resource_type, 0) + count
+        self.requests_loaded += other.requests_loaded
+        self.bytes_loaded += other.bytes_loaded
+
+    def get_stats(self) -> Dict:
+        """Requests blocked (by resource type), estimated bytes saved and what was actually loaded"""
+        bytes_saved = sum(
+            count * ESTIMATED_BYTES.get(resource_type, ESTIMATED_BYTES['Other'])
+            for resource_type, count in self.requests_blocked.items()
+        )
+        return {
+            'requests_blocked': sum(self.requests_blocked.values()),
+            'blocked_by_type': dict(self.requests_blocked),
+            'estimated_bytes_saved': bytes_saved,
+            'requests_loaded': self.requests_loaded,
+            'bytes_loaded': self.bytes_loaded
+        }
@@ -4,6 +4,8 @@ from pathlib import Path
 from datetime import datetime
 import json
 
+from event_bus import EventBusHandler
+
 class DashboardLogger:
     """
     Custom logger for SmartApplyPro that writes to both console and log files
@@ -39,6 +41,12 @@ class DashboardLogger:
         file_handler.setFormatter(file_formatter)
         self.logger.addHandler(file_handler)
         
+        # Announce new bot.log lines to dashboard streams (added after the file handler so the line is on disk)
+        stream_handler = EventBusHandler('bot.log')
+        stream_handler.setLevel(logging.DEBUG)
+        stream_handler.setFormatter(file_formatter)
+        self.logger.addHandler(stream_handler)
+        
         # File handler for errors only
         error_log_file = self.log_dir / 'errors.log'
         error_handler = logging.FileHandler(error_log_file, encoding='utf-8')
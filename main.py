@@ -116,7 +116,11 @@ def monitor_api_usage():
         if gemini.are_all_keys_exhausted():
             print("\n⚠️ WARNING: All API keys have reached their daily limit!")
             print("Please try again tomorrow or add new API keys to config.py.")
-        
+
+        cache_stats = gemini.get_cache_stats()
+        if cache_stats:
+            print(f"\nResponse cache: {cache_stats['entries']} entries ({cache_stats['size_mb']:.1f} MB)")
+
     except Exception as e:
         print(f"\nError monitoring API usage: {str(e)}")
 
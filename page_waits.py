@@ -0,0 +1,205 @@
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
+
+from selenium.common.exceptions import StaleElementReferenceException, TimeoutException
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import WebDriverWait
+
+# Selectors for dialogs and modals used by the Dice apply flow
+MODAL_SELECTORS = [
+    "div[role='dialog']",
+    ".modal-content",
+    ".fsp-modal__body",
+    ".file-picker-modal"
+]
+
+# The Filestack picker opened for resume and cover letter uploads
+FILE_PICKER_SELECTORS = [".fsp-modal__body", ".file-picker-modal"]
+
+# Counts fetch/XHR requests still in flight; installed once per document
+NETWORK_TRACKER_SCRIPT = r"""
+if (!window.__networkTracker) {
+    const tracker = {pending: 0, lastActivity: Date.now()};
+    const started = () => { tracker.pending++; tracker.lastActivity = Date.now(); };
+    const finished = () => { tracker.pending = Math.max(0, tracker.pending - 1); tracker.lastActivity = Date.now(); };
+
+    const originalFetch = window.fetch;
+    if (originalFetch) {
+        window.fetch = function() {
+            started();
+            return originalFetch.apply(this, arguments).finally(finished);
+        };
+    }
+    const originalSend = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function() {
+        started();
+        this.addEventListener('loadend', finished, {once: true});
+        return originalSend.apply(this, arguments);
+    };
+    window.__networkTracker = tracker;
+}
+"""
+
+# Idle once no tracked requests are pending and no resource finished loading for idleMs
+NETWORK_IDLE_SCRIPT = r"""
+const idleMs = arguments[0];
+const tracker = window.__networkTracker;
+if (!tracker || document.readyState !== 'complete') {
+    return false;
+}
+const resources = performance.getEntriesByType('resource').length;
+if (resources !== tracker.resources) {
+    tracker.resources = resources;
+    tracker.lastActivity = Date.now();
+}
+return tracker.pending === 0 && Date.now() - tracker.lastActivity >= idleMs;
+"""
+
+# Truthy once the host element's shadow root has content (optionally a matching child)
+SHADOW_ROOT_SCRIPT = r"""
+const host = document.querySelector(arguments[0]);
+if (!host || !host.shadowRoot) {
+    return false;
+}
+const child = arguments[1];
+if (child) {
+    return !!host.shadowRoot.querySelector(child);
+}
+return host.shadowRoot.childElementCount > 0;
+"""
+
+Target = Union[tuple, Any]
+
+
+class PageWaiter:
+    """Named wait conditions over a WebDriver with timeouts and timing records
+
+    Each wait polls its condition until it holds or the timeout runs out. Waits
+    return the condition's value, or None on timeout (they never raise), so they
+    can stand in for fixed sleeps without changing what the caller does next.
+    Every wait's duration is recorded under its name; see get_stats().
+    """
+
+    def __init__(self, driver, default_timeout: float = 15, poll_frequency: float = 0.2):
+        self.driver = driver
+        self.default_timeout = default_timeout
+        self.poll_frequency = poll_frequency
+        self.timings: Dict[str, List[float]] = {}
+        self.timeouts: Dict[str, int] = {}
+        self.logger = logging.getLogger(__name__)
+
+    def until(self, name: str, condition: Callable, timeout: Optional[float] = None) -> Any:
+        """Wait for `condition(driver)` to return a truthy value and record how long it took"""
+        timeout = self.default_timeout if timeout is None else timeout
+        start = time.monotonic()
+        try:
+            # Elements re-rendered while polling are just re-checked on the next poll
+            result = WebDriverWait(
+                self.driver, timeout, poll_frequency=self.poll_frequency,
+                ignored_exceptions=(StaleElementReferenceException,)
+            ).until(condition)
+        except TimeoutException:
+            self.timeouts[name] = self.timeouts.get(name, 0) + 1
+            result = None
+
+        elapsed = time.monotonic() - start
+        self.timings.setdefault(name, []).append(elapsed)
+        if result is None:
+            self.logger.debug(f"Wait '{name}' timed out after {elapsed:.2f}s")
+        else:
+            self.logger.debug(f"Wait '{name}' satisfied after {elapsed:.2f}s")
+        return result
+
+    @staticmethod
+    def _locator(target: Target):
+        """Accept a (By, value) locator, a CSS selector string or a WebElement"""
+        if isinstance(target, str):
+            return (By.CSS_SELECTOR, target)
+        return target
+
+    def element_present(self, target: Target, timeout: Optional[float] = None):
+        """Wait for an element to be in the DOM and return it"""
+        return self.until('element present', EC.presence_of_element_located(self._locator(target)), timeout)
+
+    def element_clickable(self, target: Target, timeout: Optional[float] = None):
+        """Wait for an element (locator or WebElement) to be visible and enabled and return it"""
+        return self.until('element clickable', EC.element_to_be_clickable(self._locator(target)), timeout)
+
+    def document_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait for document.readyState to be 'complete'"""
+        return self.until(
+            'document ready',
+            lambda d: d.execute_script("return document.readyState") == "complete",
+            timeout
+        ) is not None
+
+    def shadow_root_populated(self, host_selector: str, child_selector: Optional[str] = None,
+                              timeout: Optional[float] = None) -> bool:
+        """Wait for a web component's shadow root to render (optionally a specific child)"""
+        return self.until(
+            'shadow root populated',
+            lambda d: d.execute_script(SHADOW_ROOT_SCRIPT, host_selector, child_selector),
+            timeout
+        ) is not None
+
+    def network_idle(self, idle_ms: int = 500, timeout: Optional[float] = 10) -> bool:
+        """Wait until no fetch/XHR is in flight and no resource loaded for `idle_ms`"""
+        def idle(driver):
+            driver.execute_script(NETWORK_TRACKER_SCRIPT)
+            return driver.execute_script(NETWORK_IDLE_SCRIPT, idle_ms)
+
+        return self.until('network idle', idle, timeout) is not None
+
+    def modal_open(self, selectors: Sequence[str] = MODAL_SELECTORS, timeout: Optional[float] = None):
+        """Wait for any of the dialog selectors to be present; returns (element, selector)"""
+        def opened(driver):
+            for selector in selectors:
+                elements = driver.find_elements(By.CSS_SELECTOR, selector)
+                if elements:
+                    return elements[0], selector
+            return False
+
+        return self.until('modal open', opened, timeout)
+
+    def modal_closed(self, selectors: Sequence[str] = MODAL_SELECTORS, timeout: Optional[float] = None) -> bool:
+        """Wait for all of the dialog selectors to be gone or hidden"""
+        def closed(driver):
+            for selector in selectors:
+                if any(element.is_displayed() for element in driver.find_elements(By.CSS_SELECTOR, selector)):
+                    return False
+            return True
+
+        return self.until('modal closed', closed, timeout) is not None
+
+    def new_window(self, known_handles: Sequence[str], timeout: Optional[float] = None) -> Optional[str]:
+        """Wait for a window that isn't in `known_handles` and return its handle"""
+        def opened(driver):
+            for handle in driver.window_handles:
+                if handle not in known_handles:
+                    return handle
+            return False
+
+        return self.until('new window', opened, timeout)
+
+    def url_matches(self, predicate: Callable[[str], bool], timeout: Optional[float] = None) -> Optional[str]:
+        """Wait for the current URL to satisfy `predicate` and return it"""
+        def matches(driver):
+            url = driver.current_url
+            return url if predicate(url) else False
+
+        return self.until('url matches', matches, timeout)
+
+    def get_stats(self) -> Dict[str, Dict]:
+        """Get per-condition counts, total/average/max seconds waited and timeouts"""
+        stats = {}
+        for name, durations in self.timings.items():
+            stats[name] = {
+                'count': len(durations),
+                'total_seconds': sum(durations),
+                'average_seconds': sum(durations) / len(durations),
+                'max_seconds': max(durations),
+                'timeouts': self.timeouts.get(name, 0)
+            }
+        return stats
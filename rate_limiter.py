@@ -0,0 +1,144 @@
+import hashlib
+import json
+import logging
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from file_utils import FileLock, FileLockTimeout, atomic_write_json
+
+
+class RateLimiter:
+    """Token-bucket rate limiter per API key with per-minute and per-day budgets.
+
+    Bucket state lives in a small JSON file guarded by a FileLock, so every thread
+    and every process (dashboard-launched bot, CLI runs of main.py) draws from the
+    same budget. The bucket holds up to `burst` tokens and refills at
+    (requests_per_minute - burst) per minute, which keeps any 60 second window at
+    or below requests_per_minute even when the bucket starts full.
+    """
+
+    def __init__(self, state_file: Path, requests_per_minute: int, requests_per_day: int,
+                 burst: int = 1):
+        self.state_file = Path(state_file)
+        self.lock = FileLock(self.state_file.with_suffix('.lock'))
+        self.requests_per_minute = max(1, requests_per_minute)
+        self.requests_per_day = requests_per_day
+        self.burst = min(max(1, burst), self.requests_per_minute)
+        self.refill_per_second = max(self.requests_per_minute - self.burst, 1) / 60.0
+
+        self.logger = logging.getLogger(__name__)
+        self.state_file.parent.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def _key_id(api_key: str) -> str:
+        """Identify a key in the state file without storing the key itself"""
+        return hashlib.sha256(api_key.encode('utf-8')).hexdigest()[:16]
+
+    def _read_state(self) -> Dict:
+        try:
+            with open(self.state_file, 'r') as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            self.logger.warning(f"Resetting unreadable rate limit state: {e}")
+            return {}
+
+    def _write_state(self, state: Dict) -> None:
+        atomic_write_json(self.state_file, state)
+
+    def _refilled_bucket(self, state: Dict, key_id: str, now: float) -> Dict:
+        """Return the key's bucket with tokens refilled and the daily count reset on a new day"""
+        today = datetime.now().strftime("%Y-%m-%d")
+        bucket = state.get(key_id) or {
+            'tokens': float(self.burst),
+            'updated': now,
+            'date': today,
+            'day_count': 0
+        }
+
+        elapsed = max(0.0, now - bucket.get('updated', now))
+        bucket['tokens'] = min(float(self.burst), bucket.get('tokens', 0.0) + elapsed * self.refill_per_second)
+        bucket['updated'] = now
+
+        if bucket.get('date') != today:
+            bucket['date'] = today
+            bucket['day_count'] = 0
+
+        return bucket
+
+    def try_acquire(self, api_key: str) -> Tuple[bool, float]:
+        """Take one token for the key if available.
+
+        Returns:
+            (True, 0) when a token was taken, (False, seconds_to_wait) when the
+            per-minute budget is empty, and (False, -1) when the daily budget is spent.
+        """
+        key_id = self._key_id(api_key)
+        with self.lock:
+            now = time.time()
+            state = self._read_state()
+            bucket = self._refilled_bucket(state, key_id, now)
+
+            # Refills are recomputed from timestamps, so only taking a token needs a write
+            if self.requests_per_day and bucket['day_count'] >= self.requests_per_day:
+                return False, -1
+
+            if bucket['tokens'] >= 1.0:
+                bucket['tokens'] -= 1.0
+                bucket['day_count'] += 1
+                state[key_id] = bucket
+                self._write_state(state)
+                return True, 0
+
+            return False, (1.0 - bucket['tokens']) / self.refill_per_second
+
+    def acquire(self, api_key: str, timeout: Optional[float] = None) -> bool:
+        """Block until the key has a token. Returns False if the daily budget is spent or on timeout."""
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        while True:
+            try:
+                acquired, wait_time = self.try_acquire(api_key)
+            except FileLockTimeout as e:
+                self.logger.warning(f"Rate limit state is locked, retrying: {e}")
+                acquired, wait_time = False, 1.0
+
+            if acquired:
+                return True
+            if wait_time < 0:
+                return False
+
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                wait_time = min(wait_time, remaining)
+
+            self.logger.debug(f"Rate limit reached, waiting {wait_time:.1f}s for the next token")
+            # Re-check at least once a second so tokens freed by other processes are noticed
+            time.sleep(min(max(wait_time, 0.05), 1.0))
+
+    def drain(self, api_key: str) -> None:
+        """Empty the key's bucket, e.g. after the API reported a rate limit anyway"""
+        key_id = self._key_id(api_key)
+        with self.lock:
+            state = self._read_state()
+            bucket = self._refilled_bucket(state, key_id, time.time())
+            bucket['tokens'] = 0.0
+            state[key_id] = bucket
+            self._write_state(state)
+
+    def get_usage(self, api_key: str) -> Dict:
+        """Get the key's remaining tokens and today's request count"""
+        key_id = self._key_id(api_key)
+        with self.lock:
+            bucket = self._refilled_bucket(self._read_state(), key_id, time.time())
+
+        return {
+            'tokens': bucket['tokens'],
+            'requests_today': bucket['day_count'],
+            'daily_limit': self.requests_per_day
+        }
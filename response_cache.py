@@ -0,0 +1,221 @@
+import dataclasses
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Size eviction trims to this fraction of the limits, leaving room for writes before the next scan
+EVICT_TO_FRACTION = 0.9
+
+
+class CachedResponse:
+    """Minimal stand-in for a Gemini response that was served from the cache"""
+
+    def __init__(self, text: str):
+        self.text = text
+        self.from_cache = True
+
+
+class ResponseCache:
+    """Persistent content-addressed cache for Gemini responses with size and age eviction
+
+    An entry's mtime is its creation time, which the age limit applies to, and its
+    atime is its last use, which size eviction orders by. The cache directory is
+    only scanned when the estimated usage passes a limit or every `scan_every` writes.
+    """
+
+    def __init__(self, cache_dir: Path, max_entries: int = 2000,
+                 max_size_mb: float = 100, max_age_days: float = 7, scan_every: int = 100):
+        self.cache_dir = Path(cache_dir)
+        self.max_entries = max_entries
+        self.max_bytes = int(max_size_mb * 1024 * 1024)
+        self.max_age_seconds = max_age_days * 24 * 3600
+
+        self.logger = logging.getLogger(__name__)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        # Counters are per process; they are reported through get_stats()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+
+        # Usage estimated from the last scan plus this process's writes since then
+        self.scan_every = max(1, scan_every)
+        self._estimated_entries = None
+        self._estimated_bytes = 0
+        self._writes_since_scan = 0
+        self._evict_lock = threading.Lock()
+
+    @staticmethod
+    def make_key(prompt: Any, model_name: str, generation_config: Any = None) -> str:
+        """Build the cache key from the prompt, model name and generation config"""
+        payload = {
+            'model': model_name,
+            'prompt': prompt,
+            'generation_config': ResponseCache._config_to_dict(generation_config)
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode('utf-8')
+        return hashlib.sha256(encoded).hexdigest()
+
+    @staticmethod
+    def _config_to_dict(generation_config: Any) -> Optional[Dict]:
+        """Convert a GenerationConfig (dataclass, dict or object) into a plain dict"""
+        if generation_config is None:
+            return None
+        if dataclasses.is_dataclass(generation_config):
+            config = dataclasses.asdict(generation_config)
+        elif isinstance(generation_config, dict):
+            config = dict(generation_config)
+        else:
+            config = dict(vars(generation_config))
+        return {key: value for key, value in config.items() if value is not None}
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached response text for a key, or None on a miss"""
+        path = self._entry_path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+
+            if time.time() - entry.get('created', 0) > self.max_age_seconds:
+                self._remove(path)
+                with self._lock:
+                    self.misses += 1
+                    self.evictions += 1
+                return None
+
+            # Mark the use in atime so size eviction drops the least recently used
+            # entries first; mtime stays the creation time
+            os.utime(path, (time.time(), entry.get('created', 0)))
+            with self._lock:
+                self.hits += 1
+            return entry.get('text')
+
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.warning(f"Discarding unreadable cache entry {path.name}: {e}")
+            self._remove(path)
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, text: str, model_name: str = '') -> None:
+        """Store response text for a key and evict old entries if needed"""
+        path = self._entry_path(key)
+        temp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        created = time.time()
+        entry = {
+            'created': created,
+            'model': model_name,
+            'text': text
+        }
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f, ensure_ascii=False)
+            os.utime(temp_path, (created, created))
+            size = temp_path.stat().st_size
+            os.replace(temp_path, path)
+        except Exception as e:
+            self.logger.warning(f"Error writing cache entry: {e}")
+            self._remove(temp_path)
+            return
+
+        with self._lock:
+            self._writes_since_scan += 1
+            if self._estimated_entries is not None:
+                self._estimated_entries += 1
+                self._estimated_bytes += size
+            scan = (
+                self._estimated_entries is None
+                or self._writes_since_scan >= self.scan_every
+                or self._estimated_entries > self.max_entries
+                or self._estimated_bytes > self.max_bytes
+            )
+        if scan:
+            self._evict()
+
+    def _evict(self) -> None:
+        """Drop expired entries, then the least recently used ones over the size/count limits"""
+        # One scan at a time; a write arriving during a scan is counted by the next one
+        if not self._evict_lock.acquire(blocking=False):
+            return
+        try:
+            now = time.time()
+            evicted = 0
+            entries = []
+            for path in self.cache_dir.glob('*.json'):
+                try:
+                    stat = path.stat()
+                except FileNotFoundError:
+                    continue
+                if now - stat.st_mtime > self.max_age_seconds:
+                    self._remove(path)
+                    evicted += 1
+                    continue
+                entries.append((stat.st_atime, stat.st_size, path))
+
+            total_bytes = sum(size for _, size, _ in entries)
+            if len(entries) > self.max_entries or total_bytes > self.max_bytes:
+                max_entries = int(self.max_entries * EVICT_TO_FRACTION)
+                max_bytes = int(self.max_bytes * EVICT_TO_FRACTION)
+                entries.sort(key=lambda entry: entry[0])
+                while entries and (len(entries) > max_entries or total_bytes > max_bytes):
+                    _, size, path = entries.pop(0)
+                    self._remove(path)
+                    total_bytes -= size
+                    evicted += 1
+
+            with self._lock:
+                self.evictions += evicted
+                self._estimated_entries = len(entries)
+                self._estimated_bytes = total_bytes
+                self._writes_since_scan = 0
+        finally:
+            self._evict_lock.release()
+
+    def _remove(self, path: Path) -> None:
+        try:
+            path.unlink()
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.debug(f"Could not remove cache file {path}: {e}")
+
+    def clear(self) -> int:
+        """Remove every cached entry and return how many were deleted"""
+        removed = 0
+        for path in self.cache_dir.glob('*.json'):
+            self._remove(path)
+            removed += 1
+        return removed
+
+    def get_stats(self) -> Dict:
+        """Get hit/miss counters and current on-disk usage"""
+        entries = 0
+        total_bytes = 0
+        for path in self.cache_dir.glob('*.json'):
+            try:
+                total_bytes += path.stat().st_size
+                entries += 1
+            except FileNotFoundError:
+                continue
+
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': (self.hits / lookups) * 100 if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': entries,
+            'size_mb': total_bytes / (1024 * 1024)
+        }
@@ -1,8 +1,8 @@
 import json
 import logging
-import time
 import re
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, Optional, List, Union
 from docx import Document
@@ -46,40 +46,32 @@ class ResumeHandler:
                 'professional_experience'
             ]
             
-            for section_name in sections_to_process:
-                if section_name in resume_data:
-                    self.logger.info(f"Optimizing {section_name}...")
-                    try:
-                        # CRITICAL FIX: Store original content before optimization
-                        original_content = resume_data[section_name].copy() if isinstance(resume_data[section_name], dict) else resume_data[section_name][:]
-                        
-                        updated_section = self.gemini.optimize_resume_section(
-                            section_name,
-                            resume_data[section_name],
-                            job_details
-                        )
-                        
-                        if updated_section:
-                            # Deep comparison with original before replacing
-                            original_normalized = json.dumps(self._normalize_content(original_content), sort_keys=True)
-                            updated_normalized = json.dumps(self._normalize_content(updated_section), sort_keys=True)
-                            
-                            if original_normalized != updated_normalized:
-                                resume_data[section_name] = updated_section
-                                self.logger.info(f"Successfully updated {section_name} with meaningful changes")
-                            else:
-                                self.logger.warning(f"No significant changes detected for {section_name}")
-                                resume_data[section_name] = original_content
-                        else:
-                            self.logger.warning(f"No valid response for {section_name}, keeping original")
-                            resume_data[section_name] = original_content
-                            
-                    except Exception as e:
-                        self.logger.error(f"Error updating {section_name}: {str(e)}")
-                        resume_data[section_name] = original_content
-                    
-                    # Avoid rate limiting
-                    time.sleep(2)
+            sections_present = [name for name in sections_to_process if name in resume_data]
+            
+            if self.gemini.batch_mode and sections_present:
+                # One request for all sections; GeminiService falls back per section when needed
+                originals = {name: self._copy_section(resume_data[name]) for name in sections_present}
+                optimized = self.gemini.optimize_resume_sections(
+                    {name: resume_data[name] for name in sections_present},
+                    job_details
+                )
+                for section_name in sections_present:
+                    resume_data[section_name] = self._accept_section(
+                        section_name, originals[section_name], optimized.get(section_name)
+                    )
+            elif self.gemini.concurrent_mode and len(sections_present) > 1:
+                # Sections are independent prompts; GeminiService caps in-flight calls
+                # and spaces them out, so no fixed sleeps are needed between sections
+                with ThreadPoolExecutor(max_workers=len(sections_present)) as executor:
+                    futures = {
+                        section_name: executor.submit(self._optimize_section, section_name, resume_data[section_name], job_details)
+                        for section_name in sections_present
+                    }
+                    for section_name, future in futures.items():
+                        resume_data[section_name] = future.result()
+            else:
+                for section_name in sections_present:
+                    resume_data[section_name] = self._optimize_section(section_name, resume_data[section_name], job_details)
             
             # VALIDATION: Ensure all required v2 sections are present
             required_sections = ['header', 'professional_summary', 'core_competencies', 'professional_experience', 'education']
@@ -92,22 +84,26 @@ class ResumeHandler:
             # Generate resume filename
             base_filename = self._create_professional_filename(job_details)
             
-            # Ensure filename is unique
-            resume_filename = self._ensure_unique_filename(base_filename, ".docx")
-            json_filename = self._ensure_unique_filename(base_filename, ".json")
-            
-            # Generate files
-            resume_path = RESUME_DIR / resume_filename
-            json_path = RESUME_DIR / json_filename
-            
-            # Save JSON for reference with UTF-8 encoding
-            with open(json_path, 'w', encoding='utf-8') as f:  # FIX: Explicit UTF-8 encoding
-                json.dump(resume_data, f, indent=2, ensure_ascii=False)
+            # Ensure filename is unique; the names are reserved as empty files until written
+            reserved = []
+            try:
+                resume_path = RESUME_DIR / self._ensure_unique_filename(base_filename, ".docx")
+                reserved.append(resume_path)
+                json_path = RESUME_DIR / self._ensure_unique_filename(base_filename, ".json")
+                reserved.append(json_path)
                 
-            # Convert to DOCX using updated ResumeConverter
-            converter = ResumeConverter()
-            converter.convert_resume(resume_data)
-            converter.save(str(resume_path))
+                # Save JSON for reference with UTF-8 encoding
+                with open(json_path, 'w', encoding='utf-8') as f:  # FIX: Explicit UTF-8 encoding
+                    json.dump(resume_data, f, indent=2, ensure_ascii=False)
+                    
+                # Convert to DOCX using updated ResumeConverter
+                converter = ResumeConverter()
+                converter.convert_resume(resume_data)
+                converter.save(str(resume_path))
+            except Exception:
+                # Don't leave empty or partial placeholders behind
+                self._remove_files(reserved)
+                raise
             
             self.logger.info(f"Resume saved to {resume_path}")
             return str(resume_path)
@@ -115,6 +111,56 @@ class ResumeHandler:
         except Exception as e:
             self.logger.error(f"Error generating resume: {str(e)}")
             return None
+    
+    def _remove_files(self, paths: List[Path]):
+        """Delete files reserved for output that was never written"""
+        for path in paths:
+            try:
+                path.unlink()
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                self.logger.warning(f"Could not remove {path.name}: {str(e)}")
+            
+    def _optimize_section(self, section_name: str, section_content, job_details: Dict):
+        """Optimize one resume section, returning the original content if nothing useful comes back"""
+        self.logger.info(f"Optimizing {section_name}...")
+        
+        # CRITICAL FIX: Store original content before optimization
+        original_content = self._copy_section(section_content)
+        
+        try:
+            updated_section = self.gemini.optimize_resume_section(
+                section_name,
+                section_content,
+                job_details
+            )
+            return self._accept_section(section_name, original_content, updated_section)
+                
+        except Exception as e:
+            self.logger.error(f"Error updating {section_name}: {str(e)}")
+            return original_content
+    
+    def _copy_section(self, section_content):
+        """Shallow copy of a section so the original survives optimization"""
+        return section_content.copy() if isinstance(section_content, dict) else section_content[:]
+    
+    def _accept_section(self, section_name: str, original_content, updated_section):
+        """Return the updated section if it differs meaningfully from the original"""
+        if updated_section:
+            # Deep comparison with original before replacing
+            original_normalized = json.dumps(self._normalize_content(original_content), sort_keys=True)
+            updated_normalized = json.dumps(self._normalize_content(updated_section), sort_keys=True)
+            
+            if original_normalized != updated_normalized:
+                self.logger.info(f"Successfully updated {section_name} with meaningful changes")
+                return updated_section
+            
+            self.logger.warning(f"No significant changes detected for {section_name}")
+        else:
+            self.logger.warning(f"No valid response for {section_name}, keeping original")
+            
+        return original_content
             
     def _normalize_content(self, content):
         """Normalize content for comparison by removing formatting markers"""
@@ -163,15 +209,21 @@ class ResumeHandler:
         return f"{role_type}_Resume_Inam_Haq"
         
     def _ensure_unique_filename(self, base_filename: str, extension: str) -> str:
-        """Ensure filename is unique by adding a counter if needed"""
+        """Ensure filename is unique by adding a counter if needed
+        
+        The name is reserved by creating the file exclusively, so resumes generated
+        concurrently for the same job title never get the same name.
+        """
         filename = f"{base_filename}{extension}"
         counter = 1
         
-        while (RESUME_DIR / filename).exists():
-            filename = f"{base_filename}_v{counter}{extension}"
-            counter += 1
-            
-        return filename
+        while True:
+            try:
+                with open(RESUME_DIR / filename, 'x'):
+                    return filename
+            except FileExistsError:
+                filename = f"{base_filename}_v{counter}{extension}"
+                counter += 1
 
 
 class ResumeConverter:
@@ -0,0 +1,168 @@
+import base64
+import json
+import logging
+from typing import Dict, Iterable, List, Optional
+from urllib.parse import urljoin
+
+from devtools import enable_performance_log
+
+# Keys the Dice search API has used for each record field, in order of preference
+ID_KEYS = ('guid', 'id', 'jobId')
+TITLE_KEYS = ('title', 'jobTitle')
+COMPANY_KEYS = ('companyName', 'company')
+LOCATION_KEYS = ('jobLocation', 'location', 'locations')
+URL_KEYS = ('detailsPageUrl', 'jobDetailUrl', 'url')
+EASY_APPLY_KEYS = ('easyApply', 'isEasyApply')
+APPLIED_KEYS = ('applied', 'isApplied', 'hasApplied')
+
+JOB_DETAIL_URL = "https://www.dice.com/job-detail/{}"
+
+
+def _first(item: Dict, keys: Iterable[str]):
+    for key in keys:
+        value = item.get(key)
+        if value not in (None, '', [], {}):
+            return value
+    return None
+
+
+def _flag(item: Dict, keys: Iterable[str]) -> Optional[bool]:
+    """A yes/no field, or None when the response doesn't carry it"""
+    for key in keys:
+        if item.get(key) is not None:
+            return bool(item[key])
+    return None
+
+
+def _name(value) -> str:
+    """A display string from a plain value, a {name/displayName} object or a list of them"""
+    if isinstance(value, list):
+        return _name(value[0]) if value else ''
+    if isinstance(value, dict):
+        return str(value.get('displayName') or value.get('name') or value.get('city') or '')
+    return str(value or '')
+
+
+def _is_job(item) -> bool:
+    return isinstance(item, dict) and bool(_first(item, TITLE_KEYS)) and bool(_first(item, ID_KEYS))
+
+
+def find_job_list(payload) -> Optional[List[Dict]]:
+    """Find the list of job objects in a search response, wherever it is nested"""
+    if isinstance(payload, list):
+        if payload and all(_is_job(item) for item in payload):
+            return payload
+        children = payload
+    elif isinstance(payload, dict):
+        children = payload.values()
+    else:
+        return None
+
+    for child in children:
+        found = find_job_list(child)
+        if found:
+            return found
+    return None
+
+
+def job_record(item: Dict) -> Dict:
+    """Turn one search API job into the record shape extract_card_records returns"""
+    job_id = str(_first(item, ID_KEYS))
+    title = str(_first(item, TITLE_KEYS))
+    company = _name(_first(item, COMPANY_KEYS))
+    url = urljoin(JOB_DETAIL_URL, _first(item, URL_KEYS) or JOB_DETAIL_URL.format(job_id))
+
+    return {
+        # No card element: the job is opened from its URL
+        'element': None,
+        'link': None,
+        'job_id': job_id,
+        'title': title,
+        'company': company,
+        'location': _name(_first(item, LOCATION_KEYS)),
+        'url': url,
+        # None when the response doesn't say: fill_unknown_flags takes the card's value
+        'easy_apply': _flag(item, EASY_APPLY_KEYS),
+        'applied': _flag(item, APPLIED_KEYS),
+        'text': f"{title} {company}"
+    }
+
+
+def fill_unknown_flags(records: List[Dict], card_records: List[Dict]) -> None:
+    """Fill easy_apply/applied the search response left as None from the page's job cards
+
+    Flags with no card to take them from stay None; callers treat that as unknown.
+    """
+    cards_by_id = {card.get('job_id'): card for card in card_records}
+    for record in records:
+        card = cards_by_id.get(record['job_id'])
+        if not card:
+            continue
+        for field in ('easy_apply', 'applied'):
+            if record[field] is None:
+                record[field] = bool(card.get(field))
+
+
+def has_unknown_flags(records: List[Dict]) -> bool:
+    return any(record['easy_apply'] is None or record['applied'] is None for record in records)
+
+
+class SearchResponseCapture:
+    """Reads search results from the JSON responses the results page fetches
+
+    Needs the DevTools performance log (configure()) and the Network domain
+    (install()). records_from_events() looks at the network events read since the
+    last call, fetches the bodies of matching JSON responses and returns one
+    record per job, or an empty list when the page made no such request.
+    """
+
+    def __init__(self, url_patterns: Iterable[str]):
+        self.url_patterns = list(url_patterns)
+        self.responses_captured = 0
+        self.logger = logging.getLogger(__name__)
+
+    @staticmethod
+    def configure(options) -> None:
+        enable_performance_log(options)
+
+    def install(self, driver) -> None:
+        driver.execute_cdp_cmd('Network.enable', {})
+
+    def _matches(self, response: Dict) -> bool:
+        url = response.get('url', '')
+        return 'json' in response.get('mimeType', '') and any(pattern in url for pattern in self.url_patterns)
+
+    def records_from_events(self, driver, events: List[Dict]) -> List[Dict]:
+        """Job records from the search responses among `events`, newest response last"""
+        records = []
+        seen_ids = set()
+
+        for event in events:
+            if event.get('method') != 'Network.responseReceived':
+                continue
+            params = event.get('params', {})
+            if not self._matches(params.get('response', {})):
+                continue
+
+            try:
+                body = driver.execute_cdp_cmd('Network.getResponseBody', {'requestId': params['requestId']})
+                text = body.get('body', '')
+                if body.get('base64Encoded'):
+                    text = base64.b64decode(text).decode('utf-8')
+                payload = json.loads(text)
+            except Exception as e:
+                self.logger.debug(f"Could not read search response body: {str(e)}")
+                continue
+
+            jobs = find_job_list(payload)
+            if not jobs:
+                continue
+
+            self.responses_captured += 1
+            for item in jobs:
+                record = job_record(item)
+                if record['job_id'] not in seen_ids:
+                    seen_ids.add(record['job_id'])
+                    records.append(record)
+
+        return records
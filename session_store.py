@@ -0,0 +1,153 @@
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+from file_utils import atomic_write_json
+
+# All of localStorage for the current origin as a plain object
+LOCAL_STORAGE_READ_SCRIPT = r"""
+const items = {};
+for (let i = 0; i < window.localStorage.length; i++) {
+    const key = window.localStorage.key(i);
+    items[key] = window.localStorage.getItem(key);
+}
+return items;
+"""
+
+LOCAL_STORAGE_WRITE_SCRIPT = r"""
+const items = arguments[0];
+for (const key of Object.keys(items)) {
+    window.localStorage.setItem(key, items[key]);
+}
+"""
+
+# One authenticated fetch; logged-out sessions end up redirected to a login page
+SESSION_CHECK_SCRIPT = r"""
+const done = arguments[arguments.length - 1];
+fetch(arguments[0], {credentials: 'include', cache: 'no-store'})
+    .then(response => done({
+        ok: response.ok,
+        url: response.url
+    }))
+    .catch(error => done({ok: false, url: '', error: String(error)}));
+"""
+
+COOKIE_FIELDS = ('name', 'value', 'path', 'domain', 'secure', 'httpOnly', 'expiry', 'sameSite')
+
+
+class SessionStore:
+    """Saves a logged-in browser session (cookies and localStorage) and restores it on the next start
+
+    The session file holds authentication cookies, so it is written with owner-only
+    permissions. restore() only puts the saved state into the browser; is_valid()
+    checks it with a single request before the bot relies on it.
+    """
+
+    def __init__(self, path: Path, origin: str = "https://www.dice.com",
+                 check_url: str = "https://www.dice.com/dashboard", max_age_hours: float = 24):
+        self.path = Path(path)
+        self.origin = origin
+        self.check_url = check_url
+        self.max_age_seconds = max_age_hours * 3600
+        self.logger = logging.getLogger(__name__)
+
+    def save(self, driver) -> bool:
+        """Save the current cookies and the origin's localStorage"""
+        try:
+            session = {
+                'saved_at': time.time(),
+                'origin': self.origin,
+                'cookies': driver.get_cookies(),
+                'local_storage': {}
+            }
+            if driver.current_url.startswith(self.origin):
+                session['local_storage'] = driver.execute_script(LOCAL_STORAGE_READ_SCRIPT) or {}
+
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_json(self.path, session)
+            os.chmod(self.path, 0o600)
+            self.logger.info(f"Saved session with {len(session['cookies'])} cookies to {self.path}")
+            return True
+        except Exception as e:
+            self.logger.warning(f"Could not save session: {str(e)}")
+            return False
+
+    def _load(self) -> Optional[dict]:
+        if not self.path.exists():
+            return None
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                session = json.load(f)
+        except Exception as e:
+            self.logger.warning(f"Could not read saved session: {str(e)}")
+            return None
+
+        age = time.time() - session.get('saved_at', 0)
+        if age > self.max_age_seconds:
+            self.logger.info(f"Saved session is {age / 3600:.1f} hours old, not reusing it")
+            return None
+        return session
+
+    def restore(self, driver) -> bool:
+        """Load the saved cookies and localStorage into the browser; False if there is nothing usable"""
+        session = self._load()
+        if not session:
+            return False
+
+        try:
+            # Cookies and localStorage can only be set for the page's own origin;
+            # robots.txt is the cheapest page there
+            driver.get(f"{self.origin}/robots.txt")
+
+            now = time.time()
+            restored = 0
+            for cookie in session.get('cookies', []):
+                if cookie.get('expiry') and cookie['expiry'] < now:
+                    continue
+                cookie = {key: cookie[key] for key in COOKIE_FIELDS if key in cookie}
+                if 'expiry' in cookie:
+                    cookie['expiry'] = int(cookie['expiry'])
+                try:
+                    driver.add_cookie(cookie)
+                    restored += 1
+                except Exception as e:
+                    self.logger.debug(f"Skipped cookie {cookie.get('name')}: {str(e)}")
+
+            if session.get('local_storage'):
+                driver.execute_script(LOCAL_STORAGE_WRITE_SCRIPT, session['local_storage'])
+
+            self.logger.info(f"Restored {restored} cookies from saved session")
+            return restored > 0
+        except Exception as e:
+            self.logger.warning(f"Could not restore saved session: {str(e)}")
+            return False
+
+    def is_valid(self, driver, timeout: float = 10) -> bool:
+        """Check the restored session with one request to a page that requires login"""
+        try:
+            driver.set_script_timeout(timeout)
+            result = driver.execute_async_script(SESSION_CHECK_SCRIPT, self.check_url) or {}
+        except Exception as e:
+            self.logger.warning(f"Session check failed: {str(e)}")
+            return False
+
+        if result.get('error'):
+            self.logger.warning(f"Session check failed: {result['error']}")
+        return bool(result.get('ok')) and 'login' not in result.get('url', '').lower()
+
+    def clear(self, driver=None) -> None:
+        """Forget the saved session, and drop its state from the browser if given"""
+        try:
+            self.path.unlink()
+        except FileNotFoundError:
+            pass
+
+        if driver:
+            try:
+                driver.delete_all_cookies()
+                driver.execute_script("window.localStorage.clear()")
+            except Exception as e:
+                self.logger.debug(f"Could not clear browser session state: {str(e)}")
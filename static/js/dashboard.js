@@ -1,7 +1,14 @@
 // Common utility functions and global behavior
 
+// Set by pages that receive status over /api/stream, so the navbar doesn't poll as well
+window.liveStatusStream = false;
+
 // Update global status indicator in navbar
 function updateGlobalStatus() {
+    if (window.liveStatusStream) {
+        return;
+    }
+
     fetch('/api/status')
         .then(response => response.json())
         .then(data => {
@@ -1,20 +1,46 @@
+import atexit
+import copy
 import json
+import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Optional, Dict, Any
 
+from event_bus import event_bus
+from file_utils import atomic_write_json
+
 class StatusManager:
     """
     Manages bot status for dashboard integration
+    
+    The bot's own applications are recorded once by ApplicationTracker and shown
+    on the dashboard through ApplicationsProjection; track_application() is for
+    integrations without a tracker.
+    
+    With `flush_interval_ms` set, status and tracking data are kept in memory and
+    changes are written at most once per interval; set_status() writes at once.
+    Files are always replaced atomically, so other processes never read a partial one.
     """
     
-    def __init__(self, data_dir='data'):
+    def __init__(self, data_dir='data', flush_interval_ms: Optional[int] = None):
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(exist_ok=True)
         
         self.status_file = self.data_dir / 'bot_status.json'
         self.tracking_file = self.data_dir / 'applications_tracking.json'
         
+        # Read-modify-write updates are serialized so pool workers can share one manager
+        self._lock = threading.RLock()
+        
+        # Buffered mode: in-memory copies of the files and which of them still need writing
+        self.flush_interval = (flush_interval_ms or 0) / 1000
+        self._cache: Dict[Path, Dict[str, Any]] = {}
+        self._signatures: Dict[Path, Optional[tuple]] = {}
+        self._dirty = set()
+        self._flush_timer = None
+        if self.flush_interval:
+            atexit.register(self.flush)
+        
         # Initialize status file if it doesn't exist
         if not self.status_file.exists():
             self._initialize_status()
@@ -22,6 +48,7 @@ class StatusManager:
         # Initialize tracking file if it doesn't exist
         if not self.tracking_file.exists():
             self._initialize_tracking()
+        self.flush()
     
     def _initialize_status(self):
         """Initialize status file with default values"""
@@ -41,37 +68,92 @@ class StatusManager:
         """Initialize tracking file"""
         self._write_tracking({})
     
+    @staticmethod
+    def _signature(path: Path) -> Optional[tuple]:
+        try:
+            stat = path.stat()
+            return (stat.st_mtime_ns, stat.st_size)
+        except OSError:
+            return None
+    
+    def _read_json(self, path: Path) -> Dict[str, Any]:
+        """Read a data file, from memory in buffered mode
+        
+        The memory copy is dropped when another writer (the dashboard process)
+        replaced the file since it was read or flushed; that write is newer.
+        """
+        with self._lock:
+            if path in self._cache and self._signature(path) == self._signatures.get(path):
+                return self._cache[path]
+            
+            with open(path, 'r') as f:
+                data = json.load(f)
+            if self.flush_interval:
+                self._cache[path] = data
+                self._signatures[path] = self._signature(path)
+                self._dirty.discard(path)
+            return data
+    
+    def _write_json(self, path: Path, data: Dict[str, Any]):
+        """Write a data file now, or in buffered mode on the next flush"""
+        with self._lock:
+            if not self.flush_interval:
+                atomic_write_json(path, data, indent=2)
+                return
+            
+            self._cache[path] = data
+            self._dirty.add(path)
+            if self._flush_timer is None:
+                self._flush_timer = threading.Timer(self.flush_interval, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+    
+    def flush(self):
+        """Write buffered changes to disk"""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            
+            for path in list(self._dirty):
+                try:
+                    atomic_write_json(path, self._cache[path], indent=2)
+                    self._signatures[path] = self._signature(path)
+                    self._dirty.discard(path)
+                except Exception as e:
+                    print(f"Error writing {path.name}: {e}")
+    
     def _read_status(self) -> Dict[str, Any]:
-        """Read current status from file"""
+        """Read current status"""
         try:
-            with open(self.status_file, 'r') as f:
-                return json.load(f)
+            return self._read_json(self.status_file)
         except Exception as e:
             print(f"Error reading status: {e}")
             return {}
     
     def _write_status(self, status: Dict[str, Any]):
-        """Write status to file"""
+        """Write status"""
         try:
-            with open(self.status_file, 'w') as f:
-                json.dump(status, f, indent=2)
+            self._write_json(self.status_file, status)
         except Exception as e:
             print(f"Error writing status: {e}")
+            return
+        
+        # Push the change to dashboard streams
+        event_bus.publish('status', copy.deepcopy(status))
     
     def _read_tracking(self) -> Dict[str, Any]:
-        """Read tracking data from file"""
+        """Read tracking data"""
         try:
-            with open(self.tracking_file, 'r') as f:
-                return json.load(f)
+            return self._read_json(self.tracking_file)
         except Exception as e:
             print(f"Error reading tracking data: {e}")
             return {}
     
     def _write_tracking(self, tracking: Dict[str, Any]):
-        """Write tracking data to file"""
+        """Write tracking data"""
         try:
-            with open(self.tracking_file, 'w') as f:
-                json.dump(tracking, f, indent=2)
+            self._write_json(self.tracking_file, tracking)
         except Exception as e:
             print(f"Error writing tracking data: {e}")
     
@@ -82,20 +164,24 @@ class StatusManager:
         Args:
             status: One of 'idle', 'running', 'paused', 'error'
         """
-        current = self._read_status()
-        current['status'] = status
-        current['last_updated'] = datetime.now().isoformat()
-        
-        # Set uptime start when starting
-        if status == 'running' and not current.get('uptime_start'):
-            current['uptime_start'] = datetime.now().isoformat()
-        
-        # Clear uptime when stopping
-        if status == 'idle':
-            current['uptime_start'] = None
-            current['current_job'] = None
-        
-        self._write_status(current)
+        with self._lock:
+            current = self._read_status()
+            current['status'] = status
+            current['last_updated'] = datetime.now().isoformat()
+            
+            # Set uptime start when starting
+            if status == 'running' and not current.get('uptime_start'):
+                current['uptime_start'] = datetime.now().isoformat()
+            
+            # Clear uptime when stopping
+            if status == 'idle':
+                current['uptime_start'] = None
+                current['current_job'] = None
+            
+            self._write_status(current)
+            
+            # Status changes are rare and watched by the dashboard, so they are not held back
+            self.flush()
     
     def set_current_job(self, job_info: Optional[str]):
         """
@@ -104,10 +190,11 @@ class StatusManager:
         Args:
             job_info: String describing the current job or None
         """
-        current = self._read_status()
-        current['current_job'] = job_info
-        current['last_updated'] = datetime.now().isoformat()
-        self._write_status(current)
+        with self._lock:
+            current = self._read_status()
+            current['current_job'] = job_info
+            current['last_updated'] = datetime.now().isoformat()
+            self._write_status(current)
     
     def add_error(self, error_message: str, max_errors: int = 10):
         """
@@ -117,26 +204,28 @@ class StatusManager:
             error_message: The error message
             max_errors: Maximum number of errors to keep
         """
-        current = self._read_status()
-        errors = current.get('errors', [])
-        
-        # Add new error with timestamp
-        errors.insert(0, {
-            'message': error_message,
-            'timestamp': datetime.now().isoformat()
-        })
-        
-        # Keep only the latest errors
-        current['errors'] = errors[:max_errors]
-        current['last_updated'] = datetime.now().isoformat()
-        self._write_status(current)
+        with self._lock:
+            current = self._read_status()
+            errors = current.get('errors', [])
+            
+            # Add new error with timestamp
+            errors.insert(0, {
+                'message': error_message,
+                'timestamp': datetime.now().isoformat()
+            })
+            
+            # Keep only the latest errors
+            current['errors'] = errors[:max_errors]
+            current['last_updated'] = datetime.now().isoformat()
+            self._write_status(current)
     
     def clear_errors(self):
         """Clear all errors"""
-        current = self._read_status()
-        current['errors'] = []
-        current['last_updated'] = datetime.now().isoformat()
-        self._write_status(current)
+        with self._lock:
+            current = self._read_status()
+            current['errors'] = []
+            current['last_updated'] = datetime.now().isoformat()
+            self._write_status(current)
     
     def track_application(self, job_id: str, job_data: Dict[str, Any]):
         """
@@ -148,18 +237,19 @@ class StatusManager:
                 Required keys: company, position, status
                 Optional keys: job_url, location, applied_date, error, notes
         """
-        tracking = self._read_tracking()
-        
-        # Add timestamp if not provided
-        if 'timestamp' not in job_data:
-            job_data['timestamp'] = datetime.now().isoformat()
-        
-        # Store the application
-        tracking[job_id] = job_data
-        self._write_tracking(tracking)
-        
-        # Update status counts
-        self._update_counts()
+        with self._lock:
+            tracking = self._read_tracking()
+            
+            # Add timestamp if not provided
+            if 'timestamp' not in job_data:
+                job_data['timestamp'] = datetime.now().isoformat()
+            
+            # Store the application
+            tracking[job_id] = job_data
+            self._write_tracking(tracking)
+            
+            # Update status counts
+            self._update_counts()
     
     def _update_counts(self):
         """Update application counts in status"""
@@ -179,16 +269,18 @@ class StatusManager:
     
     def get_status(self) -> Dict[str, Any]:
         """Get current bot status"""
-        return self._read_status()
+        with self._lock:
+            return copy.deepcopy(self._read_status())
     
     def get_tracking_data(self) -> Dict[str, Any]:
         """Get all tracking data"""
-        return self._read_tracking()
+        with self._lock:
+            return copy.deepcopy(self._read_tracking())
     
     def get_application(self, job_id: str) -> Optional[Dict[str, Any]]:
         """Get data for a specific application"""
-        tracking = self._read_tracking()
-        return tracking.get(job_id)
+        with self._lock:
+            return copy.deepcopy(self._read_tracking().get(job_id))
     
     def update_application_status(self, job_id: str, status: str, error: Optional[str] = None):
         """
@@ -199,26 +291,28 @@ class StatusManager:
             status: New status ('success', 'failed', 'pending')
             error: Error message if failed
         """
-        tracking = self._read_tracking()
-        
-        if job_id in tracking:
-            tracking[job_id]['status'] = status
-            tracking[job_id]['last_updated'] = datetime.now().isoformat()
-            
-            if error:
-                tracking[job_id]['error'] = error
+        with self._lock:
+            tracking = self._read_tracking()
             
-            self._write_tracking(tracking)
-            self._update_counts()
+            if job_id in tracking:
+                tracking[job_id]['status'] = status
+                tracking[job_id]['last_updated'] = datetime.now().isoformat()
+                
+                if error:
+                    tracking[job_id]['error'] = error
+                
+                self._write_tracking(tracking)
+                self._update_counts()
     
     def clear_tracking(self):
         """Clear all tracking data (use with caution!)"""
-        self._write_tracking({})
-        self._update_counts()
+        with self._lock:
+            self._write_tracking({})
+            self._update_counts()
     
     def get_statistics(self) -> Dict[str, Any]:
         """Get application statistics"""
-        tracking = self._read_tracking()
+        tracking = self.get_tracking_data()
         
         stats = {
             'total': len(tracking),
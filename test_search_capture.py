@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""Tests for reading job records from Dice search API responses"""
+
+from search_capture import fill_unknown_flags, has_unknown_flags, job_record
+
+
+def test_missing_flags_are_unknown():
+    record = job_record({'guid': 'abc', 'title': 'Python Developer', 'companyName': 'Acme'})
+
+    assert record['easy_apply'] is None
+    assert record['applied'] is None
+    assert has_unknown_flags([record])
+
+
+def test_present_flags_are_kept():
+    record = job_record({'guid': 'abc', 'title': 'Python Developer', 'easyApply': False, 'isApplied': True})
+
+    assert record['easy_apply'] is False
+    assert record['applied'] is True
+    assert not has_unknown_flags([record])
+
+
+def test_unknown_flags_are_filled_from_cards():
+    records = [
+        job_record({'guid': 'abc', 'title': 'Python Developer'}),
+        job_record({'guid': 'def', 'title': 'Data Engineer', 'easyApply': True}),
+        job_record({'guid': 'ghi', 'title': 'QA Engineer'})
+    ]
+    cards = [
+        {'job_id': 'abc', 'easy_apply': True, 'applied': True},
+        {'job_id': 'def', 'easy_apply': False, 'applied': False}
+    ]
+
+    fill_unknown_flags(records, cards)
+
+    assert (records[0]['easy_apply'], records[0]['applied']) == (True, True)
+    # The response's own value wins over the card's
+    assert (records[1]['easy_apply'], records[1]['applied']) == (True, False)
+    # No card on the page: still unknown
+    assert (records[2]['easy_apply'], records[2]['applied']) == (None, None)
@@ -0,0 +1,854 @@
+import atexit
+import copy
+import csv
+import io
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Set, Tuple
+
+from file_utils import FileLock, atomic_write_json
+
+# Column order of applications.csv, shared by every backend
+APPLICATION_FIELDS = [
+    'job_id',
+    'title',
+    'company',
+    'location',
+    'applied_date',
+    'resume_file',
+    'cover_letter_file',
+    'status',
+    'notes'
+]
+
+# First read size when reading applications.csv backwards; doubled on each further read
+TAIL_CHUNK_SIZE = 16 * 1024
+
+
+def empty_statistics() -> Dict:
+    """Statistics structure returned by every backend's get_stats()"""
+    return {
+        'total_jobs_found': 0,
+        'total_applications': 0,
+        'successful_applications': 0,
+        'failed_applications': 0,
+        'skipped_applications': 0,
+        'daily_stats': {},
+        'last_updated': ''
+    }
+
+
+def empty_daily_stats() -> Dict:
+    return {
+        'jobs_found': 0,
+        'applications': 0,
+        'successful': 0,
+        'failed': 0,
+        'skipped': 0
+    }
+
+
+
+def _first_record_start(buffer: bytes) -> int:
+    """Offset just past the first newline in `buffer` that ends a CSV record
+
+    The buffer runs to the end of the file, which is outside any quoted field, so
+    a newline ends a record when an even number of quotes follows it.
+    """
+    quotes_after = buffer.count(b'"')
+    searched = 0
+    newline = buffer.find(b'\n')
+    while newline != -1:
+        quotes_after -= buffer.count(b'"', searched, newline)
+        if quotes_after % 2 == 0:
+            return newline + 1
+        searched = newline
+        newline = buffer.find(b'\n', newline + 1)
+    return len(buffer)
+
+
+def _last_record_end(buffer: bytes) -> int:
+    """Offset just past the last newline in `buffer` that ends a CSV record
+
+    The buffer starts at a record boundary, so a newline ends a record when an even
+    number of quotes comes before it. A record still being written is left out.
+    """
+    end = 0
+    quotes_before = 0
+    searched = 0
+    newline = buffer.find(b'\n')
+    while newline != -1:
+        quotes_before += buffer.count(b'"', searched, newline)
+        if quotes_before % 2 == 0:
+            end = newline + 1
+        searched = newline
+        newline = buffer.find(b'\n', newline + 1)
+    return end
+
+
+def read_application_rows(tracking_file: Path, cursor: Optional[Tuple[int, int]] = None
+                          ) -> Tuple[List[Dict], Optional[Tuple[int, int]], bool]:
+    """Read the applications.csv rows appended since `cursor`, without taking any lock
+
+    Returns the rows, the cursor to pass next time and whether the rows replace
+    everything read before: true without a cursor, or when the file was replaced
+    or rewritten shorter (clean_duplicates) since the cursor was taken.
+    """
+    if not tracking_file.exists():
+        return [], None, True
+
+    with open(tracking_file, 'rb') as f:
+        stat = os.fstat(f.fileno())
+        header = f.readline().decode('utf-8')
+        fieldnames = next(csv.reader([header]), APPLICATION_FIELDS)
+
+        reset = not cursor or cursor[0] != stat.st_ino or cursor[1] > stat.st_size
+        if not reset:
+            f.seek(cursor[1])
+        start = f.tell()
+        data = f.read()
+
+    end = _last_record_end(data)
+    text = data[:end].decode('utf-8', errors='replace')
+    rows = [dict(row) for row in csv.DictReader(io.StringIO(text, newline=''), fieldnames=fieldnames)]
+    return rows, (stat.st_ino, start + end), reset
+
+
+class TrackerStorage:
+    """Interface implemented by ApplicationTracker storage backends"""
+
+    def add_application(self, record: Dict) -> None:
+        """Persist one application row (keys are APPLICATION_FIELDS)"""
+        raise NotImplementedError
+
+    def has_job_id(self, job_id: str) -> bool:
+        """Check whether a job ID has already been tracked"""
+        raise NotImplementedError
+
+    def get_job_ids(self) -> Set[str]:
+        """Get every tracked job ID"""
+        raise NotImplementedError
+
+    def increment_jobs_found(self) -> None:
+        """Count one job found today"""
+        raise NotImplementedError
+
+    def get_stats(self) -> Dict:
+        """Get totals and per-day statistics in the empty_statistics() layout"""
+        raise NotImplementedError
+
+    def get_recent_applications(self, limit: int) -> List[Dict]:
+        """Get up to `limit` of the most recent application rows, newest first"""
+        raise NotImplementedError
+
+    def iter_applications(self) -> Iterator[Dict]:
+        """Iterate over every application row"""
+        raise NotImplementedError
+
+    def clean_duplicates(self) -> int:
+        """Remove duplicate job IDs and return how many rows were dropped"""
+        raise NotImplementedError
+
+
+class StatisticsStore:
+    """In-memory tracker statistics backed by statistics.json and an append-only delta journal.
+
+    Events update the counters in memory and are appended to the journal in batches,
+    every `flush_every` events or `flush_interval` seconds, whichever comes first.
+    On startup the journal is replayed onto statistics.json, which is then rewritten
+    atomically and the journal emptied.
+    """
+
+    def __init__(self, stats_file: Path, journal_file: Path,
+                 flush_every: int = 20, flush_interval: float = 30.0):
+        self.stats_file = stats_file
+        self.journal_file = journal_file
+        self.flush_every = max(1, flush_every)
+        self.flush_interval = flush_interval
+        self.lock = FileLock(journal_file.with_suffix('.lock'))
+
+        self._pending = []
+        self._pending_lock = threading.Lock()
+        self._timer = None
+
+        self.stats = self._load_and_compact()
+        atexit.register(self.flush)
+
+    @classmethod
+    def read(cls, stats_file: Path, journal_file: Path) -> Tuple[Dict, int]:
+        """Statistics with the journal replayed onto the snapshot, and how many deltas were replayed
+
+        Writes nothing, so other backends can import the files as they are.
+        """
+        stats = empty_statistics()
+        if stats_file.exists():
+            try:
+                with open(stats_file, 'r') as f:
+                    stats.update(json.load(f))
+            except Exception as e:
+                print(f"Error loading statistics: {str(e)}")
+
+        replayed = 0
+        if journal_file.exists():
+            with open(journal_file, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        cls._apply(stats, json.loads(line))
+                        replayed += 1
+                    except ValueError:
+                        # Partial last line from a crash mid-write
+                        continue
+        return stats, replayed
+
+    def _load_and_compact(self) -> Dict:
+        """Replay the journal onto the snapshot and persist the result"""
+        with self.lock:
+            stats, replayed = self.read(self.stats_file, self.journal_file)
+
+            if replayed or not self.stats_file.exists():
+                if not stats['last_updated']:
+                    stats['last_updated'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                atomic_write_json(self.stats_file, stats, indent=2)
+            if self.journal_file.exists():
+                with open(self.journal_file, 'w'):
+                    pass
+
+        return stats
+
+    @staticmethod
+    def _apply(stats: Dict, delta: Dict) -> None:
+        """Apply one journal delta to a statistics dict"""
+        event = delta['event']
+        day = stats['daily_stats'].setdefault(delta['date'], empty_daily_stats())
+
+        if event == 'jobs_found':
+            stats['total_jobs_found'] += 1
+            day['jobs_found'] += 1
+        else:
+            stats['total_applications'] += 1
+            day['applications'] += 1
+            if event == 'success':
+                stats['successful_applications'] += 1
+                day['successful'] += 1
+            elif event == 'failed':
+                stats['failed_applications'] += 1
+                day['failed'] += 1
+            elif event == 'skipped':
+                stats['skipped_applications'] += 1
+                day['skipped'] += 1
+
+        stats['last_updated'] = delta['time']
+
+    def record(self, event: str) -> None:
+        """Count an application status or 'jobs_found' event"""
+        now = datetime.now()
+        delta = {
+            'date': now.strftime("%Y-%m-%d"),
+            'event': event,
+            'time': now.strftime("%Y-%m-%d %H:%M:%S")
+        }
+
+        with self._pending_lock:
+            self._apply(self.stats, delta)
+            self._pending.append(delta)
+            flush_now = len(self._pending) >= self.flush_every
+            if not flush_now and self._timer is None:
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if flush_now:
+            self.flush()
+
+    def flush(self) -> None:
+        """Append buffered deltas to the journal"""
+        with self._pending_lock:
+            pending, self._pending = self._pending, []
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+        if not pending:
+            return
+
+        try:
+            with self.lock:
+                with open(self.journal_file, 'a', encoding='utf-8') as f:
+                    f.write(''.join(json.dumps(delta) + '\n' for delta in pending))
+        except Exception as e:
+            print(f"Error writing statistics journal: {str(e)}")
+            # Keep the deltas so the next flush retries them
+            with self._pending_lock:
+                self._pending = pending + self._pending
+
+    def snapshot(self) -> Dict:
+        """Get a copy of the current statistics"""
+        with self._pending_lock:
+            return copy.deepcopy(self.stats)
+
+
+class JobIdStore:
+    """Tracked job IDs persisted as a job_ids.json snapshot plus an append-only journal.
+
+    Each new ID costs one appended journal line. Once the journal passes
+    `compact_every` lines it is folded into the snapshot on a background thread:
+    the journal is renamed aside first, so new IDs keep going to a fresh one while
+    the snapshot is rewritten. Loading reads the snapshot and any journals, then
+    compacts them the same way in the foreground.
+    """
+
+    def __init__(self, snapshot_file: Path, journal_file: Path, compact_every: int = 1000):
+        self.snapshot_file = snapshot_file
+        self.journal_file = journal_file
+        self.compacting_file = journal_file.with_name(journal_file.name + '.compacting')
+        self.compact_every = max(1, compact_every)
+
+        self.ids: Set[str] = set()
+        self._journal_lines = 0
+        self._compacting = False
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._snapshot_lock = threading.Lock()
+
+    @staticmethod
+    def _read_journal(path: Path) -> List[str]:
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return [line for line in f.read().split('\n') if line]
+        except FileNotFoundError:
+            return []
+
+    @classmethod
+    def read(cls, snapshot_file: Path, journal_file: Path) -> Tuple[Set[str], bool]:
+        """Every stored ID, and whether any came from a journal; writes nothing"""
+        ids = set()
+        if snapshot_file.exists():
+            with open(snapshot_file, 'r') as f:
+                ids.update(json.load(f))
+
+        compacting_file = journal_file.with_name(journal_file.name + '.compacting')
+        journaled = cls._read_journal(compacting_file) + cls._read_journal(journal_file)
+        ids.update(journaled)
+        return ids, bool(journaled)
+
+    def load(self) -> Set[str]:
+        """Read the snapshot and journals, then fold the journals into the snapshot"""
+        ids, journaled = self.read(self.snapshot_file, self.journal_file)
+
+        if journaled:
+            self.replace(ids)
+        else:
+            self.ids = ids
+        return self.ids
+
+    def replace(self, ids: Set[str]) -> None:
+        """Make `ids` the complete set: rewrite the snapshot and empty the journals"""
+        with self._lock:
+            self._generation += 1
+            self.ids = set(ids)
+            self._journal_lines = 0
+            with self._snapshot_lock:
+                atomic_write_json(self.snapshot_file, list(self.ids))
+                for path in (self.compacting_file, self.journal_file):
+                    try:
+                        path.unlink()
+                    except FileNotFoundError:
+                        pass
+
+    def add(self, job_id: str) -> None:
+        """Record a new job ID with one journal line"""
+        with self._lock:
+            if job_id in self.ids:
+                return
+            with open(self.journal_file, 'a', encoding='utf-8') as f:
+                f.write(job_id + '\n')
+            self.ids.add(job_id)
+            self._journal_lines += 1
+            if self._journal_lines < self.compact_every or self._compacting:
+                return
+
+            # Move the journal aside and snapshot the IDs it covers
+            self._compacting = True
+            self._journal_lines = 0
+            os.replace(self.journal_file, self.compacting_file)
+            generation = self._generation
+            snapshot = list(self.ids)
+
+        threading.Thread(
+            target=self._write_snapshot, args=(snapshot, generation), name='job-id-compaction', daemon=True
+        ).start()
+
+    def _write_snapshot(self, snapshot: List[str], generation: int) -> None:
+        try:
+            with self._snapshot_lock:
+                # A replace() since the journal was moved aside already wrote a newer snapshot
+                if generation == self._generation:
+                    atomic_write_json(self.snapshot_file, snapshot)
+                    self.compacting_file.unlink()
+        except Exception as e:
+            print(f"Error compacting job IDs journal: {str(e)}")
+        finally:
+            with self._lock:
+                self._compacting = False
+
+
+class CsvTrackerStorage(TrackerStorage):
+    """Original file layout: applications.csv, statistics.json and a job_ids.json index
+
+    job_ids.json and job_ids.journal (see JobIdStore) hold every job ID in
+    applications.csv, and job_ids.meta.json the CSV size and mtime they were saved
+    for. Lookups, misses included, are answered from the in-memory set; the index
+    is rebuilt from the CSV only when the CSV's size or mtime no longer match,
+    i.e. when something else changed the file.
+    """
+
+    def __init__(self, tracking_dir: Path, stats_flush_every: int = 20, stats_flush_interval: float = 30.0,
+                 job_ids_compact_every: int = 1000):
+        self.tracking_file = tracking_dir / 'applications.csv'
+        self.stats_file = tracking_dir / 'statistics.json'
+        self.job_ids_file = tracking_dir / 'job_ids.json'
+        self.job_ids_meta_file = tracking_dir / 'job_ids.meta.json'
+
+        tracking_dir.mkdir(parents=True, exist_ok=True)
+
+        # Initialize tracking file
+        if not self.tracking_file.exists():
+            with open(self.tracking_file, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(APPLICATION_FIELDS)
+
+        # Statistics are kept in memory and journaled instead of rewritten per event
+        self.statistics = StatisticsStore(
+            self.stats_file,
+            tracking_dir / 'statistics.journal',
+            flush_every=stats_flush_every,
+            flush_interval=stats_flush_interval
+        )
+
+        # Pool workers share one storage; appends and job ID index writes are serialized
+        self._lock = threading.RLock()
+
+        # Load the job IDs index, or build it from the tracking file if it's missing or stale
+        self.job_ids = JobIdStore(self.job_ids_file, tracking_dir / 'job_ids.journal', job_ids_compact_every)
+        self._indexed_signature = None
+        self._load_job_ids_index()
+
+    @property
+    def applied_job_ids(self) -> Set[str]:
+        return self.job_ids.ids
+
+    def _csv_signature(self) -> Optional[List[int]]:
+        """Size and mtime of the tracking file, identifying the version an index was built from"""
+        try:
+            stat = self.tracking_file.stat()
+        except FileNotFoundError:
+            return None
+        return [stat.st_size, stat.st_mtime_ns]
+
+    def _load_job_ids_index(self):
+        """Load job_ids.json if it was saved for the current tracking file, otherwise rebuild it"""
+        try:
+            with open(self.job_ids_meta_file, 'r') as f:
+                saved_signature = json.load(f).get('csv_signature')
+            if saved_signature and saved_signature == self._csv_signature():
+                self.job_ids.load()
+                self._indexed_signature = saved_signature
+                return
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading job IDs cache: {str(e)}")
+
+        self._rebuild_job_ids_cache()
+
+    def _save_signature(self):
+        """Record the tracking file signature the saved job IDs match"""
+        signature = self._csv_signature()
+        try:
+            atomic_write_json(self.job_ids_meta_file, {'csv_signature': signature})
+        except Exception as e:
+            print(f"Error updating job IDs cache: {str(e)}")
+        self._indexed_signature = signature
+
+    def _rebuild_job_ids_cache(self):
+        """Rebuild the job IDs index from the tracking file"""
+        try:
+            job_ids = set()
+            with open(self.tracking_file, 'r', newline='') as f:
+                reader = csv.reader(f)
+                next(reader, None)  # Skip header
+                for row in reader:
+                    if row and row[0]:  # job_id is in first column
+                        job_ids.add(row[0])
+
+            # Save the rebuilt index
+            self.job_ids.replace(job_ids)
+            self._save_signature()
+
+            print(f"Rebuilt job IDs cache with {len(self.applied_job_ids)} entries")
+        except Exception as e:
+            print(f"Error rebuilding job IDs cache: {str(e)}")
+
+    def add_application(self, record: Dict) -> None:
+        with self._lock:
+            job_id = record.get('job_id', '')
+            before = self._csv_signature()
+
+            # Add to tracking file
+            line = io.StringIO()
+            csv.writer(line).writerow([record.get(field, '') for field in APPLICATION_FIELDS])
+            with open(self.tracking_file, 'a', newline='') as f:
+                f.write(line.getvalue())
+                written = len(line.getvalue().encode(f.encoding))
+
+            # Update job IDs index (its signature has to follow the CSV even without a new ID)
+            if job_id:
+                try:
+                    self.job_ids.add(job_id)
+                except Exception as e:
+                    print(f"Error updating job IDs cache: {str(e)}")
+
+            # Only our row was added if the index was current and the file grew by exactly
+            # that row; otherwise another process appended too and the index is stale
+            after = self._csv_signature()
+            if before and before == self._indexed_signature and after and after[0] == before[0] + written:
+                self._save_signature()
+            else:
+                self._indexed_signature = None
+
+            # Update statistics
+            self.statistics.record(record.get('status', ''))
+
+    def has_job_id(self, job_id: str) -> bool:
+        with self._lock:
+            # The index is complete for the CSV it was built from; rebuild only if the CSV changed
+            if self._csv_signature() != self._indexed_signature:
+                self._rebuild_job_ids_cache()
+            return job_id in self.applied_job_ids
+
+    def get_job_ids(self) -> Set[str]:
+        return self.applied_job_ids
+
+    def get_stats(self) -> Dict:
+        return self.statistics.snapshot()
+
+    def get_recent_applications(self, limit: int) -> List[Dict]:
+        if limit <= 0 or not self.tracking_file.exists():
+            return []
+
+        # Rows are appended in order, so read whole records backwards from the end
+        # until there are `limit` of them or the header is reached
+        with open(self.tracking_file, 'rb') as f:
+            header = f.readline().decode('utf-8')
+            fieldnames = next(csv.reader([header]), APPLICATION_FIELDS)
+            data_start = f.tell()
+            position = f.seek(0, os.SEEK_END)
+
+            buffer = b''
+            chunk_size = TAIL_CHUNK_SIZE
+            while True:
+                read_from = max(data_start, position - chunk_size)
+                f.seek(read_from)
+                buffer = f.read(position - read_from) + buffer
+                position = read_from
+                chunk_size *= 2
+
+                start = 0 if position == data_start else _first_record_start(buffer)
+                text = buffer[start:].decode('utf-8', errors='replace')
+                rows = list(csv.DictReader(io.StringIO(text, newline=''), fieldnames=fieldnames))
+                if len(rows) >= limit or position == data_start:
+                    break
+
+        return [dict(row) for row in reversed(rows[-limit:])]
+
+    def iter_applications(self) -> Iterator[Dict]:
+        with open(self.tracking_file, 'r', newline='') as f:
+            reader = csv.DictReader(f)
+            for row in reader:
+                yield row
+
+    def increment_jobs_found(self) -> None:
+        self.statistics.record('jobs_found')
+
+    def clean_duplicates(self) -> int:
+        if not self.tracking_file.exists():
+            return 0
+
+        # Read all entries
+        entries = []
+        seen_job_ids = set()
+        duplicates = 0
+
+        with open(self.tracking_file, 'r', newline='') as f:
+            reader = csv.reader(f)
+            header = next(reader)
+
+            for row in reader:
+                if not row or not row[0]:  # Skip empty rows
+                    continue
+
+                job_id = row[0]
+                if job_id in seen_job_ids:
+                    duplicates += 1
+                    continue
+
+                seen_job_ids.add(job_id)
+                entries.append(row)
+
+        # Write back without duplicates
+        if duplicates > 0:
+            with open(self.tracking_file, 'w', newline='') as f:
+                writer = csv.writer(f)
+                writer.writerow(header)
+                writer.writerows(entries)
+
+            # Update job IDs index
+            with self._lock:
+                self.job_ids.replace(seen_job_ids)
+                self._save_signature()
+
+        return duplicates
+
+
+class SqliteTrackerStorage(TrackerStorage):
+    """SQLite backend: indexed job_id primary key, WAL journaling and aggregated stats views.
+
+    Applying to the same job again updates its row, so the job_id column stays a
+    primary key. Rows without a job ID are stored with a NULL key.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS applications (
+            job_id TEXT PRIMARY KEY,
+            title TEXT,
+            company TEXT,
+            location TEXT,
+            applied_date TEXT NOT NULL,
+            resume_file TEXT,
+            cover_letter_file TEXT,
+            status TEXT,
+            notes TEXT
+        );
+        CREATE INDEX IF NOT EXISTS idx_applications_applied_date ON applications(applied_date);
+
+        -- IDs known from job_ids.json that have no application row
+        CREATE TABLE IF NOT EXISTS known_job_ids (
+            job_id TEXT PRIMARY KEY
+        );
+
+        CREATE TABLE IF NOT EXISTS jobs_found (
+            date TEXT PRIMARY KEY,
+            count INTEGER NOT NULL DEFAULT 0
+        );
+
+        -- Markers such as the completed import of the CSV/JSON history
+        CREATE TABLE IF NOT EXISTS meta (
+            key TEXT PRIMARY KEY,
+            value TEXT
+        );
+
+        CREATE VIEW IF NOT EXISTS daily_application_stats AS
+            SELECT substr(applied_date, 1, 10) AS date,
+                   COUNT(*) AS applications,
+                   SUM(status = 'success') AS successful,
+                   SUM(status = 'failed') AS failed,
+                   SUM(status = 'skipped') AS skipped
+            FROM applications
+            GROUP BY substr(applied_date, 1, 10);
+
+        CREATE VIEW IF NOT EXISTS application_totals AS
+            SELECT COUNT(*) AS total_applications,
+                   COALESCE(SUM(status = 'success'), 0) AS successful_applications,
+                   COALESCE(SUM(status = 'failed'), 0) AS failed_applications,
+                   COALESCE(SUM(status = 'skipped'), 0) AS skipped_applications,
+                   MAX(applied_date) AS last_application
+            FROM applications;
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        # One connection shared by the bot's threads, serialized with a lock
+        self._lock = threading.RLock()
+        self.conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self.conn.row_factory = sqlite3.Row
+        with self._lock:
+            self.conn.execute("PRAGMA journal_mode=WAL")
+            self.conn.execute("PRAGMA synchronous=NORMAL")
+            self.conn.executescript(self.SCHEMA)
+            self.conn.commit()
+
+        # First start on SQLite: bring over the existing CSV/JSON history (retried until it completes)
+        if not self._import_done():
+            imported = self.import_from_files(self.db_path.parent)
+            if imported:
+                print(f"Imported {imported} applications into {self.db_path.name}")
+
+    IMPORT_DONE_KEY = 'imported_from_files'
+
+    def _import_done(self) -> bool:
+        with self._lock:
+            if self.conn.execute("SELECT 1 FROM meta WHERE key = ?", (self.IMPORT_DONE_KEY,)).fetchone():
+                return True
+
+            # Databases from before the marker existed already hold their import
+            has_data = self.conn.execute(
+                "SELECT 1 FROM applications UNION ALL SELECT 1 FROM jobs_found LIMIT 1"
+            ).fetchone()
+            if has_data:
+                self._mark_import_done()
+                self.conn.commit()
+            return bool(has_data)
+
+    def _mark_import_done(self) -> None:
+        self.conn.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+            (self.IMPORT_DONE_KEY, datetime.now().isoformat())
+        )
+
+    @staticmethod
+    def _row_to_dict(row: sqlite3.Row) -> Dict:
+        record = {field: (row[field] if row[field] is not None else '') for field in APPLICATION_FIELDS}
+        return record
+
+    UPSERT_SQL = (
+        f"INSERT INTO applications ({', '.join(APPLICATION_FIELDS)}) "
+        f"VALUES ({', '.join('?' for _ in APPLICATION_FIELDS)}) "
+        f"ON CONFLICT(job_id) DO UPDATE SET "
+        f"{', '.join(f'{field} = excluded.{field}' for field in APPLICATION_FIELDS[1:])}"
+    )
+
+    @staticmethod
+    def _record_values(record: Dict) -> List:
+        values = [record.get(field, '') or '' for field in APPLICATION_FIELDS]
+        values[0] = values[0] or None
+        return values
+
+    def add_application(self, record: Dict) -> None:
+        with self._lock:
+            self.conn.execute(self.UPSERT_SQL, self._record_values(record))
+            self.conn.commit()
+
+    def has_job_id(self, job_id: str) -> bool:
+        with self._lock:
+            row = self.conn.execute(
+                """SELECT 1 FROM applications WHERE job_id = ?
+                   UNION ALL SELECT 1 FROM known_job_ids WHERE job_id = ?
+                   LIMIT 1""",
+                (job_id, job_id)
+            ).fetchone()
+        return row is not None
+
+    def get_job_ids(self) -> Set[str]:
+        with self._lock:
+            rows = self.conn.execute(
+                """SELECT job_id FROM applications WHERE job_id IS NOT NULL
+                   UNION SELECT job_id FROM known_job_ids"""
+            ).fetchall()
+        return {row[0] for row in rows}
+
+    def increment_jobs_found(self) -> None:
+        today = datetime.now().strftime("%Y-%m-%d")
+        with self._lock:
+            self.conn.execute(
+                """INSERT INTO jobs_found (date, count) VALUES (?, 1)
+                   ON CONFLICT(date) DO UPDATE SET count = count + 1""",
+                (today,)
+            )
+            self.conn.commit()
+
+    def get_stats(self) -> Dict:
+        stats = empty_statistics()
+        with self._lock:
+            totals = self.conn.execute("SELECT * FROM application_totals").fetchone()
+            daily_rows = self.conn.execute("SELECT * FROM daily_application_stats").fetchall()
+            found_rows = self.conn.execute("SELECT date, count FROM jobs_found").fetchall()
+
+        for field in ('total_applications', 'successful_applications', 'failed_applications', 'skipped_applications'):
+            stats[field] = totals[field] or 0
+        stats['last_updated'] = totals['last_application'] or ''
+
+        for row in daily_rows:
+            day = stats['daily_stats'].setdefault(row['date'], empty_daily_stats())
+            day['applications'] = row['applications']
+            day['successful'] = row['successful'] or 0
+            day['failed'] = row['failed'] or 0
+            day['skipped'] = row['skipped'] or 0
+
+        for row in found_rows:
+            day = stats['daily_stats'].setdefault(row['date'], empty_daily_stats())
+            day['jobs_found'] = row['count']
+            stats['total_jobs_found'] += row['count']
+
+        return stats
+
+    def get_recent_applications(self, limit: int) -> List[Dict]:
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT * FROM applications ORDER BY applied_date DESC, rowid DESC LIMIT ?",
+                (limit,)
+            ).fetchall()
+        return [self._row_to_dict(row) for row in rows]
+
+    def iter_applications(self) -> Iterator[Dict]:
+        with self._lock:
+            rows = self.conn.execute("SELECT * FROM applications ORDER BY applied_date, rowid").fetchall()
+        for row in rows:
+            yield self._row_to_dict(row)
+
+    def clean_duplicates(self) -> int:
+        # The job_id primary key already prevents duplicates
+        return 0
+
+    def import_from_files(self, tracking_dir: Path) -> int:
+        """One-shot import of applications.csv and the statistics and job ID files
+
+        Statistics and job IDs are read with their journals replayed, as the CSV
+        backend would load them. The import is one transaction and is recorded in
+        the meta table only when it completes, so a failed import is retried on the
+        next start.
+
+        Returns:
+            int: Number of application rows imported
+        """
+        tracking_file = tracking_dir / 'applications.csv'
+        imported = 0
+
+        with self._lock:
+            try:
+                if tracking_file.exists():
+                    with open(tracking_file, 'r', newline='') as f:
+                        rows = [self._record_values(row) for row in csv.DictReader(f) if any(row.values())]
+                    self.conn.executemany(self.UPSERT_SQL, rows)
+                    imported = len(rows)
+
+                stats, _ = StatisticsStore.read(tracking_dir / 'statistics.json', tracking_dir / 'statistics.journal')
+                self.conn.executemany(
+                    "INSERT OR REPLACE INTO jobs_found (date, count) VALUES (?, ?)",
+                    [(date, day.get('jobs_found', 0)) for date, day in stats['daily_stats'].items()]
+                )
+
+                job_ids, _ = JobIdStore.read(tracking_dir / 'job_ids.json', tracking_dir / 'job_ids.journal')
+                self.conn.executemany(
+                    """INSERT OR IGNORE INTO known_job_ids (job_id)
+                       SELECT ? WHERE NOT EXISTS (SELECT 1 FROM applications WHERE job_id = ?)""",
+                    [(job_id, job_id) for job_id in job_ids if job_id]
+                )
+
+                self._mark_import_done()
+                self.conn.commit()
+            except Exception as e:
+                self.conn.rollback()
+                print(f"Error importing tracker files: {str(e)}")
+                return 0
+
+        return imported
+
+    def close(self) -> None:
+        with self._lock:
+            self.conn.close()
@@ -0,0 +1,80 @@
+import logging
+import queue
+import threading
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from file_utils import atomic_write_json
+
+
+class SharedRunState:
+    """State shared by the browser workers of one pool run
+
+    Titles are handed out through a single queue, job IDs are claimed before a
+    worker handles a job so two workers never apply to the same one, and title
+    progress is saved under one lock.
+    """
+
+    def __init__(self, titles: Iterable[str], processed_titles: Optional[Dict[str, int]] = None):
+        self.titles: queue.Queue = queue.Queue()
+        for title in titles:
+            self.titles.put(title)
+        self.processed_titles = processed_titles if processed_titles is not None else {}
+        self.stopped = threading.Event()
+        self._claimed_job_ids = set()
+        self._lock = threading.Lock()
+
+    def next_title(self) -> Optional[str]:
+        """Take the next job title to search, or None when the queue is empty or the run stopped"""
+        if self.stopped.is_set():
+            return None
+        try:
+            return self.titles.get_nowait()
+        except queue.Empty:
+            return None
+
+    def stop(self) -> None:
+        """Stop handing out titles; workers finish their current title"""
+        self.stopped.set()
+
+    def claim_job(self, job_id: str) -> bool:
+        """Claim a job for the calling worker; False if another worker already has it"""
+        with self._lock:
+            if job_id in self._claimed_job_ids:
+                return False
+            self._claimed_job_ids.add(job_id)
+            return True
+
+    def save_title_progress(self, tracking_file: Path, title: str, page: int) -> None:
+        """Record the last page processed for a title and save all titles' progress"""
+        with self._lock:
+            self.processed_titles[title] = page
+            tracking_file.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write_json(tracking_file, self.processed_titles)
+
+
+class BrowserWorkerPool:
+    """Runs each bot's run_worker() on its own thread, one browser per worker"""
+
+    def __init__(self, workers: List):
+        self.workers = workers
+        self.logger = logging.getLogger(__name__)
+
+    def _run(self, index: int, worker) -> None:
+        try:
+            worker.run_worker()
+        except Exception as e:
+            self.logger.error(f"Browser worker {index} stopped: {str(e)}")
+
+    def run(self) -> None:
+        """Start every worker and wait for all of them to finish"""
+        threads = [
+            threading.Thread(target=self._run, args=(i, worker), name=f"browser-{i}", daemon=True)
+            for i, worker in enumerate(self.workers, 1)
+        ]
+        for thread in threads:
+            thread.start()
+        self.logger.info(f"Started {len(threads)} browser workers")
+
+        for thread in threads:
+            thread.join()